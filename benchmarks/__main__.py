@@ -0,0 +1,124 @@
+"""Run the benchmark suite and compare it against a stored baseline.
+
+    python -m benchmarks                          # run, compare with benchmarks/baseline.json
+    python -m benchmarks --output results.json    # also save this run
+    python -m benchmarks --save-baseline          # record this run as the new baseline
+    python -m benchmarks -k board                 # only benchmarks whose name contains "board"
+    python -m benchmarks -k board --save-baseline # re-record just those entries
+
+Each benchmark reports the median of several repeats. Benchmarks slower than
+the baseline by more than the tolerance are measured again (--retries), and
+the run exits with status 1 if any of them is still that slow.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+from statistics import median
+from typing import Any, Dict, List
+from .core import BENCHMARKS, Benchmark
+
+BASELINE = Path(__file__).with_name("baseline.json")
+
+def measure(function: Benchmark, min_time: float, repeats: int) -> Dict[str, float]:
+    """Median time per operation over `repeats` runs, with iterations scaled to fill min_time
+
+    The median rather than the best run, so one lucky quiet run neither sets
+    a baseline the next run can't match nor hides a real slowdown.
+    """
+    iterations = 1
+    while True:
+        elapsed, ops = function(iterations)
+        if elapsed >= min_time or iterations >= 1 << 20:
+            break
+        iterations *= 2 if elapsed <= 0 else max(2, min(10, int(min_time / elapsed) + 1))
+
+    times = [elapsed / ops]
+    for _ in range(repeats - 1):
+        elapsed, ops = function(iterations)
+        times.append(elapsed / ops)
+    typical = median(times)
+    return {"ns_per_op": typical * 1e9, "ops_per_second": 1 / typical, "iterations": iterations}
+
+def run(names: List[str], min_time: float, repeats: int) -> Dict[str, Any]:
+    results = {}
+    for name in names:
+        results[name] = measure(BENCHMARKS[name], min_time, repeats)
+        print(f"{name:40} {results[name]['ns_per_op']:>14,.0f} ns/op "
+              f"{results[name]['ops_per_second']:>14,.0f} ops/s")
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Print the change against the baseline and return the regressed benchmark names"""
+    regressions = []
+    print(f"\nCompared with baseline from {baseline['meta']['timestamp']} "
+          f"(tolerance {tolerance:.0%}):")
+    for name, result in current["results"].items():
+        previous = baseline["results"].get(name)
+        if previous is None:
+            print(f"{name:40} new")
+            continue
+        change = result["ns_per_op"] / previous["ns_per_op"] - 1
+        flag = ""
+        if change > tolerance:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:40} {change:>+8.1%}{flag}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the core game hot paths")
+    parser.add_argument("-k", "--filter", default="", help="only run benchmarks containing this")
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per repeat")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="write this run's results as JSON")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="store this run as the baseline instead of comparing")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown before flagging a regression")
+    parser.add_argument("--retries", type=int, default=2,
+                        help="times a regressed benchmark is re-measured before it counts")
+    args = parser.parse_args()
+
+    names = [name for name in BENCHMARKS if args.filter in name]
+    current = run(names, args.min_time, args.repeats)
+
+    if args.save_baseline:
+        if args.filter and args.baseline.exists():
+            # Re-recording a subset keeps the other benchmarks' entries
+            baseline = json.loads(args.baseline.read_text())
+            baseline["results"].update(current["results"])
+            current = {"meta": current["meta"], "results": baseline["results"]}
+        args.baseline.write_text(json.dumps(current, indent=2) + "\n")
+        print(f"\nBaseline saved to {args.baseline}")
+        return
+    regressions = []
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare(current, baseline, args.tolerance)
+        # Noise here comes in bursts that can swamp every repeat of one benchmark;
+        # a real regression is still there when measured again
+        for _ in range(args.retries):
+            if not regressions:
+                break
+            print(f"\nMeasuring {len(regressions)} regressed benchmark(s) again:")
+            retry = run(regressions, args.min_time, args.repeats)
+            current["results"].update(retry["results"])
+            regressions = compare(retry, baseline, args.tolerance)
+    if args.output:
+        args.output.write_text(json.dumps(current, indent=2) + "\n")
+    if regressions:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
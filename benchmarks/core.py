@@ -0,0 +1,201 @@
+"""Benchmarks for the core game hot paths.
+
+Each benchmark takes an iteration count, does its own setup, and returns the
+seconds spent in the timed section together with the number of operations it
+performed there, so setup never pollutes the measurement.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+from functools import lru_cache
+from random import Random
+from time import perf_counter
+from typing import Callable, Dict, Tuple
+from src.constants import BOARD_SIZE, SHIPS
+from src.game.board import Board
+from src.game.corpus import LayoutCorpus, write_corpus
+from src.game.density import DensityAIPlayer
+from src.game.fleet import FleetSampler, place_random_fleet
+from src.game.player import AIPlayer
+from src.game.ship import Ship
+from src.game.simulation import play_game
+
+Benchmark = Callable[[int], Tuple[float, int]]
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+CELLS = [(x, y) for y in range(BOARD_SIZE) for x in range(BOARD_SIZE)]
+
+def benchmark(name: str) -> Callable[[Benchmark], Benchmark]:
+    """Register a benchmark under a name"""
+    def register(function: Benchmark) -> Benchmark:
+        BENCHMARKS[name] = function
+        return function
+    return register
+
+def _fleet_board(rng: Random) -> Board:
+    board = Board()
+    place_random_fleet(board, SHIPS, rng)
+    return board
+
+@benchmark("fleet.sample")
+def bench_fleet_sample(iterations: int) -> Tuple[float, int]:
+    sampler = FleetSampler(BOARD_SIZE, SHIPS)
+    rng = Random(0)
+    start = perf_counter()
+    for _ in range(iterations):
+        sampler.sample(rng)
+    return perf_counter() - start, iterations
+
+@lru_cache(maxsize=None)
+def _corpus() -> LayoutCorpus:
+    """Small layout corpus in a temporary file, built once per run"""
+    path = os.path.join(tempfile.mkdtemp(), "layouts.bslc")
+    write_corpus(path, 10000)
+    return LayoutCorpus(path)
+
+@benchmark("fleet.place_random")
+def bench_place_random(iterations: int) -> Tuple[float, int]:
+    boards = [Board(BOARD_SIZE) for _ in range(iterations)]
+    rng = Random(0)
+    start = perf_counter()
+    for board in boards:
+        place_random_fleet(board, SHIPS, rng)
+    return perf_counter() - start, iterations
+
+@benchmark("corpus.place")
+def bench_corpus_place(iterations: int) -> Tuple[float, int]:
+    corpus = _corpus()
+    boards = [Board(BOARD_SIZE) for _ in range(iterations)]
+    rng = Random(0)
+    start = perf_counter()
+    for board in boards:
+        corpus.place(board, rng, SHIPS)
+    return perf_counter() - start, iterations
+
+@benchmark("board.place_ship")
+def bench_place_ship(iterations: int) -> Tuple[float, int]:
+    fleets = [[Ship(ship.name, ship.length, ship.coordinates) for ship in _fleet_board(Random(i)).ships]
+              for i in range(iterations)]
+    start = perf_counter()
+    for fleet in fleets:
+        board = Board()
+        for ship in fleet:
+            board.place_ship(ship)
+    return perf_counter() - start, iterations * len(SHIPS)
+
+@benchmark("board.receive_shot")
+def bench_receive_shot(iterations: int) -> Tuple[float, int]:
+    boards = [_fleet_board(Random(i)) for i in range(iterations)]
+    start = perf_counter()
+    for board in boards:
+        for x, y in CELLS:
+            board.receive_shot(x, y)
+    return perf_counter() - start, iterations * len(CELLS)
+
+@benchmark("board.get_valid_ship_placements")
+def bench_valid_placements(iterations: int) -> Tuple[float, int]:
+    boards = [_fleet_board(Random(i)) for i in range(iterations)]
+    start = perf_counter()
+    for board in boards:
+        board.get_valid_ship_placements(3)
+    return perf_counter() - start, iterations
+
+def _ai_bench(factory, iterations: int) -> Tuple[float, int]:
+    """Time get_shot/process_shot_result pairs until each board is cleared"""
+    games = [(_fleet_board(Random(i)), factory(Random(i))) for i in range(iterations)]
+    moves = 0
+    start = perf_counter()
+    for board, ai in games:
+        while not board.all_ships_sunk():
+            x, y = ai.get_shot(board)
+            result = board.receive_shot(x, y)
+            ai.process_shot_result(x, y, result.hit, board.sunk_ship(result))
+            moves += 1
+    return perf_counter() - start, moves
+
+@benchmark("ai.random_target.move")
+def bench_ai_move(iterations: int) -> Tuple[float, int]:
+    return _ai_bench(AIPlayer, iterations)
+
+@benchmark("ai.density.move")
+def bench_density_move(iterations: int) -> Tuple[float, int]:
+    return _ai_bench(DensityAIPlayer, iterations)
+
+@benchmark("game_state.setup_computer_ships")
+def bench_setup_computer_ships(iterations: int) -> Tuple[float, int]:
+    from src.game.game_state import GameState
+    games = [GameState(ui="none", rng=Random(i)) for i in range(iterations)]
+    start = perf_counter()
+    for game in games:
+        game._setup_computer_ships()
+    return perf_counter() - start, iterations
+
+@benchmark("simulation.play_game")
+def bench_play_game(iterations: int) -> Tuple[float, int]:
+    start = perf_counter()
+    for seed in range(iterations):
+        play_game(seed)
+    return perf_counter() - start, iterations
+
+def _start_match(game) -> None:
+    """Place both fleets so a headless game is ready for its first shot"""
+    place_random_fleet(game.player_board, SHIPS, game.rng)
+    game._setup_computer_ships()
+
+# Both match benchmarks time only what the pool replaces (building a game and
+# dropping it, or acquiring and releasing one); placing the fleets is the same
+# work either way and is left out of the timed section
+
+@benchmark("match.new")
+def bench_match_new(iterations: int) -> Tuple[float, int]:
+    from src.game.game_state import GameState
+    elapsed = 0.0
+    for seed in range(iterations):
+        rng = Random(seed)
+        start = perf_counter()
+        game = GameState(ui="none", rng=rng)
+        elapsed += perf_counter() - start
+        _start_match(game)
+        start = perf_counter()
+        del game
+        elapsed += perf_counter() - start
+    return elapsed, iterations
+
+@benchmark("match.pooled")
+def bench_match_pooled(iterations: int) -> Tuple[float, int]:
+    from src.game.pool import MatchPool
+    pool = MatchPool()
+    pool.release(pool.acquire(Random()))
+    elapsed = 0.0
+    for seed in range(iterations):
+        rng = Random(seed)
+        start = perf_counter()
+        game = pool.acquire(rng)
+        elapsed += perf_counter() - start
+        _start_match(game)
+        start = perf_counter()
+        pool.release(game)
+        elapsed += perf_counter() - start
+    return elapsed, iterations
+
+def _cold_start(code: str, iterations: int) -> Tuple[float, int]:
+    """Time fresh interpreters running code, as short-lived workers would"""
+    start = perf_counter()
+    for _ in range(iterations):
+        subprocess.run([sys.executable, "-c", code], check=True)
+    return perf_counter() - start, iterations
+
+@benchmark("startup.python")
+def bench_startup_python(iterations: int) -> Tuple[float, int]:
+    return _cold_start("pass", iterations)
+
+@benchmark("startup.headless_game_state")
+def bench_startup_headless(iterations: int) -> Tuple[float, int]:
+    return _cold_start("from src.game.game_state import GameState; GameState(ui='none')", iterations)
+
+@benchmark("startup.gui_game_state")
+def bench_startup_gui(iterations: int) -> Tuple[float, int]:
+    # What every entry point paid while game_state imported the UIs eagerly
+    return _cold_start("import tkinter, src.ui.gui, src.ui.console_ui, src.game.snapshot; "
+                       "from src.game.game_state import GameState", iterations)
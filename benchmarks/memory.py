@@ -0,0 +1,72 @@
+"""Memory footprint of headless matches.
+
+    python -m benchmarks.memory                  # 2000 live matches, 20 moves each
+    python -m benchmarks.memory --matches 10000
+
+Reports the traced bytes each live match holds, the objects the garbage
+collector has to track and the pause of a full collection with all of them
+alive, which is what bounds how many concurrent matches one server process
+can hold. It then times churning through as many matches again, fresh and
+through a MatchPool.
+"""
+import argparse
+import gc
+import tracemalloc
+from random import Random
+from time import perf_counter
+from typing import Optional
+from src.constants import SHIPS
+from src.game.enums import GamePhase
+from src.game.fleet import place_random_fleet
+from src.game.game_state import GameState
+from src.game.pool import MatchPool
+
+def _play(game: GameState, moves: int) -> GameState:
+    """Set a headless game up and play a few rounds, as a live server match would"""
+    place_random_fleet(game.player_board, SHIPS, game.rng)
+    game._setup_computer_ships()
+    game.current_phase = GamePhase.PLAYING
+    player = game.computer_board.get_valid_moves()
+    game.rng.shuffle(player)
+    for x, y in player[:moves]:
+        game.player_turn(x, y)
+        if game.current_phase == GamePhase.PLAYING:
+            game.computer_turn()
+    return game
+
+def live_matches(matches: int, moves: int) -> None:
+    _play(GameState(ui="none", rng=Random()), moves)  # Warm caches outside the trace
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    games = [_play(GameState(ui="none", rng=Random(seed)), moves) for seed in range(matches)]
+    footprint = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    start = perf_counter()
+    gc.collect()
+    pause = perf_counter() - start
+    print(f"{matches} live matches: {footprint / matches:,.0f} bytes per match, "
+          f"{len(gc.get_objects()):,} tracked objects, full collection {pause * 1e3:.1f} ms")
+    del games
+
+def churn(matches: int, moves: int, pool: Optional[MatchPool] = None) -> None:
+    start = perf_counter()
+    for seed in range(matches):
+        if pool is None:
+            _play(GameState(ui="none", rng=Random(seed)), moves)
+        else:
+            pool.release(_play(pool.acquire(Random(seed)), moves))
+    elapsed = perf_counter() - start
+    print(f"{matches} matches {'pooled' if pool else 'fresh':6}: {elapsed / matches * 1e6:,.1f} µs per match")
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the memory held by live headless matches")
+    parser.add_argument("--matches", type=int, default=2000)
+    parser.add_argument("--moves", type=int, default=20, help="rounds played in each match")
+    args = parser.parse_args()
+    live_matches(args.matches, args.moves)
+    churn(args.matches, args.moves)
+    churn(args.matches, args.moves, MatchPool())
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,79 @@
-from .game.game_state import GameState
+import argparse
+from .game.game_state import UI_MODES, GameState
+from .game.strategies import DEFAULT_STRATEGY, available_strategies, get_strategy
+
+def spectate(left: str, right: str, speed):
+    import tkinter as tk
+    from .ui.gui import BattleshipGUI
+    from .ui.spectator import Spectator
+    root = tk.Tk()
+    spectator = Spectator(root, BattleshipGUI(root), (left, right), speed=speed)
+    spectator.start()
+    try:
+        root.mainloop()
+    finally:
+        spectator.stop()
 
 def main():
-    game = GameState(use_gui=True)
-    game.run()
+    parser = argparse.ArgumentParser(description="Play Battleship")
+    parser.add_argument("--ui", choices=UI_MODES, default="gui",
+                        help="user interface; 'none' plays a headless AI-vs-AI game")
+    parser.add_argument("--strategy", choices=available_strategies(), default=DEFAULT_STRATEGY,
+                        help="computer strategy")
+    parser.add_argument("--spectate", action="store_true",
+                        help="watch --opponent play --strategy in the GUI, game after game")
+    parser.add_argument("--opponent", choices=available_strategies(), default=DEFAULT_STRATEGY,
+                        help="left-hand strategy when spectating")
+    parser.add_argument("--speed", type=float, default=20.0,
+                        help="spectator moves per second; 0 runs flat out")
+    parser.add_argument("--move-budget", type=float,
+                        help="seconds per computer move, for strategies that search within a budget")
+    parser.add_argument("--script", metavar="PATH", type=argparse.FileType("r"),
+                        help="console mode: read moves from this file ('-' for stdin) without prompts")
+    parser.add_argument("--ansi", action="store_true", help="console mode: redraw only the cells that change")
+    parser.add_argument("--metrics", metavar="PATH", help="instrument the game loop and dump metrics here")
+    parser.add_argument("--metrics-format", choices=("json", "prometheus"), default="json")
+    parser.add_argument("--metrics-interval", type=float, default=10.0, help="seconds between dumps")
+    parser.add_argument("--allocations", action="store_true",
+                        help="also count memory blocks allocated by calls on the main thread")
+    parser.add_argument("--profile", metavar="PATH", help="write a cProfile dump of the whole session")
+    args = parser.parse_args()
+    if (args.script or args.ansi) and args.ui != "console":
+        parser.error("--script and --ansi need --ui console")
+    if args.move_budget is not None and not get_strategy(args.strategy).anytime:
+        parser.error(f"--move-budget needs a strategy that searches within a budget, "
+                     f"not {args.strategy!r}")
+    if args.spectate:
+        if args.ui != "gui":
+            parser.error("--spectate needs the GUI")
+        spectate(args.opponent, args.strategy, args.speed or None)
+        return
+    game = GameState(ui=args.ui, strategy=args.strategy, move_budget=args.move_budget,
+                     script=args.script, ansi=args.ansi)
+
+    dumper = None
+    if args.metrics:
+        from . import instrumentation
+        instrumentation.enable(allocations=args.allocations)
+        dumper = instrumentation.MetricsDumper(args.metrics, args.metrics_interval, args.metrics_format)
+        dumper.start()
+    profiler = None
+    if args.profile:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        game.run()
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(args.profile)
+        if dumper is not None:
+            dumper.stop()
+
+    if args.ui == "none":
+        print(f"{game.winner} wins: player fired {len(game.computer_board.shots)} shots, "
+              f"computer fired {len(game.player_board.shots)}")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -0,0 +1,227 @@
+"""NumPy-vectorized batch engine.
+
+Holds N independent games as stacked arrays and resolves one shot per game in
+a single vectorized step. Policies are vectorized counterparts of the AI
+players: they map a batch of boards to one (x, y) shot per game.
+"""
+import time
+from functools import lru_cache
+from random import Random
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
+from .board import Board, placement_table
+from .fleet import FLEET_ATTEMPTS, FleetSampler
+from .simulation import SimulationResult
+from ..constants import BOARD_SIZE, SHIPS
+
+@lru_cache(maxsize=None)
+def placement_matrix(size: int, length: int) -> np.ndarray:
+    """(placements, cells) 0/1 matrix of every placement of a ship of given length"""
+    table = placement_table(size, length)
+    matrix = np.zeros((len(table), size * size), dtype=np.float32)
+    for row, (_, coordinates) in enumerate(table):
+        for x, y in coordinates:
+            matrix[row, y * size + x] = 1
+    matrix.setflags(write=False)
+    return matrix
+
+@lru_cache(maxsize=None)
+def placement_indices(size: int, length: int) -> np.ndarray:
+    """(placements, length) cell indices of every placement of a ship of given length"""
+    indices = np.array([[y * size + x for x, y in coordinates]
+                        for _, coordinates in placement_table(size, length)], dtype=np.int32)
+    indices.setflags(write=False)
+    return indices
+
+class BatchBoards:
+    """N boards stored as arrays of shape (N, cells) and (N, ships)
+
+    `owner[g, c]` is the index of the ship covering cell c of game g (-1 for
+    water), `shot` marks cells fired at and `hits_left[g, s]` counts the
+    unhit cells of ship s.
+    """
+
+    def __init__(self, owner: np.ndarray, ships: Dict[str, int] = SHIPS, size: int = BOARD_SIZE):
+        self.size = size
+        self.ships = ships
+        self.lengths = np.array(list(ships.values()), dtype=np.int16)
+        self.owner = owner.astype(np.int16)
+        self.shot = np.zeros(owner.shape, dtype=bool)
+        self.hits_left = np.tile(self.lengths, (len(owner), 1))
+        self.cells_left = np.full(len(owner), self.lengths.sum(), dtype=np.int16)
+
+    def __len__(self) -> int:
+        return len(self.owner)
+
+    @classmethod
+    def random(cls, n: int, rng: np.random.Generator, ships: Dict[str, int] = SHIPS,
+               size: int = BOARD_SIZE) -> "BatchBoards":
+        """Place a uniformly random fleet on each of n boards
+
+        Vectorized rejection sampling like FleetSampler: every ship draws an
+        independent placement and boards with overlapping ships redraw.
+        """
+        lengths = list(ships.values())
+        tables = [placement_indices(size, length) for length in lengths]
+        ship_of_cell = np.repeat(np.arange(len(lengths), dtype=np.int16), lengths)
+        owner = np.full((n, size * size), -1, dtype=np.int16)
+        pending = np.arange(n)
+        for _ in range(FLEET_ATTEMPTS):
+            if not len(pending):
+                break
+            cells = np.concatenate([table[rng.integers(len(table), size=len(pending))]
+                                    for table in tables], axis=1)
+            ordered = np.sort(cells, axis=1)
+            fits = (ordered[:, 1:] != ordered[:, :-1]).all(axis=1)
+            rows = pending[fits]
+            owner[rows[:, None], cells[fits]] = ship_of_cell
+            pending = pending[~fits]
+
+        if len(pending):
+            # Crowded boards: let the backtracking fallback finish the stragglers
+            sampler = FleetSampler(size, ships)
+            for row in pending:
+                fleet = sampler.sample(Random(int(rng.integers(1 << 63))))
+                for index, coordinates in enumerate(fleet):
+                    for x, y in coordinates:
+                        owner[row, y * size + x] = index
+        return cls(owner, ships, size)
+
+    @classmethod
+    def from_boards(cls, boards: List[Board], ships: Dict[str, int] = SHIPS,
+                    size: int = BOARD_SIZE) -> "BatchBoards":
+        """Stack existing boards (ships listed in fleet order) into a batch"""
+        owner = np.full((len(boards), size * size), -1, dtype=np.int16)
+        for row, board in enumerate(boards):
+            for index, ship in enumerate(board.ships):
+                for x, y in ship.coordinates:
+                    owner[row, y * size + x] = index
+        batch = cls(owner, ships, size)
+        for row, board in enumerate(boards):
+            for x, y in board.shots:
+                batch.receive_shots(np.array([x]), np.array([y]), rows=np.array([row]))
+        return batch
+
+    @property
+    def hits(self) -> np.ndarray:
+        """(N, cells) mask of shots that hit a ship"""
+        return self.shot & (self.owner >= 0)
+
+    @property
+    def ship_sunk(self) -> np.ndarray:
+        """(N, ships) mask of sunk ships"""
+        return self.hits_left == 0
+
+    @property
+    def sunk_cells(self) -> np.ndarray:
+        """(N, cells) mask of cells belonging to sunk ships"""
+        sunk = np.take_along_axis(self.ship_sunk, np.maximum(self.owner, 0), axis=1)
+        return sunk & (self.owner >= 0)
+
+    def receive_shots(self, xs: np.ndarray, ys: np.ndarray,
+                      rows: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Resolve one shot for each game in `rows` (all games by default)
+
+        Returns, per shot, whether it hit and the index of the ship it sank
+        (-1 if none). Repeated shots count as misses.
+        """
+        if rows is None:
+            rows = np.arange(len(self))
+        cells = np.asarray(ys) * self.size + np.asarray(xs)
+        fresh = ~self.shot[rows, cells]
+        self.shot[rows, cells] = True
+
+        owner = self.owner[rows, cells]
+        hit = fresh & (owner >= 0)
+        hit_rows, hit_ships = rows[hit], owner[hit]
+        self.hits_left[hit_rows, hit_ships] -= 1
+        self.cells_left[hit_rows] -= 1
+
+        sunk = np.full(len(rows), -1, dtype=np.int16)
+        sunk[hit] = np.where(self.hits_left[hit_rows, hit_ships] == 0, hit_ships, -1)
+        return hit, sunk
+
+    def all_ships_sunk(self) -> np.ndarray:
+        """(N,) mask of games whose whole fleet is sunk"""
+        return self.cells_left == 0
+
+# Policy: picks one shot per game in `rows`, returning (xs, ys)
+Policy = Callable[[BatchBoards, np.random.Generator, np.ndarray], Tuple[np.ndarray, np.ndarray]]
+
+def _pick(scores: np.ndarray, shot: np.ndarray, rng: np.random.Generator,
+          size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Argmax of integer scores over unshot cells, breaking ties at random"""
+    scores = scores + rng.random(scores.shape, dtype=np.float32) * 0.5
+    scores[shot] = -1
+    cells = scores.argmax(axis=1)
+    return cells % size, cells // size
+
+def random_policy(boards: BatchBoards, rng: np.random.Generator,
+                  rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Uniformly random unshot cell, like AIPlayer's hunting shots"""
+    shot = boards.shot[rows]
+    return _pick(np.zeros(shot.shape, dtype=np.float32), shot, rng, boards.size)
+
+def density_policy(boards: BatchBoards, rng: np.random.Generator,
+                   rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized DensityAIPlayer: fire where the most live placements overlap
+
+    While a game has hits not yet explained by a sunk ship, only placements
+    through those hits are scored (weighted by the hits they cover).
+    """
+    shot = boards.shot[rows]
+    owner = boards.owner[rows]
+    sunk_cells = boards.sunk_cells[rows]
+    hits = shot & (owner >= 0)
+    blocked = ((shot & ~hits) | sunk_cells).astype(np.float32)
+    open_hits = (hits & ~sunk_cells).astype(np.float32)
+    afloat = ~boards.ship_sunk[rows]
+
+    density = np.zeros(shot.shape, dtype=np.float32)
+    target = np.zeros(shot.shape, dtype=np.float32)
+    for length in np.unique(boards.lengths):
+        placements = placement_matrix(boards.size, int(length))
+        count = afloat[:, boards.lengths == length].sum(axis=1, dtype=np.float32)
+        weight = ((blocked @ placements.T) == 0) * count[:, None]
+        density += weight @ placements
+        target += (weight * (open_hits @ placements.T)) @ placements
+
+    targeting = (np.where(shot, 0, target) > 0).any(axis=1)
+    scores = np.where(targeting[:, None], target, density)
+    return _pick(scores, shot, rng, boards.size)
+
+def simulate_batch(n_games: int, seed: int = 0, policy_a: Policy = random_policy,
+                   policy_b: Policy = random_policy, ships: Dict[str, int] = SHIPS,
+                   size: int = BOARD_SIZE) -> SimulationResult:
+    """Play n_games AI-vs-AI games in lockstep; A shoots first in every game"""
+    start = time.perf_counter()
+    rng = np.random.default_rng(seed)
+    boards_a = BatchBoards.random(n_games, rng, ships, size)
+    boards_b = BatchBoards.random(n_games, rng, ships, size)
+    winner = np.zeros(n_games, dtype=np.int8)  # 0 = playing, 1 = A, 2 = B
+    shots = np.zeros(n_games, dtype=np.int32)
+
+    turn = 0
+    active = np.arange(n_games)
+    while len(active):
+        turn += 1
+        if turn > size * size:
+            raise RuntimeError(f"{len(active)} games did not finish in {size * size} shots")
+        for code, policy, target in ((1, policy_a, boards_b), (2, policy_b, boards_a)):
+            xs, ys = policy(target, rng, active)
+            target.receive_shots(xs, ys, active)
+            done = target.all_ships_sunk()[active]
+            winner[active[done]] = code
+            shots[active[done]] = turn
+            active = active[~done]
+
+    result = SimulationResult(
+        games=n_games,
+        wins_a=int((winner == 1).sum()),
+        wins_b=int((winner == 2).sum()),
+        total_shots_to_win=int(shots.sum()),
+        min_shots_to_win=int(shots.min()) if n_games else 0,
+        max_shots_to_win=int(shots.max()) if n_games else 0,
+    )
+    result.elapsed = time.perf_counter() - start
+    return result
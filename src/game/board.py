@@ -1,67 +1,307 @@
-from typing import List, Tuple
+from array import array
+from functools import lru_cache
+from typing import List, NamedTuple, Optional, Tuple
+from .enums import Outcome
 from .ship import Ship
 from ..constants import BOARD_SIZE, EMPTY, SHIP, MISS, HIT, WATER
 
+# A placement is the bitmask of the cells it covers plus those cells in order
+Placement = Tuple[int, Tuple[Tuple[int, int], ...]]
+
+@lru_cache(maxsize=None)
+def placement_table(size: int, length: int) -> Tuple[Placement, ...]:
+    """Every placement of a ship of given length on an empty size x size board
+
+    Horizontal placements come first (row by row), then vertical ones (column
+    by column). The table is built once per (size, length) and shared.
+    """
+    table = []
+    for y in range(size):
+        for x in range(size - length + 1):
+            coordinates = tuple((x + i, y) for i in range(length))
+            table.append((sum(1 << (y * size + x + i) for i in range(length)), coordinates))
+    for x in range(size):
+        for y in range(size - length + 1):
+            coordinates = tuple((x, y + i) for i in range(length))
+            table.append((sum(1 << ((y + i) * size + x) for i in range(length)), coordinates))
+    return tuple(table)
+
+# Per-cell flags stored in Board._cells and reported by Board.deltas()
+CELL_SHIP = 1
+CELL_SHOT = 2
+
+@lru_cache(maxsize=None)
+def _flag_table(flag: int) -> bytes:
+    """bytes.translate table mapping a cell byte to b'1' if it has the flag, else b'0'"""
+    return bytes(ord("1") if value & flag == flag else ord("0") for value in range(256))
+
+@lru_cache(maxsize=None)
+def _display_table(hide_ships: bool) -> bytes:
+    """bytes.translate table mapping a cell byte to its display character"""
+    characters = {0: EMPTY, CELL_SHIP: WATER if hide_ships else SHIP, CELL_SHOT: MISS, CELL_SHIP | CELL_SHOT: HIT}
+    return bytes(ord(characters[value & (CELL_SHIP | CELL_SHOT)]) for value in range(256))
+
+class Footprint(NamedTuple):
+    """The cells a placed ship covers, precomputed for Board.load_fleet"""
+    size: int      # Side of the board it was built for
+    mask: int      # Bitmask of the cells
+    cells: slice   # The cells as a (strided, if vertical) slice of the cell arrays
+    flags: bytes   # CELL_SHIP per cell
+    deltas: array  # cell << 2 | CELL_SHIP per cell, in coordinate order
+
+def footprint(size: int, start: int, vertical: bool, length: int) -> Footprint:
+    """Footprint of a ship of given length from cell `start`, rightwards or downwards"""
+    step = size if vertical else 1
+    cells = range(start, start + length * step, step)
+    return Footprint(size, sum(1 << cell for cell in cells), slice(start, cells.stop, step),
+                     bytes([CELL_SHIP]) * length, array("i", [cell << 2 | CELL_SHIP for cell in cells]))
+
+@lru_cache(maxsize=None)
+def _index_run(index: int, length: int) -> array:
+    """Ship index repeated over a ship's cells, written by Board.load_fleet"""
+    return array("i", [index]) * length
+
+@lru_cache(maxsize=None)
+def _blank_cells(size: int) -> Tuple[bytes, array]:
+    """Cell flags and ship indices of an empty board, copied in by Board.reset"""
+    return bytes(size * size), array("i", [-1]) * (size * size)
+
+class ShotResult(NamedTuple):
+    """Outcome of a shot; true for hits, so it can stand in for the old bool"""
+    outcome: Outcome
+    ship: int = -1  # Index in Board.ships of the ship struck, -1 if none
+
+    def __bool__(self) -> bool:
+        return self.outcome >= Outcome.HIT
+
+    @property
+    def hit(self) -> bool:
+        return self.outcome >= Outcome.HIT
+
+    @property
+    def sunk(self) -> bool:
+        return self.outcome == Outcome.SUNK
+
+INVALID_SHOT = ShotResult(Outcome.INVALID)
+MISSED_SHOT = ShotResult(Outcome.MISS)
+# Ships per board whose (hit, sunk) results are prebuilt and shared; results for
+# larger fleets are built per shot. Never mutated, so boards on any thread can share it
+SHARED_RESULTS = 256
+_SHIP_RESULTS: Tuple[Tuple[ShotResult, ShotResult], ...] = tuple(
+    (ShotResult(Outcome.HIT, index), ShotResult(Outcome.SUNK, index)) for index in range(SHARED_RESULTS))
+
 class Board:
-    def __init__(self):
-        self.grid = [[EMPTY for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
+    """Game board backed by a flat per-cell byte array.
+
+    Cell (x, y) lives at index y * size + x. Each byte holds ship/shot flags,
+    `_ship_index` maps a cell to the index of the ship on it (-1 for water),
+    so shots, hit detection and ship lookup are constant time at any board
+    size. The same indices are used as bit positions by the bitmask views
+    (`ship_mask`, `shot_mask`, `hit_mask` and `ship_masks`).
+
+    Every cell change (ship placed, shot received) is also appended to a
+    delta log, so renderers, AIs and recorders can catch up incrementally
+    with deltas(since) instead of rescanning the board.
+
+    reset() empties the board in place, so long-running servers and
+    simulations can reuse boards rather than allocate a new one per game.
+    """
+    __slots__ = ("size", "ships", "ship_mask", "_cells", "_ship_index",
+                 "sunk_count", "_deltas", "generation")
+
+    def __init__(self, size: int = BOARD_SIZE):
+        self.size = size
         self.ships: List[Ship] = []
-        self.shots: List[Tuple[int, int]] = []
+        self.ship_mask = 0
+        cells, ship_index = _blank_cells(size)
+        self._cells = bytearray(cells)
+        self._ship_index = array("i", ship_index)
+        self.sunk_count = 0  # Ships sunk so far
+        self._deltas = array("i")  # cell << 2 | new cell state, in order
+        self.generation = 0  # Bumped by reset(), which also restarts the delta log
+
+    def reset(self) -> None:
+        """Remove every ship and shot, keeping the allocated storage"""
+        cells, ship_index = _blank_cells(self.size)
+        self._cells[:] = cells
+        self._ship_index[:] = ship_index
+        self.ships.clear()
+        self.ship_mask = 0
+        self.sunk_count = 0
+        del self._deltas[:]
+        self.generation += 1
 
     def place_ship(self, ship: Ship) -> bool:
         """Attempt to place a ship on the board"""
+        if not self.can_place(ship.coordinates) or len(set(ship.coordinates)) != ship.length:
+            return False
+
+        index = len(self.ships)
         for x, y in ship.coordinates:
-            if not self._is_valid_position(x, y) or self.grid[y][x] != EMPTY:
-                return False
-        
-        for x, y in ship.coordinates:
-            self.grid[y][x] = SHIP
+            cell = y * self.size + x
+            self._cells[cell] = CELL_SHIP
+            self._deltas.append(cell << 2 | CELL_SHIP)
+            self._ship_index[cell] = index
+            self.ship_mask |= 1 << cell
         self.ships.append(ship)
         return True
 
-    def receive_shot(self, x: int, y: int) -> bool:
+    def load_fleet(self, ships: List[Ship], footprints: List[Footprint]) -> None:
+        """Place a whole fleet on an empty board, one slice write per ship
+
+        Unlike place_ship, the coordinates are trusted to match the footprints;
+        only the footprints' board size, lengths and overlaps are checked.
+        """
+        if self.ships:
+            raise ValueError("The board already has ships")
+        if len(ships) != len(footprints):
+            raise ValueError("Every ship needs exactly one footprint")
+        mask = 0
+        for ship, placed in zip(ships, footprints):
+            last = placed.cells.stop - placed.cells.step
+            if placed.size != self.size or not 0 <= placed.cells.start <= last < self.size * self.size:
+                raise ValueError(f"Footprint of {ship.name} was built for another board size")
+            if len(placed.flags) != ship.length:
+                raise ValueError(f"Footprint of {ship.name} does not match its length")
+            if mask & placed.mask:
+                raise ValueError("Ships overlap")
+            mask |= placed.mask
+        cells, ship_index, deltas = self._cells, self._ship_index, self._deltas
+        for index, placed in enumerate(footprints):
+            cells[placed.cells] = placed.flags
+            ship_index[placed.cells] = _index_run(index, len(placed.flags))
+            deltas.extend(placed.deltas)
+        self.ships.extend(ships)
+        self.ship_mask = mask
+
+    def can_place(self, coordinates) -> bool:
+        """Check that every coordinate is on the board and free of ships"""
+        cells = self._cells
+        for x, y in coordinates:
+            if not self._is_valid_position(x, y) or cells[y * self.size + x] & CELL_SHIP:
+                return False
+        return True
+
+    def receive_shot(self, x: int, y: int) -> ShotResult:
         """Process a shot at the given coordinates"""
-        if not self._is_valid_position(x, y) or (x, y) in self.shots:
-            return False
+        if not self._is_valid_position(x, y):
+            return INVALID_SHOT
+        cell = y * self.size + x
+        state = self._cells[cell]
+        if state & CELL_SHOT:
+            return INVALID_SHOT
 
-        self.shots.append((x, y))
-        
-        if self.grid[y][x] == SHIP:
-            self.grid[y][x] = HIT
-            for ship in self.ships:
-                if ship.hit((x, y)):
-                    break
-            return True
-        
-        self.grid[y][x] = MISS
-        return False
+        state |= CELL_SHOT
+        self._cells[cell] = state
+        self._deltas.append(cell << 2 | state)
+        if not state & CELL_SHIP:
+            return MISSED_SHOT
+
+        index = self._ship_index[cell]
+        ship = self.ships[index]
+        ship.hits.add((x, y))
+        sunk = len(ship.hits) == ship.length
+        if sunk:
+            self.sunk_count += 1
+        if index < SHARED_RESULTS:
+            return _SHIP_RESULTS[index][sunk]
+        return ShotResult(Outcome.SUNK if sunk else Outcome.HIT, index)
+
+    @property
+    def shots(self) -> List[Tuple[int, int]]:
+        """Cells fired at, oldest first, read back from the delta log"""
+        size = self.size
+        return [(cell % size, cell // size) for cell, state in self.deltas() if state & CELL_SHOT]
+
+    @property
+    def delta_count(self) -> int:
+        """Length of the delta log; pass it to deltas() later to get only newer changes"""
+        return len(self._deltas)
+
+    def deltas(self, since: int = 0) -> List[Tuple[int, int]]:
+        """(cell, new state) for every cell change after the first `since`"""
+        return [(delta >> 2, delta & 3) for delta in self._deltas[since:]]
 
     def _is_valid_position(self, x: int, y: int) -> bool:
         """Check if the given coordinates are within bounds"""
-        return 0 <= x < BOARD_SIZE and 0 <= y < BOARD_SIZE
+        return 0 <= x < self.size and 0 <= y < self.size
+
+    def has_shot(self, x: int, y: int) -> bool:
+        """Check if the given coordinates have already been fired at"""
+        return bool(self._cells[y * self.size + x] & CELL_SHOT)
+
+    def ship_at(self, x: int, y: int) -> Optional[Ship]:
+        """Return the ship occupying the given coordinates, if any"""
+        index = self._ship_index[y * self.size + x]
+        return None if index < 0 else self.ships[index]
+
+    def sunk_ship(self, result: ShotResult) -> Optional[Ship]:
+        """The ship a shot sank, if it sank one"""
+        return self.ships[result.ship] if result.outcome == Outcome.SUNK else None
+
+    def sunk_ship_at(self, x: int, y: int) -> Optional[Ship]:
+        """Return the ship at the given coordinates if it has been sunk"""
+        ship = self.ship_at(x, y)
+        return ship if ship is not None and ship.is_sunk else None
+
+    def cell(self, x: int, y: int) -> str:
+        """Return the display state of a single cell"""
+        state = self._cells[y * self.size + x]
+        if state & CELL_SHOT:
+            return HIT if state & CELL_SHIP else MISS
+        return SHIP if state & CELL_SHIP else EMPTY
+
+    def rows(self, hide_ships: bool = False) -> List[str]:
+        """Display rows of the board, unhit ships shown as water if hidden"""
+        text = self._cells.translate(_display_table(hide_ships)).decode("ascii")
+        return [text[y * self.size:(y + 1) * self.size] for y in range(self.size)]
+
+    @property
+    def grid(self) -> List[List[str]]:
+        """Snapshot of the board as rows of cell characters"""
+        return [[self.cell(x, y) for x in range(self.size)] for y in range(self.size)]
+
+    @property
+    def shot_mask(self) -> int:
+        """Bitmask of every cell fired at"""
+        return self._mask(CELL_SHOT)
+
+    @property
+    def hit_mask(self) -> int:
+        """Bitmask of the shots that hit a ship"""
+        return self._mask(CELL_SHOT | CELL_SHIP)
+
+    @property
+    def ship_masks(self) -> List[int]:
+        """Footprint bitmask of each ship, in placement order"""
+        return [sum(1 << (y * self.size + x) for x, y in ship.coordinates) for ship in self.ships]
+
+    def _mask(self, flag: int) -> int:
+        """Pack the cells carrying a flag into an int, bit i for cell i"""
+        if not self._cells:
+            return 0
+        return int(self._cells.translate(_flag_table(flag))[::-1], 2)
 
     def all_ships_sunk(self) -> bool:
         """Check if all ships have been sunk"""
-        return all(ship.is_sunk for ship in self.ships)
+        return self.sunk_count == len(self.ships)
+
+    def get_valid_moves(self) -> List[Tuple[int, int]]:
+        """Returns every cell that has not been fired at yet"""
+        size = self.size
+        return [(cell % size, cell // size)
+                for cell, state in enumerate(self._cells) if not state & CELL_SHOT]
+
+    def get_valid_placements(self, length: int) -> List[Placement]:
+        """Returns the (mask, coordinates) placements that fit around existing ships
+
+        Enumerates the whole placement table, so it is meant for boards of
+        modest size; large boards should sample placements with can_place.
+        """
+        occupied = self.ship_mask
+        return [placement for placement in placement_table(self.size, length)
+                if not placement[0] & occupied]
 
     def get_valid_ship_placements(self, length: int) -> List[List[Tuple[int, int]]]:
         """Returns all valid ship placements for a ship of given length."""
-        valid_placements = []
-        
-        # Check horizontal placements
-        for y in range(BOARD_SIZE):
-            for x in range(BOARD_SIZE - length + 1):
-                coordinates = [(x + i, y) for i in range(length)]
-                if all(self._is_valid_position(x, y) and 
-                      self.grid[y][x] == EMPTY for x, y in coordinates):
-                    valid_placements.append(coordinates)
-        
-        # Check vertical placements
-        for x in range(BOARD_SIZE):
-            for y in range(BOARD_SIZE - length + 1):
-                coordinates = [(x, y + i) for i in range(length)]
-                if all(self._is_valid_position(x, y) and 
-                      self.grid[y][x] == EMPTY for x, y in coordinates):
-                    valid_placements.append(coordinates)
-        
-        return valid_placements
+        return [list(coordinates) for _, coordinates in self.get_valid_placements(length)]
@@ -0,0 +1,157 @@
+"""Pregenerated corpus of fleet layouts.
+
+A corpus file holds a fixed number of uniformly random fleets for one board
+size and fleet, each in the fixed-width fleet encoding of game records
+(start cell per ship plus orientation bits), so layout i sits at a known
+offset:
+
+    header   magic "BSLC", version u8, cell width u8, board size u16,
+             ship count u16, layout count u64, then one u16 length per ship
+    layouts  layout count x fleet bytes
+
+LayoutCorpus memory-maps the file, so every simulation worker that opens
+the same corpus shares one copy through the page cache, and setting up a
+board is a constant-time read instead of sampling a fleet. The coordinates
+and Footprint of the most recently used ship placements are cached, so
+placing a layout is one Board.load_fleet call with a slice write per ship. Drawing layouts
+by seeded index makes the set of layouts identical across runs and
+strategies. Build a corpus with
+
+    python -m src.game.corpus layouts.bslc --count 1000000
+"""
+import mmap
+import struct
+from functools import lru_cache
+from random import Random
+from typing import Dict, List, Tuple
+from .board import Board, Footprint, footprint
+from .fleet import FleetSampler
+from .record import Coordinates, FleetLayout, from_le_bytes
+from .ship import Ship
+from ..constants import BOARD_SIZE, SHIPS
+
+MAGIC = b"BSLC"
+VERSION = 1
+HEADER = struct.Struct("<4sBBHHQ")
+
+# Ship placements whose coordinates and footprint are kept, over all corpora;
+# enough for every placement of the default fleet on boards up to about 30x30
+PLACEMENT_CACHE = 8192
+
+Placement = Tuple[Tuple[Tuple[int, int], ...], Footprint]
+
+@lru_cache(maxsize=PLACEMENT_CACHE)
+def _placement(size: int, start: int, vertical: int, length: int) -> Placement:
+    """Coordinates and footprint of a ship of given length from cell `start`"""
+    x, y = start % size, start // size
+    coordinates = tuple((x, y + i) if vertical else (x + i, y) for i in range(length))
+    return coordinates, footprint(size, start, bool(vertical), length)
+
+def write_corpus(path, count: int, seed: int = 0, size: int = BOARD_SIZE,
+                 ships: Dict[str, int] = SHIPS) -> None:
+    """Write `count` uniformly random fleets drawn from a seeded generator"""
+    rng = Random(seed)
+    sampler = FleetSampler(size, ships)
+    layout = FleetLayout(size, list(ships.values()))
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, layout.cell_width, size, len(layout.lengths), count))
+        file.write(struct.pack(f"<{len(layout.lengths)}H", *layout.lengths))
+        for _ in range(count):
+            file.write(layout.encode_fleet(sampler.sample(rng)))
+
+class LayoutCorpus:
+    """Memory-mapped layout corpus; pickles as its path, so workers map the same file"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, cell_width, size, ships, count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} layout corpus")
+        lengths = list(struct.unpack_from(f"<{ships}H", self._map, HEADER.size))
+        self._layout = FleetLayout(size, lengths)
+        if self._layout.cell_width != cell_width:
+            raise ValueError(f"{path} has an invalid cell width")
+        self._start = HEADER.size + 2 * ships
+        if len(self._map) < self._start + count * self._layout.fleet_bytes:
+            raise ValueError(f"{path} is truncated")
+        self.size = size
+        self.lengths = lengths
+        self._count = count
+
+    def __reduce__(self):
+        return _open_corpus, (str(self.path),)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def matches(self, size: int, ships: Dict[str, int]) -> bool:
+        """Whether the corpus was built for this board size and fleet"""
+        return self.size == size and self.lengths == list(ships.values())
+
+    def fleet(self, index: int) -> List[Coordinates]:
+        """Ship coordinates of layout `index`, in fleet order"""
+        return [list(coordinates) for coordinates, _ in self._read(index)]
+
+    def _read(self, index: int) -> List[Placement]:
+        """Coordinates and footprint of each ship of layout `index`"""
+        if not 0 <= index < self._count:
+            raise IndexError("layout index out of range")
+        layout = self._layout
+        offset = self._start + index * layout.fleet_bytes
+        split = offset + len(self.lengths) * layout.cell_width
+        starts = self._map[offset:split]
+        if layout.cell_width > 1:
+            starts = from_le_bytes(layout.typecode, starts)
+        vertical = int.from_bytes(self._map[split:offset + layout.fleet_bytes], "little")
+        size = self.size
+        return [_placement(size, start, vertical >> ship & 1, length)
+                for ship, (start, length) in enumerate(zip(starts, self.lengths))]
+
+    def place(self, board: Board, rng, ships: Dict[str, int] = SHIPS) -> int:
+        """Place a layout drawn with rng on an empty board; returns its index"""
+        if board.ships:
+            raise ValueError("The board already has ships")
+        if not self.matches(board.size, ships):
+            raise ValueError("The corpus was built for another board size or fleet")
+        index = rng.randrange(self._count)
+        fleet, footprints = [], []
+        for (ship_name, length), (coordinates, placed) in zip(ships.items(), self._read(index)):
+            fleet.append(Ship(ship_name, length, list(coordinates)))
+            footprints.append(placed)
+        board.load_fleet(fleet, footprints)
+        return index
+
+    def close(self) -> None:
+        self._map.close()
+
+    def __enter__(self) -> "LayoutCorpus":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+# Corpora unpickled in this process, by path, so each worker maps a file once
+_OPENED: Dict[str, LayoutCorpus] = {}
+
+def _open_corpus(path: str) -> LayoutCorpus:
+    corpus = _OPENED.get(path)
+    if corpus is None:
+        corpus = _OPENED[path] = LayoutCorpus(path)
+    return corpus
+
+def main():
+    import argparse
+    from pathlib import Path
+    parser = argparse.ArgumentParser(description="Pregenerate a corpus of random fleet layouts")
+    parser.add_argument("output", type=Path)
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--size", type=int, default=BOARD_SIZE)
+    args = parser.parse_args()
+    write_corpus(args.output, args.count, args.seed, args.size)
+    print(f"Wrote {args.count} layouts ({args.output.stat().st_size} bytes) to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Probability-density targeting AI.
+
+Every cell is scored by how many placements of the ships still afloat cover it
+without crossing a miss or a sunk ship. The heatmap is maintained
+incrementally: a miss only touches the placements through that cell, and a
+sinking only touches placements of the sunk ship's length.
+
+Memory grows with cells x placements, so this AI targets boards up to a few
+thousand cells; AIPlayer scales to much larger boards.
+
+The first moves come from the bundled opening book (see opening_book) when
+one was built for the board size and fleet, until a ship sinks or the game
+leaves the book. The book breaks ties towards the lowest cell rather than at
+random, so those opening moves repeat from game to game.
+"""
+import random
+from collections import Counter, defaultdict
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
+from .board import Board, placement_table
+from .opening_book import default_book
+from .ship import Ship
+from ..constants import BOARD_SIZE, SHIPS
+
+@lru_cache(maxsize=None)
+def placement_cells(size: int, length: int) -> Tuple[Tuple[Tuple[int, ...], ...], Tuple[Tuple[int, ...], ...]]:
+    """Cell indices covered by each placement, and the placements covering each cell"""
+    cells = tuple(tuple(y * size + x for x, y in coordinates)
+                  for _, coordinates in placement_table(size, length))
+    cover: List[List[int]] = [[] for _ in range(size * size)]
+    for placement, placement_cells_ in enumerate(cells):
+        for cell in placement_cells_:
+            cover[cell].append(placement)
+    return cells, tuple(tuple(placements) for placements in cover)
+
+class DensityAIPlayer:
+    def __init__(self, rng=random, size: int = BOARD_SIZE, ships: Dict[str, int] = SHIPS,
+                 opening_book: bool = True):
+        self.rng = rng
+        self.size = size
+        self.remaining = Counter(ships.values())  # Ship length -> ships afloat
+        self.open_hits: Set[int] = set()          # Hits not yet part of a sunk ship
+        self.shot = bytearray(self.size * self.size)
+        self.density = [0] * (self.size * self.size)
+        self._index = {length: placement_cells(self.size, length) for length in self.remaining}
+        self._alive = {length: bytearray(b"\x01") * len(cells)
+                       for length, (cells, _) in self._index.items()}
+        for length, count in self.remaining.items():
+            for cells in self._index[length][0]:
+                for cell in cells:
+                    self.density[cell] += count
+        # Position in the opening book: shots played from it and their hit bits
+        self._book = default_book(size, ships) if opening_book else None
+        self._book_shots = 0
+        self._book_results = 0
+
+    def get_shot(self, board: Board) -> Tuple[int, int]:
+        """Get the next shot coordinates"""
+        if self._book is not None:
+            cell = self._book.lookup(self._book_shots, self._book_results)
+            if cell is not None:
+                return cell % self.size, cell // self.size
+        scores = self._target_scores() if self.open_hits else None
+        if not scores:
+            scores = {cell: value for cell, value in enumerate(self.density) if not self.shot[cell]}
+        best = max(scores.values())
+        choices = [cell for cell, value in scores.items() if value == best]
+        cell = choices[0] if len(choices) == 1 else self.rng.choice(choices)
+        return cell % self.size, cell // self.size
+
+    def process_shot_result(self, x: int, y: int, hit: bool, sunk: Optional[Ship] = None) -> None:
+        """Process the result of the last shot (`sunk` is the ship it sank, if any)"""
+        cell = y * self.size + x
+        if self.shot[cell]:
+            return
+        self.shot[cell] = 1
+        if self._book is not None:
+            if sunk is None and self._book.lookup(self._book_shots, self._book_results) == cell:
+                self._book_results |= hit << self._book_shots
+                self._book_shots += 1
+            else:
+                self._book = None  # Out of book for the rest of the game
+
+        if not hit:
+            self._block(cell)
+            return
+        self.open_hits.add(cell)
+        if sunk is not None:
+            self._sink(sunk)
+
+    def _target_scores(self) -> Dict[int, int]:
+        """Score open cells by the live placements that explain the unresolved hits
+
+        A placement covering k open hits is counted k times, so cells that
+        extend a line of hits outrank cells beside a single hit.
+        """
+        scores: Dict[int, int] = defaultdict(int)
+        for hit in self.open_hits:
+            for length, count in self.remaining.items():
+                if not count:
+                    continue
+                cells, cover = self._index[length]
+                alive = self._alive[length]
+                for placement in cover[hit]:
+                    if alive[placement]:
+                        for cell in cells[placement]:
+                            if not self.shot[cell]:
+                                scores[cell] += count
+        return scores
+
+    def _block(self, cell: int) -> None:
+        """Drop every live placement through a cell that cannot hold a ship"""
+        density = self.density
+        for length, (cells, cover) in self._index.items():
+            alive = self._alive[length]
+            count = self.remaining[length]
+            for placement in cover[cell]:
+                if alive[placement]:
+                    alive[placement] = 0
+                    for covered in cells[placement]:
+                        density[covered] -= count
+
+    def _sink(self, ship: Ship) -> None:
+        """Remove one ship of this length from the fleet and block its cells"""
+        length = ship.length
+        if self.remaining[length]:
+            density = self.density
+            cells, _ = self._index[length]
+            alive = self._alive[length]
+            for placement, placement_cells_ in enumerate(cells):
+                if alive[placement]:
+                    for covered in placement_cells_:
+                        density[covered] -= 1
+            self.remaining[length] -= 1
+
+        for x, y in ship.coordinates:
+            cell = y * self.size + x
+            self.open_hits.discard(cell)
+            self._block(cell)
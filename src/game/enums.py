@@ -1,6 +1,12 @@
-from enum import Enum
+from enum import Enum, IntEnum
 
 class GamePhase(Enum):
     SETUP = "setup"
     PLAYING = "playing"
-    GAME_OVER = "game_over" 
\ No newline at end of file
+    GAME_OVER = "game_over"
+
+class Outcome(IntEnum):
+    INVALID = 0  # Off the board or already fired at
+    MISS = 1
+    HIT = 2
+    SUNK = 3
@@ -0,0 +1,168 @@
+"""Sequential A/B evaluation of AI strategies.
+
+Each pair of games gives both strategies the same fleet layout and the same
+random generator seed, and records how many shots each needs to sink the
+whole fleet on its own. Shots to sink are what decide a game, and pairing
+cancels most of the layout-to-layout variance, so the per-pair difference
+d = shots_a - shots_b is far less noisy than either side's shot count.
+
+After every pair two sequential probability ratio tests (SPRT) are updated
+on the mean of d, each against "no difference", with a normal model whose
+variance is estimated from the data so far:
+
+    better_b: mean d = +delta (A needs delta more shots)  vs  mean d = 0
+    better_a: mean d = -delta                             vs  mean d = 0
+
+Evaluation stops as soon as one test accepts its alternative (that
+strategy is better) or both accept the null (the difference is within
+delta), or after max_games pairs. The reported confidence interval is the
+usual fixed-sample normal interval, which is slightly optimistic after
+optional stopping.
+"""
+import math
+import time
+from dataclasses import dataclass
+from random import Random
+from statistics import NormalDist
+from typing import Dict
+from .board import Board
+from .fleet import place_random_fleet
+from .player import AIPlayer
+from .simulation import AIFactory, close_ai, derive_seed
+from ..constants import BOARD_SIZE, SHIPS
+
+A_BETTER = "A"
+B_BETTER = "B"
+EQUIVALENT = "equivalent"
+INCONCLUSIVE = "inconclusive"
+
+# Pairs played before the variance estimate is trusted enough to stop
+MIN_GAMES = 30
+
+def shots_to_sink(seed: int, ai: AIFactory, size: int = BOARD_SIZE, ships: Dict[str, int] = SHIPS) -> int:
+    """Shots an AI needs to sink a whole seeded fleet on its own"""
+    rng = Random(seed)
+    board = Board(size)
+    place_random_fleet(board, ships, rng)
+    player = ai(Random(rng.getrandbits(64)), size, ships)
+    try:
+        for shots in range(1, size * size + 1):
+            x, y = player.get_shot(board)
+            result = board.receive_shot(x, y)
+            player.process_shot_result(x, y, result.hit, board.sunk_ship(result))
+            if result.sunk and board.all_ships_sunk():
+                return shots
+    finally:
+        close_ai(player)
+    raise RuntimeError(f"Layout with seed {seed} was not cleared in {size * size} shots")
+
+@dataclass
+class Evaluation:
+    games: int = 0              # Pairs played
+    decision: str = INCONCLUSIVE
+    mean_a: float = 0.0         # Mean shots to sink
+    mean_b: float = 0.0
+    mean_difference: float = 0.0  # mean_a - mean_b; positive means B is better
+    ci_low: float = 0.0
+    ci_high: float = 0.0
+    variance_reduction: float = 1.0  # Variance of unpaired differences over paired ones
+    elapsed: float = 0.0
+
+    def summary(self) -> str:
+        """Human readable one-line summary"""
+        return (f"{self.decision} after {self.games} paired games in {self.elapsed:.2f}s: "
+                f"A {self.mean_a:.2f} vs B {self.mean_b:.2f} shots, "
+                f"difference {self.mean_difference:+.2f} "
+                f"[{self.ci_low:+.2f}, {self.ci_high:+.2f}], "
+                f"pairing cut variance {self.variance_reduction:.1f}x")
+
+class _Moments:
+    """Running mean and variance (Welford)"""
+    __slots__ = ("count", "mean", "m2")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+def evaluate(ai_a: AIFactory = AIPlayer, ai_b: AIFactory = AIPlayer, seed: int = 0,
+             delta: float = 1.0, alpha: float = 0.05, beta: float = 0.05,
+             max_games: int = 100_000, confidence: float = 0.95,
+             size: int = BOARD_SIZE, ships: Dict[str, int] = SHIPS) -> Evaluation:
+    """Play paired games until the SPRTs decide whether A or B sinks fleets faster
+
+    delta is the smallest difference in mean shots worth detecting; alpha and
+    beta are each test's false positive and false negative rates.
+    """
+    if delta <= 0:
+        raise ValueError("delta must be positive")
+    upper = math.log((1 - beta) / alpha)   # Accept the alternative at or above this
+    lower = math.log(beta / (1 - alpha))   # Accept the null at or below this
+    shots_a, shots_b, difference = _Moments(), _Moments(), _Moments()
+    result = Evaluation()
+    start = time.perf_counter()
+    for index in range(max_games):
+        game_seed = derive_seed(seed, index)
+        a = shots_to_sink(game_seed, ai_a, size, ships)
+        b = shots_to_sink(game_seed, ai_b, size, ships)
+        shots_a.add(a)
+        shots_b.add(b)
+        difference.add(a - b)
+        if difference.count < MIN_GAMES:
+            continue
+
+        # Log likelihood ratios of mean d = +/-delta against mean d = 0
+        total = difference.mean * difference.count
+        scale = delta / max(difference.variance, 1e-9)
+        llr_b = scale * (total - difference.count * delta / 2)
+        llr_a = scale * (-total - difference.count * delta / 2)
+        if llr_b >= upper:
+            result.decision = B_BETTER
+        elif llr_a >= upper:
+            result.decision = A_BETTER
+        elif llr_b <= lower and llr_a <= lower:
+            result.decision = EQUIVALENT
+        else:
+            continue
+        break
+
+    result.games = difference.count
+    result.mean_a, result.mean_b = shots_a.mean, shots_b.mean
+    result.mean_difference = difference.mean
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    half_width = z * math.sqrt(difference.variance / difference.count) if difference.count else 0.0
+    result.ci_low = difference.mean - half_width
+    result.ci_high = difference.mean + half_width
+    if difference.variance:
+        result.variance_reduction = (shots_a.variance + shots_b.variance) / difference.variance
+    result.elapsed = time.perf_counter() - start
+    return result
+
+def main():
+    import argparse
+    from .strategies import available_strategies, get_strategy
+    parser = argparse.ArgumentParser(description="Compare two AI strategies with paired sequential testing")
+    parser.add_argument("strategy_a", choices=available_strategies())
+    parser.add_argument("strategy_b", choices=available_strategies())
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--delta", type=float, default=1.0, help="smallest difference in mean shots to detect")
+    parser.add_argument("--alpha", type=float, default=0.05)
+    parser.add_argument("--beta", type=float, default=0.05)
+    parser.add_argument("--max-games", type=int, default=100_000)
+    args = parser.parse_args()
+    result = evaluate(get_strategy(args.strategy_a).factory, get_strategy(args.strategy_b).factory,
+                      args.seed, args.delta, args.alpha, args.beta, args.max_games)
+    print(result.summary())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""Random fleet placement.
+
+FleetSampler draws whole fleets uniformly at random, i.e. every legal
+layout is equally likely, by rejection: every ship independently draws a
+placement from its precomputed placement table and the fleet is redrawn if
+any two ships overlap. Placing ships one at a time, each uniform among the
+placements still free, instead favours layouts that leave later ships little
+room. An optional bias weights each placement; fleets are then drawn with
+probability proportional to the product of their placement weights.
+
+Rejection needs no retry-until-it-fits loop per ship and terminates with
+probability one, but on crowded boards it could take long, so after
+FLEET_ATTEMPTS failed fleets the sampler falls back to a randomized
+backtracking search. That search always terminates, either with a fleet
+(close to, but not exactly, uniform) or with a ValueError when the fleet
+cannot fit at all. Boards too large for placement tables fall back to
+placing ships one at a time instead, each uniform among the placements
+still free, and only raise once FLEET_RESTARTS such fleets got stuck.
+"""
+import random
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from .board import Board, placement_table
+from .ship import Ship
+from ..constants import SHIPS
+
+# Boards with more cells than this sample placements instead of enumerating them
+PLACEMENT_TABLE_MAX_CELLS = 2500
+
+# Whole fleets drawn by rejection before falling back to backtracking
+FLEET_ATTEMPTS = 10000
+
+# Untabled boards: ship placements tried at random before scanning for free
+# ones, and fleets placed ship by ship before giving up
+SAMPLE_ATTEMPTS = 1000
+FLEET_RESTARTS = 10
+
+Coordinates = List[Tuple[int, int]]
+# Weight of a placement given its coordinates; higher is more likely
+PlacementBias = Callable[[Sequence[Tuple[int, int]]], float]
+
+class FleetSampler:
+    """Draws random fleets of the given ships on an empty size x size board"""
+
+    def __init__(self, size: int, ships: Dict[str, int] = SHIPS, bias: Optional[PlacementBias] = None):
+        self.size = size
+        self.lengths = list(ships.values())
+        self.bias = bias
+        if any(length > size for length in self.lengths):
+            raise ValueError("A ship is longer than the board")
+        self.tabled = size * size <= PLACEMENT_TABLE_MAX_CELLS
+        if not self.tabled and bias is not None:
+            raise ValueError("Biased sampling needs placement tables; the board is too large")
+        if self.tabled:
+            self._tables = {length: placement_table(size, length) for length in set(self.lengths)}
+            self._weights = {length: _cumulative_weights(table, bias) if bias else None
+                             for length, table in self._tables.items()}
+
+    def sample(self, rng=random) -> List[Coordinates]:
+        """Coordinates of every ship of the fleet, in fleet order"""
+        draw = self._draw_tabled if self.tabled else self._draw_arithmetic
+        for _ in range(FLEET_ATTEMPTS):
+            fleet = draw(rng)
+            if fleet is not None:
+                return fleet
+        return self._backtrack(rng) if self.tabled else self._place_one_by_one(rng)
+
+    def _draw_tabled(self, rng) -> Optional[List[Coordinates]]:
+        occupied = 0
+        fleet = []
+        for length in self.lengths:
+            table = self._tables[length]
+            weights = self._weights[length]
+            if weights is None:
+                mask, coordinates = table[int(rng.random() * len(table))]
+            else:
+                mask, coordinates = rng.choices(table, cum_weights=weights)[0]
+            if mask & occupied:
+                return None
+            occupied |= mask
+            fleet.append(list(coordinates))
+        return fleet
+
+    def _draw_arithmetic(self, rng) -> Optional[List[Coordinates]]:
+        """Table-free draw for huge boards: pick an axis, then a start cell"""
+        size = self.size
+        occupied = set()
+        fleet = []
+        for length in self.lengths:
+            coordinates = _random_line(size, length, rng)
+            if not occupied.isdisjoint(coordinates):
+                return None
+            occupied.update(coordinates)
+            fleet.append(coordinates)
+        return fleet
+
+    def _place_one_by_one(self, rng) -> List[Coordinates]:
+        """Untabled fallback: each ship uniform among the placements left free by the previous ones"""
+        board = Board(self.size)
+        for _ in range(FLEET_RESTARTS):
+            board.reset()
+            fleet = []
+            for index, length in enumerate(self.lengths):
+                coordinates = _free_line(board, length, rng)
+                if coordinates is None:
+                    break
+                board.place_ship(Ship(f"Ship {index + 1}", length, coordinates))
+                fleet.append(coordinates)
+            else:
+                return fleet
+        raise ValueError("No room on the board for the whole fleet")
+
+    def _backtrack(self, rng) -> List[Coordinates]:
+        """Depth-first search over shuffled placements, largest ships first"""
+        order = sorted(range(len(self.lengths)), key=lambda index: -self.lengths[index])
+        chosen: Dict[int, Coordinates] = {}
+
+        def place(position: int, occupied: int) -> bool:
+            if position == len(order):
+                return True
+            index = order[position]
+            candidates = [placement for placement in self._tables[self.lengths[index]]
+                          if not placement[0] & occupied]
+            rng.shuffle(candidates)
+            for mask, coordinates in candidates:
+                chosen[index] = list(coordinates)
+                if place(position + 1, occupied | mask):
+                    return True
+            return False
+
+        if not place(0, 0):
+            raise ValueError("No room on the board for the whole fleet")
+        return [chosen[index] for index in range(len(self.lengths))]
+
+def _random_line(size: int, length: int, rng) -> Coordinates:
+    """Uniformly random placement of a ship on an empty board"""
+    # Same number of horizontal and vertical placements, so pick the axis fairly
+    if rng.random() < 0.5:
+        x, y = rng.randrange(size - length + 1), rng.randrange(size)
+        return [(x + i, y) for i in range(length)]
+    x, y = rng.randrange(size), rng.randrange(size - length + 1)
+    return [(x, y + i) for i in range(length)]
+
+def _free_line(board: Board, length: int, rng) -> Optional[Coordinates]:
+    """Uniformly random placement among those free on the board, None if there are none"""
+    size = board.size
+    for _ in range(SAMPLE_ATTEMPTS):
+        coordinates = _random_line(size, length, rng)
+        if board.can_place(coordinates):
+            return coordinates
+    # Crowded board: scan every placement instead of retrying
+    free = [coordinates for y in range(size) for x in range(size)
+            for coordinates in ([(x + i, y) for i in range(length)], [(x, y + i) for i in range(length)])
+            if board.can_place(coordinates)]
+    return rng.choice(free) if free else None
+
+def _cumulative_weights(table, bias: PlacementBias) -> List[float]:
+    weights = []
+    total = 0.0
+    for _, coordinates in table:
+        weight = bias(coordinates)
+        if weight < 0:
+            raise ValueError("Placement weights must not be negative")
+        total += weight
+        weights.append(total)
+    if not total:
+        raise ValueError("Every placement has zero weight")
+    return weights
+
+@lru_cache(maxsize=64)
+def _default_sampler(size: int, fleet: Tuple[Tuple[str, int], ...]) -> FleetSampler:
+    return FleetSampler(size, dict(fleet))
+
+def place_random_fleet(board: Board, ships: Dict[str, int] = SHIPS, rng=random) -> None:
+    """Place a uniformly random fleet on an empty board"""
+    if board.ships:
+        raise ValueError("The board already has ships")
+    fleet = _default_sampler(board.size, tuple(ships.items())).sample(rng)
+    for (ship_name, length), coordinates in zip(ships.items(), fleet):
+        board.place_ship(Ship(ship_name, length, coordinates))
@@ -1,43 +1,149 @@
-from typing import Optional, Tuple
-from .board import Board
+import random
+from typing import Dict, Optional, TextIO, Tuple
+from .board import INVALID_SHOT, Board, ShotResult
 from .player import AIPlayer
 from .ship import Ship
 from .enums import GamePhase
-from ..constants import SHIPS
-from ..ui.gui import BattleshipGUI
-from ..ui.console_ui import ConsoleUI
-import tkinter as tk
+from .fleet import place_random_fleet
+from .simulation import close_ai
+from .strategies import DEFAULT_STRATEGY, choose_shot, create_strategy
+from ..constants import BOARD_SIZE, SHIPS
+
+# UI backends: "gui" (tkinter), "console", or "none" for headless games
+UI_MODES = ("gui", "console", "none")
+
+# How often the GUI checks whether the computer has picked its move
+POLL_MS = 15
 
 class GameState:
-    def __init__(self, use_gui: bool = True):
-        self.player_board = Board()
-        self.computer_board = Board()
-        self.ai_player = AIPlayer()
+    def __init__(self, ui: str = "gui", board_size: int = BOARD_SIZE,
+                 ships: Dict[str, int] = SHIPS, rng=random,
+                 strategy: str = DEFAULT_STRATEGY, move_budget: Optional[float] = None,
+                 script: Optional[TextIO] = None, ansi: bool = False):
+        if ui not in UI_MODES:
+            raise ValueError(f"Unknown UI {ui!r}, expected one of {', '.join(UI_MODES)}")
+        self.ui_mode = ui
+        self.board_size = board_size
+        self.ships = ships
+        self.rng = rng
+        self.player_board = Board(board_size)
+        self.computer_board = Board(board_size)
+        self.strategy = strategy
+        self.move_budget = move_budget  # Seconds per move for anytime strategies; None uses their default
+        self.ai_player = create_strategy(strategy, rng, board_size, ships)
         
-        if use_gui:
+        # UI modules are imported on demand so console and headless games never load tkinter.
+        # Headless games have no UI and are driven through player_turn/computer_turn
+        if ui == "gui":
+            import tkinter as tk
+            from ..ui.gui import BattleshipGUI
             self.root = tk.Tk()
-            self.ui = BattleshipGUI(self.root)
+            self.ui = BattleshipGUI(self.root, board_size)
             self.ui.set_shot_callback(self._handle_player_shot)
+            # The computer thinks on a worker thread so clicks and redraws stay responsive
+            from concurrent.futures import ThreadPoolExecutor
+            self._thinker = ThreadPoolExecutor(max_workers=1)
+            self._pending_move = None  # Future of the move being picked
+        elif ui == "console":
+            from ..ui.console_ui import ConsoleUI
+            # script: stream of moves read instead of stdin; ansi: redraw only changed cells
+            self.ui = ConsoleUI(board_size, input=script, ansi=ansi)
         else:
-            self.ui = ConsoleUI()
+            self.ui = None
             
         self.current_phase = GamePhase.SETUP
         self.winner = None
 
+    def reset(self, rng=None, strategy: Optional[str] = None) -> None:
+        """Start over from setup, reusing the boards and, when it can reset, the AI
+
+        A new rng or strategy replaces the current one; the AI is rebuilt
+        only if the strategy changes or its AI has no reset().
+        """
+        if rng is not None:
+            self.rng = rng
+        strategy = strategy or self.strategy
+        self.player_board.reset()
+        self.computer_board.reset()
+        if strategy == self.strategy and hasattr(self.ai_player, "reset"):
+            self.ai_player.rng = self.rng
+            self.ai_player.reset()
+        else:
+            close_ai(self.ai_player)
+            self.strategy = strategy
+            self.ai_player = create_strategy(strategy, self.rng, self.board_size, self.ships)
+        self.current_phase = GamePhase.SETUP
+        self.winner = None
+
+    def close(self) -> None:
+        """Free what the computer's AI holds outside the heap"""
+        close_ai(self.ai_player)
+
+    def snapshot(self) -> bytes:
+        """Serialize boards, AI state and phase into a compact versioned snapshot"""
+        from .snapshot import dump_game
+        return dump_game(self)
+
+    def restore(self, data: bytes) -> None:
+        """Replace this game's state with a snapshot taken by snapshot()"""
+        from .snapshot import load_game
+        load_game(data, self)
+
     def run(self):
         """Main game loop"""
-        self.setup_game()
-        
-        if isinstance(self.ui, BattleshipGUI):
+        if self.ui is None:
+            self._headless_game()
+            return
+
+        if self.ui_mode == "gui":
+            self.setup_game()
             self._update_display()
             self.root.mainloop()
         else:
-            while self.current_phase == GamePhase.PLAYING:
-                self._console_game_loop()
+            try:
+                self.setup_game()
+                while self.current_phase == GamePhase.PLAYING:
+                    self._console_game_loop()
+            except EOFError:
+                # Scripted input ran out; interactive users sent end-of-file
+                self.ui.show_message("Input ended before the game did.")
+                self.ui.output.flush()
+                return
+            self.ui.display_boards(self.player_board, self.computer_board)
+            self.ui.show_game_over(self.winner)
+
+    def _console_game_loop(self):
+        """Play one round in the console: the player's shot, then the computer's"""
+        self.ui.display_boards(self.player_board, self.computer_board)
+        x, y = self.ui.get_shot_input()
+        if self.computer_board.has_shot(x, y):
+            self.ui.show_message("You already shot there! Try again.")
+            return
+
+        _, message = self.player_turn(x, y)
+        self.ui.show_message(message)
+        if self.current_phase != GamePhase.PLAYING:
+            return
+
+        _, message = self.computer_turn()
+        self.ui.show_message(message)
+
+    def _headless_game(self):
+        """Play a whole game with an AIPlayer on the player's side"""
+        player_ai = AIPlayer(self.rng, self.board_size, self.ships)
+        place_random_fleet(self.player_board, self.ships, self.rng)
+        self._setup_computer_ships()
+        self.current_phase = GamePhase.PLAYING
+        while self.current_phase == GamePhase.PLAYING:
+            x, y = player_ai.get_shot(self.computer_board)
+            result, _ = self.player_turn(x, y)
+            player_ai.process_shot_result(x, y, result.hit, self.computer_board.sunk_ship(result))
+            if self.current_phase == GamePhase.PLAYING:
+                self.computer_turn()
 
     def _update_display(self):
         """Update the GUI display"""
-        if isinstance(self.ui, BattleshipGUI):
+        if self.ui_mode == "gui":
             # Show player's board with ships visible
             self.ui.draw_board(self.ui.player_canvas, self.player_board, hide_ships=False)
             # Hide computer's ships, only show hits and misses
@@ -45,10 +151,10 @@ class GameState:
 
     def _handle_player_shot(self, x: int, y: int):
         """Handle a shot from the GUI"""
-        if self.current_phase != GamePhase.PLAYING:
+        if self.current_phase != GamePhase.PLAYING or self._pending_move is not None:
             return
             
-        if (x, y) in self.computer_board.shots:
+        if self.computer_board.has_shot(x, y):
             self.ui.show_message("You already shot there!")
             return
             
@@ -60,18 +166,27 @@ class GameState:
             self._update_display()
             return
             
-        # Computer's turn
-        hit, message = self.computer_turn()
+        # Computer's turn, picked off the Tk thread and applied once ready
+        self._update_display()
+        self._pending_move = self._thinker.submit(self.choose_computer_shot)
+        self.root.after(POLL_MS, self._poll_computer_move)
+
+    def _poll_computer_move(self):
+        """Apply the computer's move once its worker thread has picked it"""
+        if not self._pending_move.done():
+            self.root.after(POLL_MS, self._poll_computer_move)
+            return
+        move, self._pending_move = self._pending_move, None
+        hit, message = self.apply_computer_shot(*move.result())
+        self._update_display()
         if message:
             self.ui.show_message(message)
-            
-        self._update_display()
 
     def setup_game(self):
         """Handle game setup phase"""
         # Player ship placement
-        for ship_name, length in SHIPS.items():
-            if isinstance(self.ui, ConsoleUI):
+        for ship_name, length in self.ships.items():
+            if self.ui_mode == "console":
                 self.ui.display_boards(self.player_board, self.computer_board)
             else:
                 self._update_display()
@@ -87,50 +202,46 @@ class GameState:
         self._setup_computer_ships()
         self.current_phase = GamePhase.PLAYING
 
-    def player_turn(self, x: int, y: int) -> Tuple[bool, Optional[str]]:
+    def player_turn(self, x: int, y: int) -> Tuple[ShotResult, Optional[str]]:
         """Handle player's turn"""
-        if (x, y) in self.computer_board.shots:
-            return False, "You already shot there! Try again."
+        if self.computer_board.has_shot(x, y):
+            return INVALID_SHOT, "You already shot there! Try again."
 
-        hit = self.computer_board.receive_shot(x, y)
-        if hit:
-            message = "Hit!"
+        result = self.computer_board.receive_shot(x, y)
+        if result.sunk:
             if self.computer_board.all_ships_sunk():
                 self.current_phase = GamePhase.GAME_OVER
                 self.winner = "Player"
-                return True, "You win!"
+                return result, "You win!"
+            message = f"You sank the {self.computer_board.ships[result.ship].name}!"
         else:
-            message = "Miss!"
-        return hit, message
+            message = "Hit!" if result else "Miss!"
+        return result, message
 
-    def computer_turn(self) -> Tuple[bool, Optional[str]]:
+    def computer_turn(self) -> Tuple[ShotResult, Optional[str]]:
         """Handle computer's turn"""
-        x, y = self.ai_player.get_shot(self.player_board)
-        hit = self.player_board.receive_shot(x, y)
-        self.ai_player.process_shot_result(x, y, hit)
-        
-        if hit:
-            message = "Computer hit your ship!"
+        return self.apply_computer_shot(*self.choose_computer_shot())
+
+    def choose_computer_shot(self) -> Tuple[int, int]:
+        """Pick the computer's next shot within its move budget, without firing it"""
+        return choose_shot(self.strategy, self.ai_player, self.player_board, self.move_budget)
+
+    def apply_computer_shot(self, x: int, y: int) -> Tuple[ShotResult, Optional[str]]:
+        """Fire the computer's chosen shot and report the result"""
+        result = self.player_board.receive_shot(x, y)
+        sunk = self.player_board.sunk_ship(result)
+        self.ai_player.process_shot_result(x, y, result.hit, sunk)
+
+        if sunk is not None:
             if self.player_board.all_ships_sunk():
                 self.current_phase = GamePhase.GAME_OVER
                 self.winner = "Computer"
-                return True, "Computer wins!"
+                return result, "Computer wins!"
+            message = f"Computer sank your {sunk.name}!"
         else:
-            message = "Computer missed!"
-        return hit, message
+            message = "Computer hit your ship!" if result else "Computer missed!"
+        return result, message
 
     def _setup_computer_ships(self):
         """Place computer ships randomly"""
-        from random import choice
-        for ship_name, length in SHIPS.items():
-            while True:
-                # Get all valid placements for this ship
-                valid_placements = self.computer_board.get_valid_ship_placements(length)
-                if not valid_placements:
-                    continue
-                    
-                # Choose a random valid placement
-                coordinates = choice(valid_placements)
-                ship = Ship(ship_name, length, coordinates)
-                if self.computer_board.place_ship(ship):
-                    break
+        place_random_fleet(self.computer_board, self.ships, self.rng)
@@ -0,0 +1,223 @@
+"""Monte Carlo layout-sampling AI.
+
+Samples fleet layouts consistent with everything observed so far (misses,
+open hits and sunk ships) and fires at the unknown cell occupied most often.
+Each sample first covers the lowest uncovered hit with a random ship
+placement that fits, until every open hit is covered (so the constraint is
+propagated instead of rejected afterwards), then drops the remaining ships on
+random legal placements, rejecting the sample at a dead end. Every layout is
+reached by exactly one sequence of choices, so weighting a sample by the
+number of options at each choice makes the estimate match a uniform draw over
+consistent layouts.
+
+The observation lives in a shared-memory block, one byte per cell, that the
+AI updates in place after every shot. Sample batches fan out to a process
+pool whose workers attach to the block by name, so only a few integers are
+pickled per batch. Batch seeds come from the AI's own generator and the
+batch split does not depend on the worker count, so moves are reproducible
+whatever the pool size.
+"""
+import atexit
+import os
+import random
+import weakref
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from math import factorial
+from multiprocessing.shared_memory import SharedMemory
+from random import Random
+from typing import Dict, Iterator, List, Optional, Tuple
+from .board import Board, placement_table
+from .ship import Ship
+from ..constants import BOARD_SIZE, SHIPS
+
+# Cell states in the shared observation block
+UNKNOWN = 0
+MISS = 1
+HIT = 2   # Hit on a ship not sunk yet
+SUNK = 3
+
+ROUNDS = 8    # Improving answers yielded per move by iter_shots
+BATCHES = 8   # Sample batches per round, spread over the workers
+
+@lru_cache(maxsize=None)
+def _state_table(*states: int) -> bytes:
+    """bytes.translate table mapping the given cell states to b'1', others to b'0'"""
+    return bytes(ord("1") if value in states else ord("0") for value in range(256))
+
+def _state_mask(cells: bytes, *states: int) -> int:
+    return int(cells.translate(_state_table(*states))[::-1], 2)
+
+def sample_counts(cells: bytes, size: int, lengths: Tuple[int, ...], samples: int,
+                  seed: int) -> Tuple[float, List[float]]:
+    """Draw weighted layouts consistent with an observation
+
+    Returns the total sample weight and the weighted occupancy of every cell.
+    """
+    rng = Random(seed)
+    shots = _state_mask(cells, MISS, HIT, SUNK)
+    blocked = _state_mask(cells, MISS, SUNK)
+    hits = _state_mask(cells, HIT)
+    unknown = ~shots & ((1 << size * size) - 1)
+    # A fully hit ship would have been announced as sunk, so every placement needs an unknown cell
+    tables = {length: [mask for mask, _ in placement_table(size, length)
+                       if not mask & blocked and mask & unknown]
+              for length in set(lengths)}
+    cover: Dict[int, List[Tuple[int, int]]] = {}
+    remaining_hits = hits
+    while remaining_hits:
+        low = remaining_hits & -remaining_hits
+        remaining_hits ^= low
+        cover[low] = [(length, mask) for length, masks in tables.items() for mask in masks if mask & low]
+
+    counts = [0.0] * (size * size)
+    total = 0.0
+    for _ in range(samples):
+        remaining = list(lengths)
+        occupied = 0
+        weight = 1.0
+        uncovered = hits
+        while uncovered:
+            low = uncovered & -uncovered
+            options = [(length, mask) for length, mask in cover[low]
+                       if not mask & occupied and length in remaining]
+            if not options:
+                break
+            length, mask = rng.choice(options)
+            weight *= len(options)
+            remaining.remove(length)
+            occupied |= mask
+            uncovered &= ~mask
+        if uncovered:
+            continue
+
+        for length in sorted(remaining):
+            options = [mask for mask in tables[length] if not mask & occupied]
+            if not options:
+                break
+            occupied |= rng.choice(options)
+            weight *= len(options)
+        else:
+            # Equal-length ships placed freely can arrive in any order
+            for count in Counter(remaining).values():
+                weight /= factorial(count)
+            total += weight
+            free = occupied & unknown
+            while free:
+                low = free & -free
+                counts[low.bit_length() - 1] += weight
+                free ^= low
+    return total, counts
+
+# Worker-side attachments to observation blocks, most recent last
+_ATTACHED: Dict[str, SharedMemory] = {}
+_MAX_ATTACHED = 32
+
+def _sample_shared(name: str, size: int, lengths: Tuple[int, ...], samples: int,
+                   seed: int) -> Tuple[float, List[float]]:
+    """Worker entry point: sample against the observation block called name"""
+    memory = _ATTACHED.pop(name, None)
+    if memory is None:
+        memory = SharedMemory(name)
+        if len(_ATTACHED) >= _MAX_ATTACHED:
+            _ATTACHED.pop(next(iter(_ATTACHED))).close()
+    _ATTACHED[name] = memory
+    return sample_counts(bytes(memory.buf[:size * size]), size, lengths, samples, seed)
+
+_POOLS: Dict[int, ProcessPoolExecutor] = {}
+
+def _pool(workers: int) -> ProcessPoolExecutor:
+    """Process pool shared by every Monte Carlo AI with this worker count"""
+    pool = _POOLS.get(workers)
+    if pool is None:
+        pool = _POOLS[workers] = ProcessPoolExecutor(max_workers=workers)
+    return pool
+
+@atexit.register
+def _shutdown_pools() -> None:
+    for pool in _POOLS.values():
+        pool.shutdown(cancel_futures=True)
+    _POOLS.clear()
+
+def _release(memory: SharedMemory) -> None:
+    memory.close()
+    memory.unlink()
+
+class MonteCarloAIPlayer:
+    """Fires at the cell most often occupied in sampled consistent layouts
+
+    workers defaults to the CPU count; with one worker, sampling runs in
+    process and no pool is started. Each AI owns a shared-memory block until
+    close(), or the end of a with block.
+    """
+
+    def __init__(self, rng=random, size: int = BOARD_SIZE, ships: Dict[str, int] = SHIPS,
+                 samples: int = 2000, workers: Optional[int] = None):
+        self.rng = rng
+        self.size = size
+        self.samples = samples
+        self.workers = workers or os.cpu_count() or 1
+        self.remaining = Counter(ships.values())  # Ship length -> ships afloat
+        self._memory = SharedMemory(create=True, size=size * size)
+        self._finalizer = weakref.finalize(self, _release, self._memory)
+
+    def close(self) -> None:
+        """Free the shared observation block"""
+        self._finalizer()
+
+    def __enter__(self) -> "MonteCarloAIPlayer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def get_shot(self, board: Board) -> Tuple[int, int]:
+        """Get the next shot coordinates"""
+        for move in self.iter_shots(board):
+            pass
+        return move
+
+    def iter_shots(self, board: Board) -> Iterator[Tuple[int, int]]:
+        """Yield the best shot after each round of sampling"""
+        cells = self.size * self.size
+        lengths = tuple(self.remaining.elements())
+        batch = max(1, -(-self.samples // (ROUNDS * BATCHES)))
+        counts = [0.0] * cells
+        weight = 0.0
+        for _ in range(ROUNDS):
+            seeds = [self.rng.getrandbits(64) for _ in range(BATCHES)]
+            if self.workers > 1:
+                pool = _pool(self.workers)
+                futures = [pool.submit(_sample_shared, self._memory.name, self.size, lengths, batch, seed)
+                           for seed in seeds]
+                results = [future.result() for future in futures]
+            else:
+                state = bytes(self._memory.buf[:cells])
+                results = [sample_counts(state, self.size, lengths, batch, seed) for seed in seeds]
+            for batch_weight, batch_counts in results:
+                weight += batch_weight
+                counts = [total + count for total, count in zip(counts, batch_counts)]
+            yield self._best(counts if weight else None)
+
+    def _best(self, counts: Optional[List[float]]) -> Tuple[int, int]:
+        """Most occupied unknown cell, ties broken at random; any unknown cell without samples"""
+        state = self._memory.buf
+        if counts is None:
+            choices = [cell for cell in range(self.size * self.size) if state[cell] == UNKNOWN]
+        else:
+            best = max(count for cell, count in enumerate(counts) if state[cell] == UNKNOWN)
+            choices = [cell for cell, count in enumerate(counts) if count == best and state[cell] == UNKNOWN]
+        cell = choices[0] if len(choices) == 1 else self.rng.choice(choices)
+        return cell % self.size, cell // self.size
+
+    def process_shot_result(self, x: int, y: int, hit: bool, sunk: Optional[Ship] = None) -> None:
+        """Process the result of the last shot (`sunk` is the ship it sank, if any)"""
+        state = self._memory.buf
+        state[y * self.size + x] = HIT if hit else MISS
+        if sunk is not None:
+            for sunk_x, sunk_y in sunk.coordinates:
+                state[sunk_y * self.size + sunk_x] = SUNK
+            self.remaining[sunk.length] -= 1
+            if not self.remaining[sunk.length]:
+                del self.remaining[sunk.length]
@@ -0,0 +1,151 @@
+"""Opening book for DensityAIPlayer.
+
+With ties broken towards the lowest cell, DensityAIPlayer's move depends
+only on the results of its earlier shots, so its first moves form a binary
+tree: after k shots with hit/miss results r0..r(k-1) (bit i set for a hit)
+the next shot is fixed. The book stores that tree for the first `depth`
+shots as a flat array in heap order, the entry for prefix (k, bits) sitting
+at (1 << k) - 1 + bits, so a lookup is a single index. The tree only
+branches on hit or miss: the builder never sinks a ship, and the AI leaves
+the book at the first sink and computes every later move live. NO_MOVE marks
+prefixes no fleet layout can produce and prefixes with no open cell left.
+
+Live play breaks density ties at random, so the book is one fixed line
+through those ties: every book move scores as high as any move the AI could
+have played, but an AI in book opens the same way every game.
+
+File layout, little-endian:
+
+    header   magic "BSOB", version u8, cell width u8, board size u16,
+             depth u8, ship count u16, then one u16 length per ship
+    entries  (2 ** (depth + 1) - 1) cells, NO_MOVE (all bits set) if absent
+
+Build the bundled book for the default fleet with
+
+    python -m src.game.opening_book --depth 12
+"""
+import mmap
+import struct
+import sys
+from array import array
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from .record import from_le_bytes, to_le_bytes
+from ..constants import BOARD_SIZE, SHIPS
+
+MAGIC = b"BSOB"
+VERSION = 1
+HEADER = struct.Struct("<4sBBHBH")
+
+DEFAULT_DEPTH = 12
+DEFAULT_BOOK = Path(__file__).with_name("opening_book.bsob")
+
+def _typecode(size: int) -> str:
+    """Narrowest typecode holding every cell index plus the NO_MOVE sentinel"""
+    cells = size * size
+    return "B" if cells < 0xFF else "H" if cells < 0xFFFF else "I"
+
+class _FirstChoice:
+    """Stand-in random generator that always breaks ties towards the lowest cell"""
+
+    @staticmethod
+    def choice(sequence):
+        return min(sequence)
+
+def _book_move(ai) -> int:
+    """The cell the book plays for an AI's current state (lowest cell among ties)"""
+    rng, ai.rng = ai.rng, _FirstChoice
+    try:
+        x, y = ai.get_shot(None)
+    finally:
+        ai.rng = rng
+    return y * ai.size + x
+
+def build_book(size: int = BOARD_SIZE, ships: Dict[str, int] = SHIPS,
+               depth: int = DEFAULT_DEPTH) -> array:
+    """Play out every hit/miss prefix of up to `depth` shots; returns the heap-ordered entries"""
+    from .density import DensityAIPlayer
+
+    typecode = _typecode(size)
+    no_move = (1 << 8 * array(typecode).itemsize) - 1
+    entries = array(typecode, [no_move]) * ((1 << depth + 1) - 1)
+    # Each frontier entry: (bits, cells shot so far); the AI is rebuilt by replay
+    frontier: List[Tuple[int, Tuple[int, ...]]] = [(0, ())]
+    for k in range(depth):
+        next_frontier = []
+        for bits, cells in frontier:
+            ai = DensityAIPlayer(_FirstChoice, size, ships, opening_book=False)
+            for shot, cell in enumerate(cells):
+                ai.process_shot_result(cell % size, cell // size, bool(bits >> shot & 1))
+            if all(ai.shot) or not any(ai.density):
+                continue
+            cell = _book_move(ai)
+            entries[(1 << k) - 1 + bits] = cell
+            for hit in (0, 1):
+                next_frontier.append((bits | hit << k, cells + (cell,)))
+        frontier = next_frontier
+    return entries
+
+def write_book(path, entries: array, size: int = BOARD_SIZE, ships: Dict[str, int] = SHIPS) -> None:
+    depth = (len(entries) + 1).bit_length() - 2
+    lengths = list(ships.values())
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, entries.itemsize, size, depth, len(lengths)))
+        file.write(struct.pack(f"<{len(lengths)}H", *lengths))
+        file.write(to_le_bytes(entries))
+
+class OpeningBook:
+    """Memory-mapped opening book"""
+
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, width, size, depth, count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} opening book")
+        self.size = size
+        self.depth = depth
+        self.lengths = list(struct.unpack_from(f"<{count}H", self._map, HEADER.size))
+        typecode = _typecode(size)
+        if array(typecode).itemsize != width:
+            raise ValueError(f"{path} has an invalid cell width")
+        self.no_move = (1 << 8 * width) - 1
+        start = HEADER.size + 2 * count
+        data = memoryview(self._map)[start:start + width * ((1 << depth + 1) - 1)]
+        self._entries = data.cast(typecode) if sys.byteorder == "little" else from_le_bytes(typecode, data)
+
+    def matches(self, size: int, ships: Dict[str, int]) -> bool:
+        """Whether the book was built for this board size and fleet"""
+        return self.size == size and self.lengths == list(ships.values())
+
+    def lookup(self, shots: int, results: int) -> Optional[int]:
+        """Book cell after `shots` shots whose hits are the set bits of `results`"""
+        if shots >= self.depth:
+            return None
+        cell = self._entries[(1 << shots) - 1 + results]
+        return None if cell == self.no_move else cell
+
+@lru_cache(maxsize=None)
+def _load_default() -> Optional[OpeningBook]:
+    return OpeningBook(DEFAULT_BOOK) if DEFAULT_BOOK.exists() else None
+
+def default_book(size: int, ships: Dict[str, int]) -> Optional[OpeningBook]:
+    """The bundled book, if it was built for this board size and fleet"""
+    book = _load_default()
+    return book if book is not None and book.matches(size, ships) else None
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Build the DensityAIPlayer opening book")
+    parser.add_argument("--depth", type=int, default=DEFAULT_DEPTH, help="shots covered by the book")
+    parser.add_argument("--size", type=int, default=BOARD_SIZE)
+    parser.add_argument("--output", type=Path, default=DEFAULT_BOOK)
+    args = parser.parse_args()
+    entries = build_book(args.size, SHIPS, args.depth)
+    write_book(args.output, entries, args.size, SHIPS)
+    covered = sum(1 for cell in entries if cell != (1 << 8 * entries.itemsize) - 1)
+    print(f"Wrote {covered} positions ({args.output.stat().st_size} bytes) to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,11 @@
-from typing import List, Tuple, Optional, Set
-from random import randint
+from array import array
+from functools import lru_cache
+from typing import Dict, List, Tuple, Optional, Set
+import random
 from enum import Enum
 from .board import Board
-from ..constants import BOARD_SIZE
+from .ship import Ship
+from ..constants import BOARD_SIZE, SHIPS
 
 class Direction(Enum):
     NORTH = (0, -1)
@@ -10,15 +13,40 @@ class Direction(Enum):
     SOUTH = (0, 1)
     WEST = (-1, 0)
 
+@lru_cache(maxsize=None)
+def _all_cells(size: int) -> array:
+    """Every cell index in order, copied into the open-cell pool on reset"""
+    return array("i", range(size * size))
+
 class AIPlayer:
-    def __init__(self):
-        self.shots: Set[Tuple[int, int]] = set()
+    __slots__ = ("rng", "size", "_open", "_slot", "_open_count", "hits", "hunt_mode",
+                 "last_hit", "first_hit", "current_direction", "potential_directions")
+
+    def __init__(self, rng=random, size: int = BOARD_SIZE, ships: Dict[str, int] = SHIPS):
+        self.rng = rng
+        self.size = size
+        # ships is only taken for the strategy factory signature: hunting fires at any open cell
+        # Cells not fired at yet, kept dense for O(1) random picks and removals.
+        # Closed cells collect at the tail, most recently closed first, so a cell
+        # has been fired at exactly when its slot is at or past _open_count.
+        self._open = array("i", _all_cells(size))
+        self._slot = array("i", _all_cells(size))
         self.hits: List[Tuple[int, int]] = []
+        self.potential_directions: List[Direction] = []
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget everything about the current game, reusing the same containers"""
+        cells = _all_cells(self.size)
+        self._open[:] = cells
+        self._slot[:] = cells
+        self._open_count = len(cells)
+        self.hits.clear()
         self.hunt_mode = False
         self.last_hit: Optional[Tuple[int, int]] = None
-        self.first_hit = 0
+        self.first_hit: Optional[Tuple[int, int]] = None
         self.current_direction: Optional[Direction] = None
-        self.potential_directions: List[Direction] = []
+        self.potential_directions.clear()
 
     def get_shot(self, board: Board) -> Tuple[int, int]:
         """Get the next shot coordinates"""
@@ -26,33 +54,70 @@ class AIPlayer:
             return self._random_shot()
         return self._targeted_shot()
 
-    def process_shot_result(self, x: int, y: int, hit: bool) -> None:
-        """Process the result of the last shot"""
-        self.shots.add((x, y))
-        
-        if hit:
+    def process_shot_result(self, x: int, y: int, hit: bool, sunk: Optional[Ship] = None) -> None:
+        """Process the result of the last shot (`sunk` is the ship it sank, if any)"""
+        self.mark_shot(x, y)
+
+        if sunk is not None:
+            # Hits on other ships stay open and are hunted next
+            sunk_cells = set(sunk.coordinates)
+            self.hits = [cell for cell in self.hits if cell not in sunk_cells]
+            self.current_direction = None
+            if self.hits:
+                self._target(self.hits[0])
+            else:
+                self.hunt_mode = False
+                self.first_hit = self.last_hit = None
+                self.potential_directions = []
+        elif hit:
             self.hits.append((x, y))
-            self.hunt_mode = True
-            self.last_hit = (x, y)
-            
-            if len(self.hits) == 1:  # First hit on a ship
-                self.potential_directions = list(Direction)
-                self.last_hit = self.first_hit    #Move the pointer to the first_hit
-                if self.potential_directions:
-                    self.potential_directions.pop()   #Skip one direction 
-
-        else:
-            if self.hunt_mode and self.current_direction:
-                # Miss while hunting - try next direction
-                self.current_direction = None
+            if self.first_hit is None:  # First hit on a ship
+                self._target((x, y))
+            else:
+                self.last_hit = (x, y)
+        elif self.hunt_mode and self.current_direction:
+            # Miss while hunting - walk the other way from the first hit
+            self.current_direction = None
+            self.last_hit = self.first_hit
+
+    def _target(self, cell: Tuple[int, int]) -> None:
+        """Start hunting outwards from a hit in every direction"""
+        self.hunt_mode = True
+        self.first_hit = self.last_hit = cell
+        self.potential_directions = list(Direction)
+
+    def mark_shot(self, x: int, y: int) -> None:
+        """Record that a cell has been fired at"""
+        cell = y * self.size + x
+        if self._slot[cell] < self._open_count:
+            self._close_cell(cell)
+
+    def has_shot(self, position: Tuple[int, int]) -> bool:
+        """Whether a cell has been fired at, read off the open-cell pool"""
+        x, y = position
+        return self._slot[y * self.size + x] >= self._open_count
+
+    @property
+    def shots(self) -> Set[Tuple[int, int]]:
+        """Cells fired at"""
+        return set(self.shot_order())
+
+    def shot_order(self) -> List[Tuple[int, int]]:
+        """Cells fired at, oldest first"""
+        closed = self._open[self._open_count:]
+        return [(cell % self.size, cell // self.size) for cell in reversed(closed)]
 
     def _random_shot(self) -> Tuple[int, int]:
         """Get a random valid shot position"""
-        while True:
-            x = randint(0, BOARD_SIZE - 1)
-            y = randint(0, BOARD_SIZE - 1)
-            if (x, y) not in self.shots:
-                return x, y
+        cell = self._open[self.rng.randrange(self._open_count)]
+        return cell % self.size, cell // self.size
+
+    def _close_cell(self, cell: int) -> None:
+        """Remove a cell from the open pool by swapping it with the last open cell"""
+        self._open_count -= 1
+        slot, last = self._slot[cell], self._open[self._open_count]
+        self._open[slot], self._slot[last] = last, slot
+        self._open[self._open_count], self._slot[cell] = cell, self._open_count
 
     def _targeted_shot(self) -> Tuple[int, int]:
         """Get a targeted shot when hunting a ship"""
@@ -64,23 +129,29 @@ class AIPlayer:
             while self.potential_directions:
                 direction = self.potential_directions.pop()
                 next_shot = self._get_next_position(self.last_hit, direction)
-                if next_shot and next_shot not in self.shots:
+                if next_shot and not self.has_shot(next_shot):
                     self.current_direction = direction
                     return next_shot
 
-            # If we've tried all directions around last hit,
-            # try around a different hit point or go back to random
+            # Every direction around this hit is used up: move on to an open
+            # hit that still has an unshot neighbour, or go back to random
+            for cell in self.hits:
+                if any(position is not None and not self.has_shot(position)
+                       for position in (self._get_next_position(cell, direction) for direction in Direction)):
+                    self._target(cell)
+                    return self._targeted_shot()
             self.hunt_mode = False
+            self.first_hit = self.last_hit = None
             return self._random_shot()
 
         # Continue in current direction
         next_shot = self._get_next_position(self.last_hit, self.current_direction)
-        if next_shot and next_shot not in self.shots:
+        if next_shot and not self.has_shot(next_shot):
             return next_shot
 
-        # If we can't continue in current direction, try opposite direction from first hit
+        # If we can't continue in current direction, try the other directions from the first hit
         self.current_direction = None
-        self.hits.clear() #The ship is sunk
+        self.last_hit = self.first_hit
         return self._targeted_shot()
 
     def _get_next_position(self, pos: Tuple[int, int], direction: Direction) -> Optional[Tuple[int, int]]:
@@ -89,6 +160,6 @@ class AIPlayer:
         dx, dy = direction.value
         new_x, new_y = x + dx, y + dy
         
-        if 0 <= new_x < BOARD_SIZE and 0 <= new_y < BOARD_SIZE:
+        if 0 <= new_x < self.size and 0 <= new_y < self.size:
             return new_x, new_y
         return None
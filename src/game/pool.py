@@ -0,0 +1,52 @@
+"""Pool of headless matches for reuse.
+
+A finished match's GameState still holds two boards and an AI sized for
+the game, so rather than dropping it for the garbage collector, a
+long-running server or simulation loop releases it here and acquires it
+back, reset in place, for the next match.
+"""
+from typing import Dict, List, Optional
+from .game_state import GameState
+from .strategies import DEFAULT_STRATEGY
+from ..constants import BOARD_SIZE, SHIPS
+
+class MatchPool:
+    """Recycles headless GameStates of one board size and fleet
+
+    At most max_idle released games are kept; further releases are closed
+    and left to the garbage collector.
+    """
+
+    def __init__(self, board_size: int = BOARD_SIZE, ships: Dict[str, int] = SHIPS,
+                 max_idle: int = 1024):
+        self.board_size = board_size
+        self.ships = ships
+        self.max_idle = max_idle
+        self._idle: List[GameState] = []
+        self.created = 0   # Games built because the pool was empty
+        self.reused = 0    # Games handed out again after a reset
+
+    def __len__(self) -> int:
+        return len(self._idle)
+
+    def acquire(self, rng, strategy: str = DEFAULT_STRATEGY,
+                move_budget: Optional[float] = None) -> GameState:
+        """A headless game in its setup phase, as GameState(ui="none", ...) would build it"""
+        if not self._idle:
+            self.created += 1
+            return GameState(ui="none", board_size=self.board_size, ships=self.ships,
+                             rng=rng, strategy=strategy, move_budget=move_budget)
+        game = self._idle.pop()
+        game.reset(rng, strategy)
+        game.move_budget = move_budget
+        self.reused += 1
+        return game
+
+    def release(self, game: GameState) -> None:
+        """Return a game the caller no longer uses"""
+        if game.ui is not None or game.board_size != self.board_size or game.ships != self.ships:
+            raise ValueError("Only headless games of the pool's board size and fleet can be released")
+        if len(self._idle) < self.max_idle:
+            self._idle.append(game)
+        else:
+            game.close()
@@ -0,0 +1,277 @@
+"""Compact binary game records.
+
+A record file is a file header followed by one record per game and, once the
+writer is closed, an index of record offsets:
+
+    file header   magic "BSGR", version, cell width, board size, ship count,
+                  then one u16 length per ship in fleet order
+    record        seed u64, winner u8 (0 = unfinished, 1 = A, 2 = B),
+                  shot counts of A and B (u32 each), both fleets, then A's
+                  shots followed by B's shots
+    fleet         start cell of every ship, then one orientation bit per ship
+                  (set = vertical)
+    index footer  u64 record offsets, then count u64, index offset u64, "BSGI"
+
+Cells are stored as y * size + x in the narrowest of 1, 2 or 4 bytes that fits
+the board, all little-endian. A shoots first, so the full shot sequence is
+A0, B0, A1, B1, ... and any turn can be replayed without extra bookkeeping.
+Files whose writer never closed have no index; the reader rebuilds it by
+hopping over record headers.
+"""
+import mmap
+import struct
+import sys
+from array import array
+from dataclasses import dataclass
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+from .board import Board
+from .ship import Ship
+from ..constants import BOARD_SIZE, SHIPS
+
+MAGIC = b"BSGR"
+INDEX_MAGIC = b"BSGI"
+VERSION = 1
+
+FILE_HEADER = struct.Struct("<4sBBHH")
+RECORD_HEADER = struct.Struct("<QBII")
+INDEX_FOOTER = struct.Struct("<QQ4s")
+
+_WINNERS = {None: 0, "A": 1, "B": 2}
+_WINNER_NAMES = {code: name for name, code in _WINNERS.items()}
+
+Coordinates = List[Tuple[int, int]]
+
+@dataclass
+class GameRecord:
+    seed: int
+    winner: Optional[str]     # "A", "B" or None
+    fleet_a: List[Coordinates]  # Ship coordinates of A's board, in fleet order
+    fleet_b: List[Coordinates]
+    shots_a: Coordinates      # Shots fired by A (at B's board), in order
+    shots_b: Coordinates
+
+    @property
+    def turns(self) -> int:
+        return len(self.shots_a) + len(self.shots_b)
+
+    @classmethod
+    def from_boards(cls, seed: int, winner: Optional[str], board_a: Board, board_b: Board) -> "GameRecord":
+        """Build a record from the final boards of a game (A fires at board_b)"""
+        return cls(seed, winner,
+                   [ship.coordinates for ship in board_a.ships],
+                   [ship.coordinates for ship in board_b.ships],
+                   list(board_b.shots), list(board_a.shots))
+
+def cell_typecode(size: int) -> str:
+    """Narrowest array typecode that can hold every cell index of the board"""
+    cells = size * size
+    return "B" if cells <= 1 << 8 else "H" if cells <= 1 << 16 else "I"
+
+def to_le_bytes(values: array) -> bytes:
+    """Serialize an array as little-endian bytes"""
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+def from_le_bytes(typecode: str, data) -> array:
+    """Deserialize little-endian bytes into an array"""
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+class FleetLayout:
+    """Sizes and fixed-width codecs for fleets and shots, shared by record and corpus files"""
+
+    def __init__(self, size: int, lengths: List[int]):
+        self.size = size
+        self.lengths = lengths
+        self.typecode = cell_typecode(size)
+        self.cell_width = array(self.typecode).itemsize
+        self.fleet_bytes = len(lengths) * self.cell_width + (len(lengths) + 7) // 8
+
+    def header(self) -> bytes:
+        return (FILE_HEADER.pack(MAGIC, VERSION, self.cell_width, self.size, len(self.lengths))
+                + struct.pack(f"<{len(self.lengths)}H", *self.lengths))
+
+    def encode_fleet(self, fleet: List[Coordinates]) -> bytes:
+        if [len(coordinates) for coordinates in fleet] != self.lengths:
+            raise ValueError("Fleet does not match the record file's ship lengths")
+        starts = array(self.typecode)
+        vertical = 0
+        for index, coordinates in enumerate(fleet):
+            x, y = min(coordinates)
+            cells = sorted(coordinates)
+            if cells == [(x, y + i) for i in range(len(cells))] and len(cells) > 1:
+                vertical |= 1 << index
+            elif cells != [(x + i, y) for i in range(len(cells))]:
+                raise ValueError(f"Ship {index} is not a straight line of adjacent cells")
+            starts.append(y * self.size + x)
+        return to_le_bytes(starts) + vertical.to_bytes((len(self.lengths) + 7) // 8, "little")
+
+    def decode_fleet(self, data) -> List[Coordinates]:
+        count = len(self.lengths)
+        starts = from_le_bytes(self.typecode, data[:count * self.cell_width])
+        vertical = int.from_bytes(data[count * self.cell_width:self.fleet_bytes], "little")
+        fleet = []
+        for index, (start, length) in enumerate(zip(starts, self.lengths)):
+            x, y = start % self.size, start // self.size
+            if vertical >> index & 1:
+                fleet.append([(x, y + i) for i in range(length)])
+            else:
+                fleet.append([(x + i, y) for i in range(length)])
+        return fleet
+
+    def encode_shots(self, shots: Coordinates) -> bytes:
+        return to_le_bytes(array(self.typecode, (y * self.size + x for x, y in shots)))
+
+    def decode_shots(self, data) -> Coordinates:
+        return [(cell % self.size, cell // self.size) for cell in from_le_bytes(self.typecode, data)]
+
+class GameRecordWriter:
+    """Streams game records to a file; close() appends the offset index"""
+
+    def __init__(self, path: str, size: int = BOARD_SIZE, ships: Dict[str, int] = SHIPS):
+        self._layout = FleetLayout(size, list(ships.values()))
+        self._file: BinaryIO = open(path, "wb")
+        self._file.write(self._layout.header())
+        self._offsets = array("Q")
+
+    def write(self, record: GameRecord) -> None:
+        layout = self._layout
+        self._offsets.append(self._file.tell())
+        self._file.write(RECORD_HEADER.pack(record.seed, _WINNERS[record.winner],
+                                            len(record.shots_a), len(record.shots_b)))
+        self._file.write(layout.encode_fleet(record.fleet_a))
+        self._file.write(layout.encode_fleet(record.fleet_b))
+        self._file.write(layout.encode_shots(record.shots_a))
+        self._file.write(layout.encode_shots(record.shots_b))
+
+    def write_game(self, result, board_a: Board, board_b: Board) -> None:
+        """Record a finished simulation game (a GameResult plus its final boards)"""
+        self.write(GameRecord.from_boards(result.seed, result.winner, board_a, board_b))
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        index_offset = self._file.tell()
+        self._file.write(to_le_bytes(self._offsets))
+        self._file.write(INDEX_FOOTER.pack(len(self._offsets), index_offset, INDEX_MAGIC))
+        self._file.close()
+
+    def __enter__(self) -> "GameRecordWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+class GameRecordReader:
+    """Memory-mapped access to a record file: iterate, index, or replay games"""
+
+    def __init__(self, path: str):
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, cell_width, size, count = FILE_HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} game record file")
+        lengths = list(struct.unpack_from(f"<{count}H", self._map, FILE_HEADER.size))
+        self._layout = FleetLayout(size, lengths)
+        if self._layout.cell_width != cell_width:
+            raise ValueError(f"{path} has an invalid cell width")
+        self.size = size
+        self.lengths = lengths
+        self._data_start = FILE_HEADER.size + 2 * count
+        self._offsets = self._read_index()
+
+    def _read_index(self):
+        """Offsets from the footer index (zero-copy), or rebuilt by scanning"""
+        if len(self._map) >= self._data_start + INDEX_FOOTER.size:
+            footer = len(self._map) - INDEX_FOOTER.size
+            count, index_offset, magic = INDEX_FOOTER.unpack_from(self._map, footer)
+            if magic == INDEX_MAGIC:
+                data = memoryview(self._map)[index_offset:index_offset + 8 * count]
+                if sys.byteorder == "little":
+                    return data.cast("Q")
+                offsets = from_le_bytes("Q", data)
+                data.release()
+                return offsets
+
+        offsets = array("Q")
+        position, end = self._data_start, len(self._map)
+        while position + RECORD_HEADER.size <= end:
+            _, _, shots_a, shots_b = RECORD_HEADER.unpack_from(self._map, position)
+            size = self._record_size(shots_a, shots_b)
+            if position + size > end:
+                break  # Truncated final record
+            offsets.append(position)
+            position += size
+        return offsets
+
+    def _record_size(self, shots_a: int, shots_b: int) -> int:
+        layout = self._layout
+        return RECORD_HEADER.size + 2 * layout.fleet_bytes + (shots_a + shots_b) * layout.cell_width
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, index: int) -> GameRecord:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("game record index out of range")
+        return self._decode(self._offsets[index])
+
+    def __iter__(self) -> Iterator[GameRecord]:
+        for index in range(len(self)):
+            yield self._decode(self._offsets[index])
+
+    def _decode(self, offset: int) -> GameRecord:
+        layout = self._layout
+        seed, winner, shots_a, shots_b = RECORD_HEADER.unpack_from(self._map, offset)
+        position = offset + RECORD_HEADER.size
+        fleet_a = layout.decode_fleet(self._map[position:position + layout.fleet_bytes])
+        position += layout.fleet_bytes
+        fleet_b = layout.decode_fleet(self._map[position:position + layout.fleet_bytes])
+        position += layout.fleet_bytes
+        split = position + shots_a * layout.cell_width
+        end = split + shots_b * layout.cell_width
+        return GameRecord(seed, _WINNER_NAMES[winner], fleet_a, fleet_b,
+                          layout.decode_shots(self._map[position:split]),
+                          layout.decode_shots(self._map[split:end]))
+
+    def boards_at(self, index: int, turn: Optional[int] = None,
+                  ships: Dict[str, int] = SHIPS) -> Tuple[Board, Board]:
+        """Rebuild the boards of A and B after the first `turn` shots (default: all)
+
+        `ships` only supplies the ship names; lengths come from the file.
+        """
+        record = self[index]
+        turn = record.turns if turn is None else min(turn, record.turns)
+        names = list(ships)
+        if len(names) != len(self.lengths):
+            names = [f"Ship {i + 1}" for i in range(len(self.lengths))]
+        board_a, board_b = Board(self.size), Board(self.size)
+        for board, fleet in ((board_a, record.fleet_a), (board_b, record.fleet_b)):
+            for name, coordinates in zip(names, fleet):
+                board.place_ship(Ship(name, len(coordinates), coordinates))
+        # Shots alternate A, B, A, ... starting with A
+        for shot in range(turn):
+            if shot % 2 == 0:
+                board_b.receive_shot(*record.shots_a[shot // 2])
+            else:
+                board_a.receive_shot(*record.shots_b[shot // 2])
+        return board_a, board_b
+
+    def close(self) -> None:
+        if isinstance(self._offsets, memoryview):
+            self._offsets.release()
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "GameRecordReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -1,22 +1,39 @@
-from dataclasses import dataclass
-from typing import List, Tuple, Set
+from typing import List, Optional, Tuple, Set
 
-@dataclass
 class Ship:
-    name: str
-    length: int
-    coordinates: List[Tuple[int, int]]
-    hits: Set[Tuple[int, int]] = None
-    
-    def __post_init__(self):
-        """Initialize the hits set if not provided"""
-        if self.hits is None:
-            self.hits = set()
-        
+    """A named ship; slotted, since every board holds a fleet of them"""
+    __slots__ = ("name", "length", "coordinates", "_hits")
+
+    def __init__(self, name: str, length: int, coordinates: List[Tuple[int, int]],
+                 hits: Set[Tuple[int, int]] = None):
+        self.name = name
+        self.length = length
+        self.coordinates = coordinates
+        self._hits: Optional[Set[Tuple[int, int]]] = hits  # Allocated on the first hit
+
         # Validate that coordinates match the ship length
         if len(self.coordinates) != self.length:
             raise ValueError(f"Ship {self.name} requires exactly {self.length} coordinates")
 
+    @property
+    def hits(self) -> Set[Tuple[int, int]]:
+        """Positions hit so far"""
+        if self._hits is None:
+            self._hits = set()
+        return self._hits
+
+    def __repr__(self) -> str:
+        return (f"Ship(name={self.name!r}, length={self.length!r}, "
+                f"coordinates={self.coordinates!r}, hits={self._hits or set()!r})")
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return ((self.name, self.length, self.coordinates, self._hits or set())
+                == (other.name, other.length, other.coordinates, other._hits or set()))
+
+    __hash__ = None  # Compared by value and mutable, so unhashable
+
     def hit(self, position: Tuple[int, int]) -> bool:
         """Register a hit on the ship"""
         if position in self.coordinates:
@@ -24,7 +41,12 @@ class Ship:
             return True
         return False
 
+    def reset(self) -> None:
+        """Clear the hits so the ship can be placed again"""
+        if self._hits:
+            self._hits.clear()
+
     @property
     def is_sunk(self) -> bool:
         """Check if the ship is sunk"""
-        return len(self.hits) == self.length
+        return len(self._hits or ()) == self.length
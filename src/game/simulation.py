@@ -0,0 +1,136 @@
+"""Headless AI-vs-AI simulation engine.
+
+Drives Board and AIPlayer directly, without importing any UI module, so it can
+run on machines that have no display (or no tkinter at all).
+"""
+import time
+from dataclasses import dataclass
+from random import Random
+from typing import Callable, Dict, Tuple
+from .board import Board
+from .player import AIPlayer
+from .fleet import place_random_fleet
+from ..constants import BOARD_SIZE, SHIPS
+
+# Factory that builds an AI from its random generator, board size and fleet
+AIFactory = Callable[[Random, int, Dict[str, int]], AIPlayer]
+
+_MASK64 = (1 << 64) - 1
+
+def close_ai(ai) -> None:
+    """Free what an AI holds outside the heap (Monte Carlo's shared memory), if anything"""
+    close = getattr(ai, "close", None)
+    if close is not None:
+        close()
+
+def derive_seed(master_seed: int, index: int) -> int:
+    """Derive the seed of game `index` from a master seed (splitmix64)"""
+    z = (master_seed + (index + 1) * 0x9E3779B97F4A7C15) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+@dataclass
+class GameResult:
+    seed: int
+    winner: str  # "A" or "B"
+    shots: int   # Shots fired by the winner
+
+@dataclass
+class SimulationResult:
+    games: int = 0
+    wins_a: int = 0
+    wins_b: int = 0
+    total_shots_to_win: int = 0
+    min_shots_to_win: int = 0
+    max_shots_to_win: int = 0
+    elapsed: float = 0.0
+
+    def add(self, result: GameResult) -> None:
+        """Fold a single game result into the aggregate"""
+        if self.games == 0:
+            self.min_shots_to_win = self.max_shots_to_win = result.shots
+        else:
+            self.min_shots_to_win = min(self.min_shots_to_win, result.shots)
+            self.max_shots_to_win = max(self.max_shots_to_win, result.shots)
+        self.games += 1
+        self.total_shots_to_win += result.shots
+        if result.winner == "A":
+            self.wins_a += 1
+        else:
+            self.wins_b += 1
+
+    @property
+    def mean_shots_to_win(self) -> float:
+        return self.total_shots_to_win / self.games if self.games else 0.0
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        """Human readable one-line summary"""
+        return (f"{self.games} games in {self.elapsed:.2f}s "
+                f"({self.games_per_second:.0f} games/s): "
+                f"A won {self.wins_a}, B won {self.wins_b}, "
+                f"mean shots to win {self.mean_shots_to_win:.2f} "
+                f"(min {self.min_shots_to_win}, max {self.max_shots_to_win})")
+
+def play_game(seed: int, ai_a: AIFactory = AIPlayer, ai_b: AIFactory = AIPlayer,
+              size: int = BOARD_SIZE, ships: Dict[str, int] = SHIPS, corpus=None) -> GameResult:
+    """Play one seeded AI-vs-AI game; A shoots first, like the human player does
+
+    With a LayoutCorpus, both fleets are drawn from it by seeded index
+    instead of being sampled.
+    """
+    return play_boards(seed, ai_a, ai_b, size, ships, corpus)[0]
+
+def play_boards(seed: int, ai_a: AIFactory = AIPlayer, ai_b: AIFactory = AIPlayer,
+                size: int = BOARD_SIZE, ships: Dict[str, int] = SHIPS,
+                corpus=None) -> Tuple[GameResult, Board, Board]:
+    """Like play_game, but also return the final boards of A and B"""
+    rng = Random(seed)
+    board_a, board_b = Board(size), Board(size)
+    for board in (board_a, board_b):
+        if corpus is None:
+            place_random_fleet(board, ships, rng)
+        else:
+            corpus.place(board, rng, ships)
+    # Each side gets its own stream so one AI's draws never perturb the other's
+    player_a = ai_a(Random(rng.getrandbits(64)), size, ships)
+    player_b = ai_b(Random(rng.getrandbits(64)), size, ships)
+
+    turns = ((player_a, board_b, "A"), (player_b, board_a, "B"))
+    max_shots = size * size
+    shots = 0
+    try:
+        while shots < max_shots:
+            shots += 1
+            for player, target, name in turns:
+                x, y = player.get_shot(target)
+                result = target.receive_shot(x, y)
+                player.process_shot_result(x, y, result.hit, target.sunk_ship(result))
+                if result.sunk and target.all_ships_sunk():
+                    return GameResult(seed, name, shots), board_a, board_b
+    finally:
+        close_ai(player_a)
+        close_ai(player_b)
+    raise RuntimeError(f"Game with seed {seed} did not finish in {max_shots} shots")
+
+def simulate(n_games: int, seed: int = 0, ai_a: AIFactory = AIPlayer,
+             ai_b: AIFactory = AIPlayer, size: int = BOARD_SIZE,
+             ships: Dict[str, int] = SHIPS, writer=None, corpus=None) -> SimulationResult:
+    """Play n_games seeded games between two AIs and aggregate the results
+
+    Pass a GameRecordWriter as `writer` to stream every game to a record file,
+    and a LayoutCorpus as `corpus` to draw fleets from pregenerated layouts.
+    """
+    result = SimulationResult()
+    start = time.perf_counter()
+    for index in range(n_games):
+        game, board_a, board_b = play_boards(derive_seed(seed, index), ai_a, ai_b, size, ships, corpus)
+        result.add(game)
+        if writer is not None:
+            writer.write_game(game, board_a, board_b)
+    result.elapsed = time.perf_counter() - start
+    return result
@@ -0,0 +1,223 @@
+"""Compact, versioned GameState snapshots.
+
+A snapshot holds the computer's strategy name and move budget, the fleet
+definition, the game phase and winner, both boards (ship cells plus the
+ordered shot list, from which hits are replayed) and the AI. An AIPlayer's
+hunt/target state is stored as is; any other AI is rebuilt on load by
+replaying the computer's shots into a fresh AI of the strategy, so its state
+must follow from process_shot_result alone. Cells use the same narrow
+little-endian encoding as game records. The AI's random generator is not
+part of the snapshot.
+"""
+import math
+import struct
+from array import array
+from typing import Dict, List, Optional, Tuple
+from .board import Board
+from .enums import GamePhase
+from .player import AIPlayer, Direction
+from .record import cell_typecode, from_le_bytes, to_le_bytes
+from .ship import Ship
+from .simulation import close_ai
+from .strategies import create_strategy
+
+MAGIC = b"BSGS"
+VERSION = 2
+
+HEADER = struct.Struct("<4sBHBBH")  # magic, version, board size, phase, winner, ship count
+BUDGET = struct.Struct("<d")  # Seconds per move, NaN for the strategy default
+COUNT = struct.Struct("<I")
+NAME_LENGTH = struct.Struct("<B")
+SHIP_LENGTH = struct.Struct("<H")
+AI_HEADER = struct.Struct("<BBB")  # flags, current direction, potential direction count
+
+_PHASES = list(GamePhase)
+_WINNERS = [None, "Player", "Computer"]
+_DIRECTIONS = list(Direction)
+_NONE = 0xFF
+
+# How the AI is stored
+_AI_STATE = 0   # AIPlayer hunt/target state follows
+_AI_REPLAY = 1  # Nothing follows; replay the computer's shots
+AI_KIND = struct.Struct("<B")
+
+# AIPlayer flag bits
+_HUNT_MODE = 1
+_LAST_HIT = 2
+_FIRST_HIT = 4
+
+class _Writer:
+    def __init__(self, size: int):
+        self.size = size
+        self.typecode = cell_typecode(size)
+        self.parts: List[bytes] = []
+
+    def cells(self, coordinates: List[Tuple[int, int]]) -> None:
+        self.parts.append(COUNT.pack(len(coordinates)))
+        self.parts.append(to_le_bytes(array(self.typecode, (y * self.size + x for x, y in coordinates))))
+
+    def cell(self, position: Tuple[int, int]) -> None:
+        self.parts.append(to_le_bytes(array(self.typecode, [position[1] * self.size + position[0]])))
+
+class _Reader:
+    def __init__(self, data: bytes, offset: int, size: int):
+        self.data = memoryview(data)
+        self.offset = offset
+        self.size = size
+        self.typecode = cell_typecode(size)
+        self.width = array(self.typecode).itemsize
+
+    def unpack(self, fmt: struct.Struct) -> tuple:
+        values = fmt.unpack_from(self.data, self.offset)
+        self.offset += fmt.size
+        return values
+
+    def cells(self) -> List[Tuple[int, int]]:
+        count, = self.unpack(COUNT)
+        end = self.offset + count * self.width
+        cells = from_le_bytes(self.typecode, self.data[self.offset:end])
+        self.offset = end
+        return [(cell % self.size, cell // self.size) for cell in cells]
+
+    def cell(self) -> Tuple[int, int]:
+        end = self.offset + self.width
+        cell = from_le_bytes(self.typecode, self.data[self.offset:end])[0]
+        self.offset = end
+        return cell % self.size, cell // self.size
+
+def _dump_board(writer: _Writer, board: Board, ships: Dict[str, int]) -> None:
+    """Ships must have been placed in fleet order, as setup does"""
+    names = list(ships)
+    if [ship.name for ship in board.ships] != names[:len(board.ships)]:
+        raise ValueError("Ships were not placed in fleet order")
+    writer.parts.append(COUNT.pack(len(board.ships)))
+    for ship in board.ships:
+        writer.cells(ship.coordinates)
+    writer.cells(board.shots)
+
+def _load_board(reader: _Reader, ships: Dict[str, int], board: Optional[Board] = None) -> Board:
+    """Read a board, into `board` (reset first) if it has the right size"""
+    if board is None or board.size != reader.size:
+        board = Board(reader.size)
+    else:
+        board.reset()
+    count, = reader.unpack(COUNT)
+    for ship_name, _ in zip(ships, range(count)):
+        coordinates = reader.cells()
+        board.place_ship(Ship(ship_name, len(coordinates), coordinates))
+    for x, y in reader.cells():
+        board.receive_shot(x, y)
+    return board
+
+def dump_ai(ai: AIPlayer, size: int) -> bytes:
+    """Serialize an AIPlayer's hunt/target state"""
+    writer = _Writer(size)
+    flags = ((_HUNT_MODE if ai.hunt_mode else 0)
+             | (_LAST_HIT if ai.last_hit is not None else 0)
+             | (_FIRST_HIT if ai.first_hit is not None else 0))
+    direction = _NONE if ai.current_direction is None else _DIRECTIONS.index(ai.current_direction)
+    writer.parts.append(AI_HEADER.pack(flags, direction, len(ai.potential_directions)))
+    writer.parts.append(bytes(_DIRECTIONS.index(d) for d in ai.potential_directions))
+    if ai.last_hit is not None:
+        writer.cell(ai.last_hit)
+    if ai.first_hit is not None:
+        writer.cell(ai.first_hit)
+    writer.cells(ai.hits)
+    writer.cells(ai.shot_order())
+    return b"".join(writer.parts)
+
+def _load_ai(reader: _Reader, ai: AIPlayer) -> None:
+    flags, direction, count = reader.unpack(AI_HEADER)
+    potential = reader.data[reader.offset:reader.offset + count]
+    reader.offset += count
+
+    ai.reset()
+    ai.hunt_mode = bool(flags & _HUNT_MODE)
+    ai.current_direction = None if direction == _NONE else _DIRECTIONS[direction]
+    ai.potential_directions = [_DIRECTIONS[index] for index in potential]
+    ai.last_hit = reader.cell() if flags & _LAST_HIT else None
+    ai.first_hit = reader.cell() if flags & _FIRST_HIT else None
+    ai.hits = reader.cells()
+    for x, y in reader.cells():
+        ai.mark_shot(x, y)
+
+def load_ai(data: bytes, ai: AIPlayer, size: int) -> None:
+    """Restore state written by dump_ai into an existing AIPlayer"""
+    _load_ai(_Reader(data, 0, size), ai)
+
+def _name(text: str) -> bytes:
+    data = text.encode()
+    return NAME_LENGTH.pack(len(data)) + data
+
+def _read_name(reader: _Reader) -> str:
+    length, = reader.unpack(NAME_LENGTH)
+    name = bytes(reader.data[reader.offset:reader.offset + length]).decode()
+    reader.offset += length
+    return name
+
+def _replay(ai, board: Board) -> None:
+    """Feed an AI the results of every shot fired at a board, in order"""
+    scratch = Board(board.size)
+    for ship in board.ships:
+        scratch.place_ship(Ship(ship.name, ship.length, ship.coordinates))
+    for x, y in board.shots:
+        result = scratch.receive_shot(x, y)
+        ai.process_shot_result(x, y, result.hit, scratch.sunk_ship(result))
+
+def dump_game(game) -> bytes:
+    """Serialize a GameState (everything but its UI and random generator)"""
+    size = game.board_size
+    writer = _Writer(size)
+    writer.parts.append(HEADER.pack(MAGIC, VERSION, size, _PHASES.index(game.current_phase),
+                                    _WINNERS.index(game.winner), len(game.ships)))
+    writer.parts.append(_name(game.strategy))
+    writer.parts.append(BUDGET.pack(math.nan if game.move_budget is None else game.move_budget))
+    writer.parts.extend(_name(name) + SHIP_LENGTH.pack(length) for name, length in game.ships.items())
+    _dump_board(writer, game.player_board, game.ships)
+    _dump_board(writer, game.computer_board, game.ships)
+    if type(game.ai_player) is AIPlayer:
+        writer.parts.append(AI_KIND.pack(_AI_STATE))
+        writer.parts.append(dump_ai(game.ai_player, size))
+    else:
+        writer.parts.append(AI_KIND.pack(_AI_REPLAY))
+    return b"".join(writer.parts)
+
+def load_game(data: bytes, game) -> None:
+    """Restore a snapshot into an existing GameState, replacing its boards, strategy and AI"""
+    magic, version, size, phase, winner, count = HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError("Not a game snapshot")
+    if version != VERSION:
+        raise ValueError(f"Unsupported snapshot version {version}")
+
+    reader = _Reader(data, HEADER.size, size)
+    strategy = _read_name(reader)
+    budget, = reader.unpack(BUDGET)
+    ships: Dict[str, int] = {}
+    for _ in range(count):
+        name = _read_name(reader)
+        ships[name], = reader.unpack(SHIP_LENGTH)
+
+    # Keep the AI only if a fresh one of the strategy would be the same kind
+    ai = game.ai_player
+    reuse = (strategy == game.strategy and type(ai) is AIPlayer
+             and size == game.board_size and ships == game.ships)
+    game.board_size = size
+    game.ships = ships
+    game.strategy = strategy
+    game.move_budget = None if math.isnan(budget) else budget
+    game.current_phase = _PHASES[phase]
+    game.winner = _WINNERS[winner]
+    game.player_board = _load_board(reader, ships, game.player_board)
+    game.computer_board = _load_board(reader, ships, game.computer_board)
+    if not reuse:
+        close_ai(ai)
+        ai = game.ai_player = create_strategy(strategy, game.rng, size, ships)
+    kind, = reader.unpack(AI_KIND)
+    if kind == _AI_STATE:
+        if type(ai) is not AIPlayer:
+            raise ValueError(f"Snapshot holds AIPlayer state but strategy {strategy!r} "
+                             f"builds {type(ai).__name__}")
+        _load_ai(reader, ai)
+    else:
+        _replay(ai, game.player_board)
@@ -0,0 +1,210 @@
+"""Exact endgame solver.
+
+Given what a player can observe about a partially played board (misses, hits
+and the ships already sunk), enumerates every layout of the remaining fleet
+that is consistent with it, assuming all such layouts are equally likely:
+
+- remaining ships avoid misses and sunk ships, and never overlap;
+- together they cover every hit not explained by a sunk ship;
+- none of them is fully hit (it would have been announced as sunk).
+
+Layouts are counted with a memoized recursion over (ship, occupied cells),
+using the placement tables behind Board.get_valid_ship_placements. Ships of
+equal length are placed in increasing placement order and the count scaled
+back up, so interchangeable ships do not multiply the search. Per-cell counts
+ride along packed into one big integer (one fixed-width field per cell) so
+that summing them is a single integer addition.
+"""
+from collections import Counter
+from dataclasses import dataclass
+from math import factorial
+from typing import Dict, List, Optional, Tuple
+from .board import Board, placement_table
+from ..constants import SHIPS
+
+# Bits per packed cell counter; wide enough for any tractable layout count
+_FIELD = 96
+_FIELD_MASK = (1 << _FIELD) - 1
+
+@dataclass(frozen=True)
+class Observation:
+    size: int
+    shots: int            # Every cell fired at
+    blocked: int          # Cells no remaining ship can use: misses and sunk ships
+    hits: int             # Hits not explained by a sunk ship
+    lengths: Tuple[int, ...]  # Remaining ships
+
+    @classmethod
+    def from_board(cls, board: Board, ships: Dict[str, int] = SHIPS) -> "Observation":
+        """Extract only the information the shooter can see from a board"""
+        shots, hits = board.shot_mask, board.hit_mask
+        sunk_cells = 0
+        remaining = Counter(ships.values())
+        for ship, mask in zip(board.ships, board.ship_masks):
+            if ship.is_sunk:
+                sunk_cells |= mask
+                remaining[ship.length] -= 1
+        lengths = tuple(sorted(remaining.elements(), reverse=True))
+        return cls(board.size, shots, (shots & ~hits) | sunk_cells, hits & ~sunk_cells, lengths)
+
+def _spread(mask: int) -> int:
+    """Packed counter vector with a 1 in the field of every cell in mask"""
+    packed = 0
+    while mask:
+        low = mask & -mask
+        packed |= 1 << (_FIELD * (low.bit_length() - 1))
+        mask ^= low
+    return packed
+
+class EndgameSolver:
+    def __init__(self, observation: Observation, max_layouts: int = 200_000):
+        self.observation = observation
+        self.max_layouts = max_layouts
+        self.cells = observation.size * observation.size
+        self.lengths = observation.lengths
+        self.multiplicity = 1  # Orderings of interchangeable ships, all counted as one
+        for count in Counter(self.lengths).values():
+            self.multiplicity *= factorial(count)
+
+        open_cells = ~observation.shots
+        self._placements: Dict[int, List[Tuple[int, int]]] = {}
+        for length in set(self.lengths):
+            self._placements[length] = [
+                (mask, _spread(mask)) for mask, _ in placement_table(observation.size, length)
+                if not mask & observation.blocked and mask & open_cells
+            ]
+        self._suffix_cells = [sum(self.lengths[i:]) for i in range(len(self.lengths) + 1)]
+        self._memo: Dict[Tuple[int, int, int], Tuple[int, int]] = {}
+        self._solution: Optional[Tuple[int, int]] = None
+
+    @classmethod
+    def from_board(cls, board: Board, ships: Dict[str, int] = SHIPS, **kwargs) -> "EndgameSolver":
+        return cls(Observation.from_board(board, ships), **kwargs)
+
+    def _count(self, index: int, occupied: int, start: int) -> Tuple[int, int]:
+        """(layouts, packed per-cell counts) for ships index.. given occupied cells"""
+        uncovered = self.observation.hits & ~occupied
+        if index == len(self.lengths):
+            return (0, 0) if uncovered else (1, 0)
+        if bin(uncovered).count("1") > self._suffix_cells[index]:
+            return 0, 0
+
+        key = (index, occupied, start)
+        cached = self._memo.get(key)
+        if cached is not None:
+            return cached
+
+        length = self.lengths[index]
+        next_same = index + 1 < len(self.lengths) and self.lengths[index + 1] == length
+        total = packed = 0
+        placements = self._placements[length]
+        for position in range(start, len(placements)):
+            mask, spread = placements[position]
+            if mask & occupied:
+                continue
+            count, cells = self._count(index + 1, occupied | mask, position + 1 if next_same else 0)
+            if count:
+                total += count
+                packed += cells + count * spread
+        self._memo[key] = total, packed
+        return total, packed
+
+    def _solve(self) -> Tuple[int, int]:
+        if self._solution is None:
+            self._solution = self._count(0, 0, 0)
+            self._memo.clear()
+        return self._solution
+
+    def layout_count(self) -> int:
+        """Number of consistent layouts of the remaining (distinguishable) ships"""
+        return self._solve()[0] * self.multiplicity
+
+    def cell_probabilities(self) -> List[float]:
+        """Posterior probability that each cell (index y * size + x) holds a remaining ship"""
+        total, packed = self._solve()
+        if not total:
+            raise ValueError("No fleet layout is consistent with the observations")
+        return [(packed >> (_FIELD * cell) & _FIELD_MASK) / total for cell in range(self.cells)]
+
+    def best_shot(self) -> Tuple[int, int]:
+        """Open cell most likely to hold a ship"""
+        probabilities = self.cell_probabilities()
+        shots = self.observation.shots
+        cell = max((cell for cell in range(self.cells) if not shots >> cell & 1),
+                   key=probabilities.__getitem__)
+        return cell % self.observation.size, cell // self.observation.size
+
+    def layouts(self) -> Counter:
+        """Distinct footprints of the remaining fleet, weighted by how many layouts share them"""
+        layouts: Counter = Counter()
+
+        def place(index: int, occupied: int, start: int) -> None:
+            if index == len(self.lengths):
+                if not self.observation.hits & ~occupied:
+                    layouts[occupied] += self.multiplicity
+                    if len(layouts) > self.max_layouts:
+                        raise ValueError(f"More than {self.max_layouts} layouts to enumerate")
+                return
+            if bin(self.observation.hits & ~occupied).count("1") > self._suffix_cells[index]:
+                return
+            length = self.lengths[index]
+            next_same = index + 1 < len(self.lengths) and self.lengths[index + 1] == length
+            placements = self._placements[length]
+            for position in range(start, len(placements)):
+                mask = placements[position][0]
+                if not mask & occupied:
+                    place(index + 1, occupied | mask, position + 1 if next_same else 0)
+
+        place(0, 0, 0)
+        return layouts
+
+    def expected_shots_remaining(self) -> float:
+        """Exact expected shots to sink the remaining fleet
+
+        Assumes the shooter keeps firing at the most probable open cell
+        (lowest index on ties) and does not use sink announcements. Raises
+        ValueError when there are more than max_layouts footprints.
+        """
+        layouts = [(footprint, weight, _spread(footprint)) for footprint, weight in self.layouts().items()]
+        if not layouts:
+            raise ValueError("No fleet layout is consistent with the observations")
+        if not self.lengths:
+            return 0.0  # Every ship is sunk
+        memo: Dict[Tuple[int, int], float] = {}
+        return self._expected(layouts, self.observation.shots, memo)
+
+    def _expected(self, layouts, shots: int, memo) -> float:
+        if not layouts:
+            return 0.0
+        key = (shots, layouts[0][0] & shots)
+        if key in memo:
+            return memo[key]
+
+        weight = sum(layout[1] for layout in layouts)
+        packed = sum(layout[1] * layout[2] for layout in layouts)
+        best, best_count = -1, -1
+        for cell in range(self.cells):
+            if not shots >> cell & 1:
+                count = packed >> (_FIELD * cell) & _FIELD_MASK
+                if count > best_count:
+                    best, best_count = cell, count
+
+        shots |= 1 << best
+        hit, miss = [], []
+        hit_weight = miss_weight = 0
+        for layout in layouts:
+            if layout[0] >> best & 1:
+                if layout[0] & ~shots:
+                    hit.append(layout)
+                    hit_weight += layout[1]
+            else:
+                miss.append(layout)
+                miss_weight += layout[1]
+
+        expected = 1.0
+        if hit:
+            expected += hit_weight / weight * self._expected(hit, shots, memo)
+        if miss:
+            expected += miss_weight / weight * self._expected(miss, shots, memo)
+        memo[key] = expected
+        return expected
@@ -0,0 +1,161 @@
+"""Registry of AI strategies, selectable by name, with per-move time budgets.
+
+A strategy is any object with the AIPlayer interface:
+
+    get_shot(board) -> (x, y)
+    process_shot_result(x, y, hit, sunk=None)
+
+Strategies that can improve their answer with more time also implement
+iter_shots(board), a generator yielding successively better moves.
+choose_shot() stops consuming it once the move's time budget has expired and
+keeps the best move so far, so an iter_shots strategy should yield early and
+often. Strategies without iter_shots always finish their move, so a budget
+means nothing to them: register iter_shots strategies with anytime=True,
+and only those take a budget.
+
+Every move's latency is recorded in a per-strategy histogram.
+"""
+import math
+import threading
+from dataclasses import dataclass
+from random import Random
+from time import perf_counter
+from typing import Dict, List, Optional, Tuple
+from .board import Board
+from .density import DensityAIPlayer
+from .player import AIPlayer
+from .simulation import AIFactory
+from ..constants import BOARD_SIZE, SHIPS
+
+DEFAULT_STRATEGY = "random_target"
+
+@dataclass(frozen=True)
+class StrategySpec:
+    name: str
+    factory: AIFactory
+    budget: Optional[float] = None  # Default seconds per move; None means unlimited
+    offload: bool = False           # Slow enough to keep off event-loop threads
+    anytime: bool = False           # Implements iter_shots, so it honours a move budget
+
+_STRATEGIES: Dict[str, StrategySpec] = {}
+
+def register_strategy(name: str, factory: Optional[AIFactory] = None, *,
+                      budget: Optional[float] = None, offload: bool = False, anytime: bool = False):
+    """Register a strategy factory under a name; usable as a class decorator"""
+    if budget is not None and not anytime:
+        raise ValueError("Only anytime strategies can have a move budget")
+
+    def register(factory: AIFactory) -> AIFactory:
+        if name in _STRATEGIES:
+            raise ValueError(f"Strategy {name!r} is already registered")
+        _STRATEGIES[name] = StrategySpec(name, factory, budget, offload, anytime)
+        return factory
+    return register if factory is None else register(factory)
+
+def get_strategy(name: str) -> StrategySpec:
+    try:
+        return _STRATEGIES[name]
+    except KeyError:
+        raise ValueError(f"Unknown strategy {name!r}, expected one of {', '.join(_STRATEGIES)}") from None
+
+def available_strategies() -> List[str]:
+    return list(_STRATEGIES)
+
+def create_strategy(name: str, rng=None, size: int = BOARD_SIZE, ships: Dict[str, int] = SHIPS):
+    """Build a fresh AI of the named strategy"""
+    return get_strategy(name).factory(Random() if rng is None else rng, size, ships)
+
+class LatencyHistogram:
+    """Move latencies in power-of-two buckets from 1µs up to about a minute"""
+    BUCKETS = 27
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counts = [0] * self.BUCKETS
+            self.count = 0
+            self.total = 0.0
+            self.max = 0.0
+
+    @staticmethod
+    def bucket_bound(index: int) -> float:
+        """Upper bound of a bucket, in seconds"""
+        return 1e-6 * (1 << index)
+
+    def record(self, seconds: float) -> None:
+        index = 0 if seconds <= 1e-6 else min(self.BUCKETS - 1, math.frexp(seconds / 1e-6)[1])
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.total += seconds
+            self.max = max(self.max, seconds)
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the given fraction of moves"""
+        target = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= target:
+                return min(self.bucket_bound(index), self.max)
+        return 0.0
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "moves": self.count,
+            "mean_ms": 1e3 * self.total / self.count if self.count else 0.0,
+            "p50_ms": 1e3 * self.percentile(0.5),
+            "p99_ms": 1e3 * self.percentile(0.99),
+            "max_ms": 1e3 * self.max,
+        }
+
+_LATENCY: Dict[str, LatencyHistogram] = {}
+
+def latency_histogram(name: str) -> LatencyHistogram:
+    """Histogram of every move made through choose_shot for a strategy"""
+    histogram = _LATENCY.get(name)
+    if histogram is None:
+        histogram = _LATENCY.setdefault(name, LatencyHistogram())
+    return histogram
+
+def latency_report() -> Dict[str, Dict[str, float]]:
+    return {name: histogram.summary() for name, histogram in _LATENCY.items()}
+
+def choose_shot(name: str, ai, board: Board, budget: Optional[float] = None) -> Tuple[int, int]:
+    """Ask an AI of the named strategy for a move within budget seconds
+
+    A budget of None uses the strategy's registered default. AIs without
+    iter_shots ignore the budget and always finish their move.
+    """
+    if budget is None:
+        budget = get_strategy(name).budget
+    start = perf_counter()
+    search = getattr(ai, "iter_shots", None)
+    if search is None:
+        move = ai.get_shot(board)
+    else:
+        move = None
+        deadline = math.inf if budget is None else start + budget
+        moves = search(board)
+        try:
+            for move in moves:
+                if perf_counter() >= deadline:
+                    break
+        finally:
+            moves.close()  # Let the search clean up now, not whenever it is collected
+        if move is None:
+            raise RuntimeError(f"Strategy {name!r} yielded no move")
+    latency_histogram(name).record(perf_counter() - start)
+    return move
+
+def _monte_carlo(rng, size: int, ships: Dict[str, int]):
+    # Imported on first use: it pulls in multiprocessing, which slows every cold start
+    from .montecarlo import MonteCarloAIPlayer
+    return MonteCarloAIPlayer(rng, size, ships)
+
+register_strategy("random_target", AIPlayer)
+register_strategy("density", DensityAIPlayer)
+register_strategy("montecarlo", _monte_carlo, budget=1.0, offload=True, anytime=True)
@@ -0,0 +1,65 @@
+"""Multiprocess tournament runner.
+
+Games are split into contiguous batches of indices and fanned out to a
+ProcessPoolExecutor. Every game derives its seed from the master seed and its
+own index, so the merged results are identical whatever the worker count.
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Tuple
+from .player import AIPlayer
+from .simulation import AIFactory, GameResult, SimulationResult, derive_seed, play_game
+from ..constants import BOARD_SIZE, SHIPS
+
+# Compact per-game record sent back from workers: (index, seed, winner, shots)
+CompactResult = Tuple[int, int, str, int]
+
+def _play_batch(master_seed: int, start: int, stop: int, ai_a: AIFactory, ai_b: AIFactory,
+                size: int, ships: Dict[str, int], corpus=None) -> List[CompactResult]:
+    """Worker entry point: play games [start, stop) of the tournament"""
+    batch = []
+    for index in range(start, stop):
+        result = play_game(derive_seed(master_seed, index), ai_a, ai_b, size, ships, corpus)
+        batch.append((index, result.seed, result.winner, result.shots))
+    return batch
+
+def iter_tournament(n_games: int, master_seed: int = 0, ai_a: AIFactory = AIPlayer,
+                    ai_b: AIFactory = AIPlayer, workers: Optional[int] = None,
+                    batch_size: int = 500, size: int = BOARD_SIZE,
+                    ships: Dict[str, int] = SHIPS, corpus=None) -> Iterator[CompactResult]:
+    """Yield compact game results as worker batches complete (in completion order)
+
+    The AI factories must be picklable, i.e. module-level classes or functions.
+    A LayoutCorpus is sent to workers by path and mapped once per worker.
+    """
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_play_batch, master_seed, start, min(start + batch_size, n_games),
+                        ai_a, ai_b, size, ships, corpus)
+            for start in range(0, n_games, batch_size)
+        ]
+        for future in as_completed(futures):
+            yield from future.result()
+
+def run_tournament(n_games: int, master_seed: int = 0, ai_a: AIFactory = AIPlayer,
+                   ai_b: AIFactory = AIPlayer, workers: Optional[int] = None,
+                   batch_size: int = 500, size: int = BOARD_SIZE,
+                   ships: Dict[str, int] = SHIPS, corpus=None) -> Tuple[SimulationResult, List[GameResult]]:
+    """Run a tournament across worker processes
+
+    Returns the aggregate stats plus the per-game results ordered by game index,
+    which match what simulate() produces for the same master seed.
+    """
+    start = time.perf_counter()
+    games: List[Optional[GameResult]] = [None] * n_games
+    for index, seed, winner, shots in iter_tournament(n_games, master_seed, ai_a, ai_b,
+                                                      workers, batch_size, size, ships, corpus):
+        games[index] = GameResult(seed, winner, shots)
+
+    summary = SimulationResult()
+    for game in games:
+        summary.add(game)
+    summary.elapsed = time.perf_counter() - start
+    return summary, games
@@ -0,0 +1,194 @@
+"""Opt-in instrumentation of the game loop's hot paths.
+
+enable() wraps the instrumented methods on their classes, and instrumented
+functions in their module and wherever they were imported by name, so every
+call records its latency, from any thread. Until then nothing is wrapped
+and the code runs at full speed; disable() puts the originals back.
+
+Optionally it also counts the memory blocks each call left allocated
+(sys.getallocatedblocks before and after, so nested instrumented calls are
+included in their caller's figure). That count is process-wide, so it is
+only taken for calls on the main thread, and still includes whatever other
+threads (the GUI's move picker, the spectator) allocate in the meantime.
+
+Only modules already imported are instrumented, so enable() never drags in
+tkinter: call it after the UI is created, or call it again to pick up
+modules imported since.
+
+Metrics are read in process with report(), or written periodically as JSON
+or Prometheus text by a MetricsDumper.
+"""
+import functools
+import json
+import os
+import sys
+import threading
+from time import perf_counter
+from typing import Callable, Dict, List, Optional, Tuple
+from .game.strategies import LatencyHistogram
+
+# Metric name -> (module, class, method), or (module, None, function)
+TARGETS: Dict[str, Tuple[str, Optional[str], str]] = {
+    "game_state.player_turn": ("src.game.game_state", "GameState", "player_turn"),
+    "game_state.apply_computer_shot": ("src.game.game_state", "GameState", "apply_computer_shot"),
+    "strategies.choose_shot": ("src.game.strategies", None, "choose_shot"),
+    "board.receive_shot": ("src.game.board", "Board", "receive_shot"),
+    "gui.draw_board": ("src.ui.gui", "BattleshipGUI", "draw_board"),
+}
+
+class CallMetrics:
+    __slots__ = ("latency", "blocks", "measured", "_lock")
+
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.blocks = 0    # Net memory blocks left allocated by the measured calls
+        self.measured = 0  # Calls whose blocks were counted (main thread only)
+        self._lock = threading.Lock()
+
+    def add_blocks(self, blocks: int) -> None:
+        with self._lock:
+            self.blocks += blocks
+            self.measured += 1
+
+    def reset(self) -> None:
+        self.latency.reset()
+        with self._lock:
+            self.blocks = self.measured = 0
+
+    def summary(self) -> Dict[str, float]:
+        latency = self.latency.summary()
+        calls = latency.pop("moves")
+        return {"calls": calls, **latency,
+                "blocks_per_call": self.blocks / self.measured if self.measured else 0.0}
+
+_METRICS: Dict[str, CallMetrics] = {}
+# Metric name -> (owner, attribute, original) for every class or module patched
+_PATCHED: Dict[str, List[Tuple[object, str, Callable]]] = {}
+
+def _wrap(function: Callable, metrics: CallMetrics, allocations: bool) -> Callable:
+    record = metrics.latency.record
+    if allocations:
+        main_thread = threading.main_thread()
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if threading.current_thread() is not main_thread:
+                start = perf_counter()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    record(perf_counter() - start)
+            blocks = sys.getallocatedblocks()
+            start = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record(perf_counter() - start)
+                metrics.add_blocks(sys.getallocatedblocks() - blocks)
+    else:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record(perf_counter() - start)
+    return wrapper
+
+def _owners(module, class_name: Optional[str], attribute: str) -> List[object]:
+    """Where a target is looked up: its class, or its module plus every
+    game module that imported the function by name"""
+    if class_name is not None:
+        return [getattr(module, class_name)]
+    original = getattr(module, attribute)
+    return [module] + [other for other_name, other in list(sys.modules.items())
+                       if other is not module and other_name.startswith(__package__ + ".")
+                       and getattr(other, attribute, None) is original]
+
+def enable(allocations: bool = False) -> None:
+    """Instrument every target whose module is already imported"""
+    for name, (module_name, class_name, attribute) in TARGETS.items():
+        module = sys.modules.get(module_name)
+        if name in _PATCHED or module is None:
+            continue
+        owners = _owners(module, class_name, attribute)
+        original = vars(owners[0])[attribute]
+        wrapper = _wrap(original, _METRICS.setdefault(name, CallMetrics()), allocations)
+        for owner in owners:
+            setattr(owner, attribute, wrapper)
+        _PATCHED[name] = [(owner, attribute, original) for owner in owners]
+
+def disable() -> None:
+    """Restore the originals; recorded metrics are kept"""
+    for patches in _PATCHED.values():
+        for owner, attribute, original in patches:
+            setattr(owner, attribute, original)
+    _PATCHED.clear()
+
+def enabled() -> bool:
+    return bool(_PATCHED)
+
+def reset() -> None:
+    """Zero every metric, keeping instrumentation in place"""
+    for metrics in _METRICS.values():
+        metrics.reset()
+
+def report() -> Dict[str, Dict[str, float]]:
+    """Calls, latency percentiles (ms) and allocated blocks per instrumented function"""
+    return {name: metrics.summary() for name, metrics in _METRICS.items()}
+
+def to_json() -> str:
+    return json.dumps(report(), indent=2)
+
+def to_prometheus() -> str:
+    """Metrics in the Prometheus text exposition format"""
+    lines = ["# TYPE battleship_call_latency_seconds histogram"]
+    for name, metrics in _METRICS.items():
+        latency = metrics.latency
+        label = f'function="{name}"'
+        cumulative = 0
+        for index, count in enumerate(latency.counts):
+            cumulative += count
+            lines.append(f'battleship_call_latency_seconds_bucket{{{label},le="{latency.bucket_bound(index):g}"}} '
+                         f'{cumulative}')
+        lines.append(f'battleship_call_latency_seconds_bucket{{{label},le="+Inf"}} {latency.count}')
+        lines.append(f"battleship_call_latency_seconds_sum{{{label}}} {latency.total}")
+        lines.append(f"battleship_call_latency_seconds_count{{{label}}} {latency.count}")
+    lines.append("# TYPE battleship_allocated_blocks_total counter")
+    for name, metrics in _METRICS.items():
+        lines.append(f'battleship_allocated_blocks_total{{function="{name}"}} {metrics.blocks}')
+    return "\n".join(lines) + "\n"
+
+class MetricsDumper:
+    """Background thread rewriting a metrics file every `interval` seconds"""
+
+    def __init__(self, path: str, interval: float = 10.0, format: str = "json"):
+        if format not in ("json", "prometheus"):
+            raise ValueError(f"Unknown metrics format {format!r}")
+        self.path = path
+        self.interval = interval
+        self.render = to_json if format == "json" else to_prometheus
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def dump(self) -> None:
+        """Write the current metrics, replacing the file atomically"""
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w") as file:
+            file.write(self.render())
+        os.replace(temporary, self.path)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.dump()
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="metrics-dumper", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the thread and write one final dump"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.dump()
@@ -0,0 +1,25 @@
+import argparse
+import asyncio
+from .server import DEFAULT_HOST, DEFAULT_PORT, run_server
+from ..game.strategies import DEFAULT_STRATEGY, available_strategies
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the Battleship game server")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--park-dir", help="park idle matches as snapshots in this directory")
+    parser.add_argument("--idle-timeout", type=float, default=60.0,
+                        help="seconds of inactivity before a match is parked")
+    parser.add_argument("--strategy", choices=available_strategies(), default=DEFAULT_STRATEGY,
+                        help="default computer strategy for new matches")
+    parser.add_argument("--move-budget", type=float,
+                        help="seconds per computer move; strategies that don't search within a budget ignore it")
+    args = parser.parse_args()
+    try:
+        asyncio.run(run_server(args.host, args.port, args.park_dir, args.idle_timeout,
+                               args.strategy, args.move_budget))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Async load generator for the game server.
+
+Opens many connections from one event loop; each connection plays matches
+back to back (AI-vs-AI by default, or human mode with random shots) and the
+run reports matches/second, requests/second and request latency percentiles.
+
+    python -m src.server.loadgen --connections 200 --matches 5
+"""
+import argparse
+import asyncio
+import json
+import time
+from random import Random
+from typing import Any, Dict, List
+from .server import DEFAULT_HOST, DEFAULT_PORT
+
+async def _request(reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                   request: Dict[str, Any], latencies: List[float]) -> Dict[str, Any]:
+    start = time.perf_counter()
+    writer.write(json.dumps(request).encode() + b"\n")
+    await writer.drain()
+    response = json.loads(await reader.readline())
+    latencies.append(time.perf_counter() - start)
+    if not response.get("ok"):
+        raise RuntimeError(response.get("error"))
+    return response
+
+async def _client(host: str, port: int, matches: int, mode: str, seed: int,
+                  latencies: List[float]) -> int:
+    """Play `matches` matches over one connection; returns the number finished"""
+    rng = Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    finished = 0
+    try:
+        for _ in range(matches):
+            match = await _request(reader, writer, {"op": "new", "mode": mode,
+                                                    "seed": rng.getrandbits(32)}, latencies)
+            match_id, size = match["match"], match["size"]
+            cells = [(x, y) for y in range(size) for x in range(size)]
+            rng.shuffle(cells)
+            while True:
+                if mode == "ai":
+                    request = {"op": "step", "match": match_id}
+                else:
+                    x, y = cells.pop()
+                    request = {"op": "shot", "match": match_id, "x": x, "y": y}
+                response = await _request(reader, writer, request, latencies)
+                if response["phase"] == "game_over":
+                    break
+            await _request(reader, writer, {"op": "close", "match": match_id}, latencies)
+            finished += 1
+    finally:
+        writer.close()
+    return finished
+
+async def run_load(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, connections: int = 100,
+                   matches: int = 5, mode: str = "ai", seed: int = 0) -> Dict[str, float]:
+    """Drive the server with concurrent clients and summarize throughput and latency"""
+    latencies: List[float] = []
+    start = time.perf_counter()
+    finished = await asyncio.gather(*(
+        _client(host, port, matches, mode, seed + i, latencies) for i in range(connections)
+    ))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+
+    def percentile(p: float) -> float:
+        return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000 if latencies else 0.0
+
+    return {
+        "matches": sum(finished),
+        "requests": len(latencies),
+        "elapsed": elapsed,
+        "matches_per_second": sum(finished) / elapsed,
+        "requests_per_second": len(latencies) / elapsed,
+        "p50_ms": percentile(0.50),
+        "p99_ms": percentile(0.99),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test a Battleship game server")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--connections", type=int, default=100)
+    parser.add_argument("--matches", type=int, default=5, help="matches per connection")
+    parser.add_argument("--mode", choices=["ai", "human"], default="ai")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    stats = asyncio.run(run_load(args.host, args.port, args.connections, args.matches,
+                                 args.mode, args.seed))
+    print(json.dumps(stats, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,356 @@
+"""Asyncio game server.
+
+Speaks newline-delimited JSON over TCP. Every request is one JSON object with
+an "op" field and gets exactly one JSON object back:
+
+    {"op": "new", "mode": "human" | "ai", "seed": 1}  -> {"ok": true, "match": 1}
+        (optionally "strategy": any registered AI strategy name, and "fleet":
+        one list of [x, y] cells per ship, each a straight line of adjacent cells)
+    {"op": "shot", "match": 1, "x": 3, "y": 4}        -> your shot + the computer's reply
+        (each with "hit" and "sunk", the name of the ship sunk or null)
+    {"op": "step", "match": 1}                        -> one AI-vs-AI turn
+    {"op": "close", "match": 1}                       -> {"ok": true}
+    {"op": "stats"}                                   -> {"ok": true, "matches": 12, "parked": 3,
+                                                          "latency": {strategy: move latencies}}
+
+Errors come back as {"ok": false, "error": "..."}. All matches live in one
+event loop; a connection costs one coroutine, never a thread. With a park
+directory configured, matches idle for longer than the idle timeout are
+snapshotted to disk and dropped from memory, then rehydrated on their next
+request with the same strategy and move budget (their random generators
+restart fresh). Closed matches go back to
+a MatchPool, so new matches reuse their boards and AI instead of allocating.
+
+Computer moves of strategies registered with offload=True are picked on a
+worker thread, so a slow strategy never stalls other connections.
+"""
+import asyncio
+import json
+import os
+import struct
+import time
+from itertools import count
+from random import Random
+from typing import Any, Dict, List, Optional, Set, Tuple
+from ..constants import BOARD_SIZE, SHIPS
+from ..game.board import Board, ShotResult
+from ..game.enums import GamePhase
+from ..game.fleet import place_random_fleet
+from ..game.game_state import GameState
+from ..game.player import AIPlayer
+from ..game.pool import MatchPool
+from ..game.ship import Ship
+from ..game.snapshot import dump_ai, load_ai
+from ..game.strategies import DEFAULT_STRATEGY, get_strategy, latency_report
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Parked match file: mode byte (0 = human, 1 = ai), game snapshot length, game
+# snapshot, then the player-side AI snapshot in AI-vs-AI mode
+PARK_HEADER = struct.Struct("<BI")
+
+class ProtocolError(Exception):
+    """Raised for requests the server cannot honour"""
+
+def _sunk_name(board: Board, result: ShotResult) -> Optional[str]:
+    """Name of the ship a shot sank, for responses"""
+    ship = board.sunk_ship(result)
+    return None if ship is None else ship.name
+
+class Match:
+    """A headless GameState plus, in AI-vs-AI mode, the AI playing the human side"""
+    __slots__ = ("game", "player_ai", "last_active", "busy")
+
+    def __init__(self, game: GameState, player_ai: Optional[AIPlayer] = None):
+        self.game = game
+        self.player_ai = player_ai
+        self.last_active = time.monotonic()
+        self.busy = False  # Waiting on an offloaded computer move
+
+class GameServer:
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                 board_size: int = BOARD_SIZE, ships: Dict[str, int] = SHIPS,
+                 park_dir: Optional[str] = None, idle_timeout: float = 60.0,
+                 strategy: str = DEFAULT_STRATEGY, move_budget: Optional[float] = None):
+        self.host = host
+        self.port = port
+        self.board_size = board_size
+        self.ships = ships
+        self.park_dir = park_dir
+        self.idle_timeout = idle_timeout
+        self.strategy = get_strategy(strategy).name
+        self.move_budget = move_budget
+        self.matches: Dict[int, Match] = {}
+        self.parked: Set[int] = set()
+        self.pool = MatchPool(board_size, ships)
+        self._ids = count(1)
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._parker: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Start listening; the bound port is stored back on self.port"""
+        self._server = await asyncio.start_server(self.handle_client, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        if self.park_dir is not None:
+            os.makedirs(self.park_dir, exist_ok=True)
+            self._parker = asyncio.create_task(self._park_periodically())
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._parker is not None:
+            self._parker.cancel()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve one connection; its matches are dropped when it disconnects"""
+        owned: Set[int] = set()
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Longer than the stream limit: answer, then discard the rest of
+                    # the line so closing doesn't reset the connection under the reply
+                    await self._respond(writer, {"ok": False, "error": "Request line too long"})
+                    while True:
+                        chunk = await reader.read(1 << 16)
+                        if not chunk or b"\n" in chunk:
+                            break
+                    break
+                if not line:
+                    break
+                try:
+                    response = await self.handle_request(json.loads(line), owned)
+                except (ProtocolError, ValueError, TypeError, KeyError) as error:
+                    response = {"ok": False, "error": str(error)}
+                await self._respond(writer, response)
+        except ConnectionError:
+            pass
+        finally:
+            for match_id in owned:
+                self._drop(match_id)
+            writer.close()
+
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, response: Dict[str, Any]) -> None:
+        writer.write(json.dumps(response, separators=(",", ":")).encode() + b"\n")
+        await writer.drain()
+
+    async def handle_request(self, request: Dict[str, Any], owned: Set[int]) -> Dict[str, Any]:
+        """Apply one request and build its response"""
+        if not isinstance(request, dict):
+            raise ProtocolError("Request must be a JSON object")
+        op = request.get("op")
+        if op == "new":
+            return self._new_match(request, owned)
+        if op == "stats":
+            return {"ok": True, "matches": len(self.matches), "parked": len(self.parked),
+                    "latency": latency_report()}
+        if op not in ("shot", "step", "close"):
+            raise ProtocolError(f"Unknown op {op!r}")
+
+        match_id = request.get("match")
+        if match_id not in owned:
+            raise ProtocolError(f"Unknown match {match_id}")
+        if op == "close":
+            owned.discard(match_id)
+            self._drop(match_id)
+            return {"ok": True}
+
+        match = self.matches.get(match_id) or self._unpark(match_id)
+        match.last_active = time.monotonic()
+        if op == "shot":
+            return await self._shot(match, request)
+        return await self._step(match)
+
+    def _new_match(self, request: Dict[str, Any], owned: Set[int]) -> Dict[str, Any]:
+        mode = request.get("mode", "human")
+        if mode not in ("human", "ai"):
+            raise ProtocolError(f"Unknown mode {mode!r}")
+        strategy = request.get("strategy", self.strategy)
+        try:
+            get_strategy(strategy)
+        except ValueError as error:
+            raise ProtocolError(str(error)) from None
+        fleet = request.get("fleet")
+        if fleet is not None:
+            fleet = self._parse_fleet(fleet)
+        rng = Random(request.get("seed"))
+        game = self.pool.acquire(rng, strategy, self.move_budget)
+
+        if fleet is None:
+            place_random_fleet(game.player_board, self.ships, rng)
+        else:
+            for (ship_name, length), coordinates in zip(self.ships.items(), fleet):
+                if not game.player_board.place_ship(Ship(ship_name, length, coordinates)):
+                    self.pool.release(game)
+                    raise ProtocolError(f"Invalid placement for {ship_name}")
+        game._setup_computer_ships()
+        game.current_phase = GamePhase.PLAYING
+
+        player_ai = None
+        if mode == "ai":
+            player_ai = AIPlayer(Random(rng.getrandbits(64)), self.board_size, self.ships)
+        match_id = next(self._ids)
+        self.matches[match_id] = Match(game, player_ai)
+        owned.add(match_id)
+        return {"ok": True, "match": match_id, "size": self.board_size,
+                "fleet": [ship.coordinates for ship in game.player_board.ships]}
+
+    def _parse_fleet(self, fleet: Any) -> List[List[Tuple[int, int]]]:
+        """Ship coordinates from a request, each a straight run of adjacent cells"""
+        if not isinstance(fleet, list) or len(fleet) != len(self.ships):
+            raise ProtocolError(f"Fleet must have {len(self.ships)} ships")
+        parsed = []
+        for (ship_name, length), coordinates in zip(self.ships.items(), fleet):
+            if (not isinstance(coordinates, list) or len(coordinates) != length
+                    or not all(isinstance(cell, list) and len(cell) == 2
+                               and all(type(value) is int for value in cell) for cell in coordinates)):
+                raise ProtocolError(f"{ship_name} must be a list of {length} [x, y] cells")
+            cells = sorted(tuple(cell) for cell in coordinates)
+            x, y = cells[0]
+            if (cells != [(x + i, y) for i in range(length)]
+                    and cells != [(x, y + i) for i in range(length)]):
+                raise ProtocolError(f"{ship_name} must be a straight line of adjacent cells")
+            parsed.append(cells)
+        return parsed
+
+    def _park_path(self, match_id: int) -> str:
+        return os.path.join(self.park_dir, f"{match_id}.match")
+
+    async def _park_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.idle_timeout / 2)
+            self.park_idle()
+
+    def park_idle(self, now: Optional[float] = None) -> int:
+        """Snapshot matches idle past the timeout to disk; returns how many were parked"""
+        now = time.monotonic() if now is None else now
+        idle = [match_id for match_id, match in self.matches.items()
+                if now - match.last_active >= self.idle_timeout and not match.busy]
+        parked = 0
+        for match_id in idle:
+            try:
+                self.park(match_id)
+            except OSError:
+                continue  # Stays in memory and is retried next round
+            parked += 1
+        return parked
+
+    def park(self, match_id: int) -> None:
+        """Move a match from memory to its snapshot file
+
+        The match leaves memory only once the file is written; if writing
+        fails, the OSError propagates and the match stays where it was.
+        """
+        match = self.matches[match_id]
+        game = match.game.snapshot()
+        data = PARK_HEADER.pack(0 if match.player_ai is None else 1, len(game)) + game
+        if match.player_ai is not None:
+            data += dump_ai(match.player_ai, self.board_size)
+        path = self._park_path(match_id)
+        try:
+            with open(path, "wb") as file:
+                file.write(data)
+        except OSError:
+            if os.path.exists(path):
+                os.remove(path)
+            raise
+        del self.matches[match_id]
+        self.parked.add(match_id)
+        if not match.busy:
+            self.pool.release(match.game)
+
+    def _unpark(self, match_id: int) -> Match:
+        """Rehydrate a parked match from its snapshot file"""
+        if match_id not in self.parked:
+            raise ProtocolError(f"Unknown match {match_id}")
+        path = self._park_path(match_id)
+        with open(path, "rb") as file:
+            data = file.read()
+        os.remove(path)
+        self.parked.discard(match_id)
+
+        mode, length = PARK_HEADER.unpack_from(data, 0)
+        start = PARK_HEADER.size
+        game = self.pool.acquire(Random())
+        game.restore(data[start:start + length])
+        player_ai = None
+        if mode == 1:
+            player_ai = AIPlayer(Random(), self.board_size, self.ships)
+            load_ai(data[start + length:], player_ai, self.board_size)
+        match = self.matches[match_id] = Match(game, player_ai)
+        return match
+
+    def _drop(self, match_id: int) -> None:
+        """Forget a match, in memory or parked"""
+        match = self.matches.pop(match_id, None)
+        # A busy game may still be read by its worker thread, so it is not reused
+        if match is not None and not match.busy:
+            self.pool.release(match.game)
+        if match_id in self.parked:
+            self.parked.discard(match_id)
+            os.remove(self._park_path(match_id))
+
+    async def _shot(self, match: Match, request: Dict[str, Any]) -> Dict[str, Any]:
+        if match.player_ai is not None:
+            raise ProtocolError("AI-vs-AI matches advance with 'step'")
+        x, y = int(request["x"]), int(request["y"])
+        if not (0 <= x < self.board_size and 0 <= y < self.board_size):
+            raise ProtocolError("Shot out of bounds")
+        if match.game.computer_board.has_shot(x, y):
+            raise ProtocolError("You already shot there!")
+        return await self._turn(match, x, y)
+
+    async def _step(self, match: Match) -> Dict[str, Any]:
+        if match.player_ai is None:
+            raise ProtocolError("Human matches advance with 'shot'")
+        board = match.game.computer_board
+        x, y = match.player_ai.get_shot(board)
+        response = await self._turn(match, x, y)
+        match.player_ai.process_shot_result(x, y, response["hit"],
+                                            board.sunk_ship_at(x, y) if response["sunk"] else None)
+        return response
+
+    async def _turn(self, match: Match, x: int, y: int) -> Dict[str, Any]:
+        """Player shot followed by the computer's reply, as in the GUI click handler"""
+        game = match.game
+        if game.current_phase != GamePhase.PLAYING:
+            raise ProtocolError("Game is over")
+
+        result, message = game.player_turn(x, y)
+        response = {"ok": True, "x": x, "y": y, "hit": result.hit, "sunk": _sunk_name(game.computer_board, result),
+                    "message": message}
+        if game.current_phase == GamePhase.PLAYING:
+            if get_strategy(game.strategy).offload:
+                match.busy = True
+                try:
+                    move = await asyncio.get_running_loop().run_in_executor(None, game.choose_computer_shot)
+                finally:
+                    match.busy = False
+            else:
+                move = game.choose_computer_shot()
+            result, message = game.apply_computer_shot(*move)
+            reply_x, reply_y = move
+            response["reply"] = {"x": reply_x, "y": reply_y, "hit": result.hit,
+                                 "sunk": _sunk_name(game.player_board, result), "message": message}
+        response["phase"] = game.current_phase.value
+        response["winner"] = game.winner
+        return response
+
+async def run_server(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                     park_dir: Optional[str] = None, idle_timeout: float = 60.0,
+                     strategy: str = DEFAULT_STRATEGY, move_budget: Optional[float] = None) -> None:
+    server = GameServer(host, port, park_dir=park_dir, idle_timeout=idle_timeout,
+                        strategy=strategy, move_budget=move_budget)
+    await server.start()
+    print(f"Battleship server listening on {server.host}:{server.port}")
+    await server.serve_forever()
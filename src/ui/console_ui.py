@@ -1,86 +1,157 @@
-from typing import Tuple, List
-from ..constants import BOARD_SIZE, WATER, SHIP, HIT, MISS
+"""Console front end.
+
+Every frame is rendered into one string and written in a single call, and
+output is only flushed before reading input. With ansi=True the screen is
+laid out at fixed positions and later frames rewrite only the cells that
+changed, which keeps redraws small over slow links.
+
+Input that is not a terminal (a pipe or a file) is treated as a script:
+moves are read line by line without prompts, blank lines are skipped, and
+EOFError is raised once the script runs out.
+"""
+import sys
+from collections import deque
+from typing import List, Optional, TextIO, Tuple
+from ..constants import BOARD_SIZE
 from ..game.board import Board
-from ..game.enums import GamePhase
+
+# Latest messages kept on screen in ANSI mode
+MESSAGE_LINES = 2
+
+_HOME_CLEAR = "\x1b[H\x1b[2J"
+_CLEAR_LINE = "\x1b[K"
+_CLEAR_BELOW = "\x1b[J"
+
+def _move(row: int, column: int) -> str:
+    """ANSI cursor position, 1-based"""
+    return f"\x1b[{row};{column}H"
 
 class ConsoleUI:
-    @staticmethod
-    def display_boards(player_board: Board, computer_board: Board):
+    def __init__(self, board_size: int = BOARD_SIZE, input: Optional[TextIO] = None,
+                 output: Optional[TextIO] = None, ansi: bool = False):
+        self.board_size = board_size
+        self.input = input or sys.stdin
+        self.output = output or sys.stdout
+        self.ansi = ansi
+        self.prompts = self.input.isatty()
+        self._frame: Optional[List[str]] = None  # Board lines of the last ANSI frame
+        self._messages = deque(maxlen=MESSAGE_LINES)
+
+    def render_boards(self, player_board: Board, computer_board: Board) -> List[str]:
+        """Lines of both boards side by side: two header lines, then one per row"""
+        size = self.board_size
+        label = len(str(size - 1))
+        columns = "".join(str(x % 10) for x in range(size))
+        lines = [" " * (label + 1) + "Your Board".ljust(size + label + 9) + "Computer's Board",
+                 " " * (label + 1) + columns + " " * 8 + " " * (label + 1) + columns]
+        # Computer's ships stay hidden
+        for y, (player_row, computer_row) in enumerate(zip(player_board.rows(),
+                                                           computer_board.rows(hide_ships=True))):
+            lines.append(f"{y:>{label}} {player_row}        {y:>{label}} {computer_row}")
+        return lines
+
+    def display_boards(self, player_board: Board, computer_board: Board):
         """Display both game boards side by side"""
-        print("\n  Your Board          Computer's Board")
-        print("  0123456789          0123456789")
-        
-        for y in range(BOARD_SIZE):
-            # Player's board
-            print(f"{y} ", end="")
-            for x in range(BOARD_SIZE):
-                print(player_board.grid[y][x], end="")
-            
-            # Separator
-            print("        ", end="")
-            
-            # Computer's board (hiding ships)
-            print(f"{y} ", end="")
-            for x in range(BOARD_SIZE):
-                cell = computer_board.grid[y][x]
-                if cell == SHIP:  # Hide computer's ships
-                    print(WATER, end="")
-                else:
-                    print(cell, end="")
-            print()
+        lines = self.render_boards(player_board, computer_board)
+        if not self.ansi:
+            self.output.write("\n" + "\n".join(lines) + "\n")
+        elif self._frame is None or len(self._frame) != len(lines):
+            self.output.write(_HOME_CLEAR + "\n".join(lines) + self._render_messages())
+        else:
+            self.output.write(self._render_changes(lines))
+        self._frame = lines
 
-    @staticmethod
-    def get_shot_input() -> Tuple[int, int]:
+    def _render_changes(self, lines: List[str]) -> str:
+        """Cursor moves and text rewriting each run of changed characters"""
+        parts = []
+        for row, (old, new) in enumerate(zip(self._frame, lines), 1):
+            if old == new:
+                continue
+            column = 0
+            while column < len(new):
+                if column < len(old) and old[column] == new[column]:
+                    column += 1
+                    continue
+                start = column
+                while column < len(new) and (column >= len(old) or old[column] != new[column]):
+                    column += 1
+                parts.append(_move(row, start + 1) + new[start:column])
+        return "".join(parts)
+
+    def _render_messages(self) -> str:
+        """The message lines below the boards (ANSI mode)"""
+        first = self.board_size + 4
+        return "".join(_move(first + index, 1) + message + _CLEAR_LINE
+                       for index, message in enumerate(self._messages))
+
+    def _read_line(self, prompt: str) -> str:
+        """Next input line, prompting only interactive users"""
+        while True:
+            if self.prompts:
+                if self.ansi:
+                    prompt = _move(self.board_size + 4 + MESSAGE_LINES, 1) + _CLEAR_BELOW + prompt.lstrip("\n")
+                self.output.write(prompt)
+            self.output.flush()
+            line = self.input.readline()
+            if not line:
+                raise EOFError("Input ended")
+            line = line.strip()
+            if line or self.prompts:
+                return line
+
+    def get_shot_input(self) -> Tuple[int, int]:
         """Get shot coordinates from the player"""
         while True:
             try:
-                move = input("\nEnter your shot (row,col): ")
+                move = self._read_line("\nEnter your shot (row,col): ")
                 y, x = map(int, move.split(','))
-                if 0 <= x < BOARD_SIZE and 0 <= y < BOARD_SIZE:
+                if 0 <= x < self.board_size and 0 <= y < self.board_size:
                     return x, y
-                print(f"Coordinates must be between 0 and {BOARD_SIZE-1}")
+                self.show_message(f"Coordinates must be between 0 and {self.board_size-1}")
             except ValueError:
-                print("Invalid input. Please enter row,col (e.g., 3,4)")
+                self.show_message("Invalid input. Please enter row,col (e.g., 3,4)")
 
-    @staticmethod
-    def get_ship_placement(ship_name: str, length: int) -> List[Tuple[int, int]]:
+    def get_ship_placement(self, ship_name: str, length: int) -> List[Tuple[int, int]]:
         """Get ship placement coordinates from the player"""
-        print(f"\nPlacing {ship_name} (length: {length})")
+        self.show_message(f"Placing {ship_name} (length: {length})")
         while True:
             try:
-                start = input("Enter start position (row,col): ")
-                direction = input("Enter direction (h/v): ").lower()
-                
+                start = self._read_line("Enter start position (row,col): ")
+                direction = self._read_line("Enter direction (h/v): ").lower()
+
                 start_y, start_x = map(int, start.split(','))
                 coordinates = []
-                
+
                 if direction == 'h':
-                    if start_x + length > BOARD_SIZE:
-                        print("Ship would be out of bounds!")
+                    if start_x + length > self.board_size:
+                        self.show_message("Ship would be out of bounds!")
                         continue
                     coordinates = [(start_x + i, start_y) for i in range(length)]
                 elif direction == 'v':
-                    if start_y + length > BOARD_SIZE:
-                        print("Ship would be out of bounds!")
+                    if start_y + length > self.board_size:
+                        self.show_message("Ship would be out of bounds!")
                         continue
                     coordinates = [(start_x, start_y + i) for i in range(length)]
                 else:
-                    print("Invalid direction! Use 'h' for horizontal or 'v' for vertical")
+                    self.show_message("Invalid direction! Use 'h' for horizontal or 'v' for vertical")
                     continue
-                
+
                 return coordinates
-                
+
             except ValueError:
-                print("Invalid input. Please enter coordinates as row,col (e.g., 3,4)")
+                self.show_message("Invalid input. Please enter coordinates as row,col (e.g., 3,4)")
 
-    @staticmethod
-    def show_message(message: str):
+    def show_message(self, message: str):
         """Display a game message"""
-        print(f"\n{message}")
+        if self.ansi:
+            self._messages.append(message)
+            self.output.write(self._render_messages())
+        else:
+            self.output.write(f"\n{message}\n")
 
-    @staticmethod
-    def show_game_over(winner: str):
+    def show_game_over(self, winner: str):
         """Display game over message"""
-        print("\n" + "="*40)
-        print(f"Game Over! {winner} wins!")
-        print("="*40)
+        if self.ansi:
+            self.output.write(_move(self.board_size + 4 + MESSAGE_LINES, 1) + _CLEAR_BELOW)
+        self.output.write("\n" + "="*40 + f"\nGame Over! {winner} wins!\n" + "="*40 + "\n")
+        self.output.flush()
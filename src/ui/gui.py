@@ -1,22 +1,36 @@
 import tkinter as tk
+from collections import deque
 from tkinter import messagebox
-from typing import List, Tuple, Callable
+from typing import Dict, List, Optional, Set, Tuple, Callable
 from ..constants import BOARD_SIZE, WATER, SHIP, HIT, MISS, EMPTY
 from ..game.board import Board
 
+# Latest messages shown in the status line below the boards
+MESSAGE_LINES = 2
+STATUS_HEIGHT = 40
+
+# Cells at least this many pixels wide get their own canvas items and X/O
+# markers; smaller ones are painted into one image per board, since a canvas
+# slows to a crawl with millions of items
+ITEM_CELL_SIZE = 16
+# Image colours per cell state, with shots filled in place of their marker
+IMAGE_COLORS = {EMPTY: "white", SHIP: "gray", HIT: "red", MISS: "lightblue"}
+
 class BattleshipGUI:
-    def __init__(self, root: tk.Tk):
+    def __init__(self, root: tk.Tk, board_size: int = BOARD_SIZE):
         self.root = root
         self.root.title("Battleship")
-        self.cell_size = 40
+        self.board_size = board_size
+        # Shrink cells on large boards so both fit on screen
+        self.cell_size = max(2, min(40, 400 // board_size))
         self.margin = 20
         
         # Create game boards
-        board_width = BOARD_SIZE * self.cell_size + 2 * self.margin
+        board_width = board_size * self.cell_size + 2 * self.margin
         total_width = board_width * 2 + self.margin * 3
-        window_height = BOARD_SIZE * self.cell_size + self.margin * 3
+        window_height = board_size * self.cell_size + self.margin * 3
         
-        self.root.geometry(f"{total_width}x{window_height}")
+        self.root.geometry(f"{total_width}x{window_height + STATUS_HEIGHT}")
         
         # Player board canvas
         self.player_canvas = tk.Canvas(
@@ -33,6 +47,11 @@ class BattleshipGUI:
             height=window_height
         )
         self.computer_canvas.grid(row=0, column=1, padx=self.margin)
+
+        # Messages go to a status line rather than a modal box, so they never stall the event loop
+        self._messages = deque(maxlen=MESSAGE_LINES)
+        self.status = tk.Label(root, text="", anchor="w", justify=tk.LEFT, height=MESSAGE_LINES)
+        self.status.grid(row=1, column=0, columnspan=2, sticky="we", padx=self.margin)
         
         # Bind click event for computer's board
         self.computer_canvas.bind('<Button-1>', self.handle_click)
@@ -40,25 +59,83 @@ class BattleshipGUI:
         # Store callback for shot processing
         self.process_shot_callback: Callable[[int, int], None] = None
 
+        # Persistent cell items, the board last drawn with its generation and delta count,
+        # and the non-blank cells, per canvas
+        self._cell_items: Dict[tk.Canvas, Tuple[List[int], List[int]]] = {}
+        self._images: Dict[tk.Canvas, tk.PhotoImage] = {}  # Instead of cell items on small cells
+        self._last_frame: Dict[tk.Canvas, Tuple[Optional[Board], int, int]] = {}
+        self._painted: Dict[tk.Canvas, Set[int]] = {}
+
     def draw_board(self, canvas: tk.Canvas, board: Board, hide_ships: bool = False):
-        """Draw a game board on the specified canvas"""
+        """Draw a game board on the specified canvas
+
+        The grid and one rectangle/text item per cell (or, for cells smaller
+        than ITEM_CELL_SIZE, one image for the whole board) are created on the
+        first call; later calls only repaint the cells in the board's delta log
+        since the previous frame drawn on that canvas. Switching to another
+        board, or drawing one reset since, repaints the cells painted so far
+        and replays its whole log.
+        """
+        if canvas not in self._cell_items:
+            self._draw_grid(canvas)
+        rects, texts = self._cell_items[canvas]
+        image = self._images.get(canvas)
+        size = self.cell_size
+        painted = self._painted[canvas]
+
+        last_board, generation, cursor = self._last_frame[canvas]
+        changed = set()
+        if last_board is not board or generation != board.generation:
+            changed.update(painted)
+            cursor = 0
+        changed.update(cell for cell, _ in board.deltas(cursor))
+        self._last_frame[canvas] = (board, board.generation, board.delta_count)
+
+        for index in changed:
+            cell = board.cell(index % self.board_size, index // self.board_size)
+
+            # If hiding ships and it's a ship cell, show as empty unless hit
+            if hide_ships and cell == SHIP:
+                cell = EMPTY
+            if cell == EMPTY:
+                painted.discard(index)
+            else:
+                painted.add(index)
+
+            if image is not None:
+                x, y = index % self.board_size * size, index // self.board_size * size
+                image.put(IMAGE_COLORS[cell], to=(x, y, x + size, y + size))
+                continue
+            canvas.itemconfig(rects[index], fill=self._get_cell_color(cell) or "")
+
+            # Show hits and misses
+            if cell in [HIT, MISS]:
+                text = "X" if cell == HIT else "O"
+                canvas.itemconfig(texts[index], text=text, fill="red" if cell == HIT else "blue")
+            else:
+                canvas.itemconfig(texts[index], text="")
+
+    def _draw_grid(self, canvas: tk.Canvas):
+        """Draw the static grid and create the persistent per-cell items"""
         canvas.delete("all")
-        
-        # Draw grid
-        for i in range(BOARD_SIZE + 1):
+
+        size = self.board_size
+
+        # Draw grid (lines on cells this small would hide them)
+        for i in range(size + 1 if self.cell_size >= 4 else 0):
             # Vertical lines
             canvas.create_line(
                 self.margin + i * self.cell_size, self.margin,
-                self.margin + i * self.cell_size, self.margin + BOARD_SIZE * self.cell_size
+                self.margin + i * self.cell_size, self.margin + size * self.cell_size
             )
             # Horizontal lines
             canvas.create_line(
                 self.margin, self.margin + i * self.cell_size,
-                self.margin + BOARD_SIZE * self.cell_size, self.margin + i * self.cell_size
+                self.margin + size * self.cell_size, self.margin + i * self.cell_size
             )
             
-            # Draw coordinates
-            if i < BOARD_SIZE:
+            # Draw coordinates (only where the labels have room)
+            if i < size and self.cell_size >= 16:
                 # Row numbers
                 canvas.create_text(
                     self.margin/2, 
@@ -71,35 +148,32 @@ class BattleshipGUI:
                     self.margin/2,
                     text=str(i)
                 )
-        
-        # Draw cells
-        for y in range(BOARD_SIZE):
-            for x in range(BOARD_SIZE):
-                cell = board.grid[y][x]
-                
-                # If hiding ships and it's a ship cell, show as empty unless hit
-                if hide_ships and cell == SHIP:
-                    cell = EMPTY
-                
-                color = self._get_cell_color(cell)
-                if color:
-                    canvas.create_rectangle(
-                        self.margin + x * self.cell_size,
-                        self.margin + y * self.cell_size,
-                        self.margin + (x + 1) * self.cell_size,
-                        self.margin + (y + 1) * self.cell_size,
-                        fill=color
-                    )
-                
-                # Show hits and misses
-                if cell in [HIT, MISS]:
-                    text = "X" if cell == HIT else "O"
-                    canvas.create_text(
-                        self.margin + x * self.cell_size + self.cell_size/2,
-                        self.margin + y * self.cell_size + self.cell_size/2,
-                        text=text,
-                        fill="red" if cell == HIT else "blue"
-                    )
+
+        self._last_frame[canvas] = (None, 0, 0)
+        self._painted[canvas] = set()
+        # Cell items, indexed like the board cells (y * size + x)
+        rects, texts = [], []
+        self._cell_items[canvas] = (rects, texts)
+        if self.cell_size < ITEM_CELL_SIZE:
+            pixels = size * self.cell_size
+            image = self._images[canvas] = tk.PhotoImage(master=self.root, width=pixels, height=pixels)
+            image.put(IMAGE_COLORS[EMPTY], to=(0, 0, pixels, pixels))
+            canvas.create_image(self.margin, self.margin, image=image, anchor="nw")
+            return
+        for y in range(size):
+            for x in range(size):
+                rects.append(canvas.create_rectangle(
+                    self.margin + x * self.cell_size,
+                    self.margin + y * self.cell_size,
+                    self.margin + (x + 1) * self.cell_size,
+                    self.margin + (y + 1) * self.cell_size,
+                    fill=""
+                ))
+                texts.append(canvas.create_text(
+                    self.margin + x * self.cell_size + self.cell_size/2,
+                    self.margin + y * self.cell_size + self.cell_size/2,
+                    text=""
+                ))
 
     def _get_cell_color(self, cell: str) -> str:
         """Get the color for a cell based on its state"""
@@ -121,12 +195,13 @@ class BattleshipGUI:
         x = (event.x - self.margin) // self.cell_size
         y = (event.y - self.margin) // self.cell_size
         
-        if 0 <= x < BOARD_SIZE and 0 <= y < BOARD_SIZE:
+        if 0 <= x < self.board_size and 0 <= y < self.board_size:
             self.process_shot_callback(x, y)
 
     def show_message(self, message: str):
-        """Display a message box"""
-        messagebox.showinfo("Battleship", message)
+        """Display a message in the status line"""
+        self._messages.append(message)
+        self.status.config(text="\n".join(self._messages))
 
     def get_ship_placement(self, ship_name: str, length: int) -> List[Tuple[int, int]]:
         """Get ship placement from GUI input"""
@@ -0,0 +1,186 @@
+"""Spectator mode: watch AI-vs-AI games streamed into the GUI.
+
+A simulation thread plays games between two strategies and pushes every
+event (new game, shot, game over) onto a bounded queue, pacing itself to
+the requested number of moves per second. The Tk thread polls the queue
+every FRAME_MS, applies everything queued to mirror boards and redraws once,
+so when the simulation outpaces rendering the intermediate frames are
+dropped rather than queued up. A full queue blocks the simulation, which
+bounds memory at unlimited speed.
+"""
+import queue
+import random
+import threading
+import tkinter as tk
+from time import perf_counter
+from typing import Dict, List, Optional, Tuple
+from .gui import BattleshipGUI
+from ..constants import SHIPS
+from ..game.board import Board
+from ..game.fleet import place_random_fleet
+from ..game.simulation import close_ai
+from ..game.ship import Ship
+from ..game.strategies import choose_shot, create_strategy
+
+FRAME_MS = 16        # Queue poll interval, about 60 frames per second
+QUEUE_SIZE = 1024    # Events buffered between the simulation and the GUI
+GAME_PAUSE = 1.0     # Seconds the final position of a game stays on screen
+MAX_SPEED = 1000     # Moves per second at the top of the speed slider
+
+# Events: ("game", number, fleets), ("shot", side, x, y), ("over", winner)
+# where fleets holds (name, length, coordinates) per ship for each side
+Event = Tuple
+
+def _fleet(board: Board) -> List[Tuple[str, int, List[Tuple[int, int]]]]:
+    return [(ship.name, ship.length, list(ship.coordinates)) for ship in board.ships]
+
+class Simulation(threading.Thread):
+    """Plays games between two strategies forever, pushing events onto a queue
+
+    speed is in moves per second (both sides count); None runs flat out.
+    Side 0 fires at side 1's board and vice versa.
+    """
+
+    def __init__(self, events: "queue.Queue[Event]", strategies: Tuple[str, str],
+                 size: int, ships: Dict[str, int] = SHIPS, speed: Optional[float] = None,
+                 rng=None):
+        super().__init__(name="spectator-simulation", daemon=True)
+        self.events = events
+        self.strategies = strategies
+        self.size = size
+        self.ships = ships
+        self.speed = speed
+        self.rng = rng or random.Random()
+        self.boards = [Board(size), Board(size)]  # Reset and reused for every game
+        self._stop_event = threading.Event()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+    def _put(self, event: Event) -> bool:
+        """Queue an event, waiting while the queue is full; False once stopped"""
+        while not self._stop_event.is_set():
+            try:
+                self.events.put(event, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def run(self) -> None:
+        game = 0
+        while not self._stop_event.is_set():
+            game += 1
+            if not self._play(game) or self._stop_event.wait(GAME_PAUSE):
+                return
+
+    def _play(self, game: int) -> bool:
+        """Play one game; False if stopped part way"""
+        boards = self.boards
+        for board in boards:
+            board.reset()
+            place_random_fleet(board, self.ships, self.rng)
+        ais = [create_strategy(name, self.rng, self.size, self.ships) for name in self.strategies]
+        try:
+            return self._play_out(game, boards, ais)
+        finally:
+            for ai in ais:
+                close_ai(ai)
+
+    def _play_out(self, game: int, boards: List[Board], ais: List) -> bool:
+        """Stream one game between ready boards and AIs; False if stopped part way"""
+        if not self._put(("game", game, [_fleet(board) for board in boards])):
+            return False
+        side = 0
+        next_move = perf_counter()
+        while True:
+            target = boards[1 - side]
+            x, y = choose_shot(self.strategies[side], ais[side], target)
+            result = target.receive_shot(x, y)
+            ais[side].process_shot_result(x, y, result.hit, target.sunk_ship(result))
+            if not self._put(("shot", side, x, y)):
+                return False
+            if result.sunk and target.all_ships_sunk():
+                return self._put(("over", side))
+            side = 1 - side
+            speed = self.speed
+            if speed:
+                # Pace against a running schedule so slow moves don't accumulate drift
+                next_move = max(next_move + 1 / speed, perf_counter() - 1)
+                delay = next_move - perf_counter()
+                if delay > 0 and self._stop_event.wait(delay):
+                    return False
+
+class Spectator:
+    """Streams games between two strategies into a BattleshipGUI
+
+    The left board belongs to strategies[0] and the right one to
+    strategies[1]; both fleets are shown.
+    """
+
+    def __init__(self, root: tk.Tk, gui: BattleshipGUI, strategies: Tuple[str, str],
+                 ships: Dict[str, int] = SHIPS, speed: Optional[float] = 20.0, rng=None):
+        self.root = root
+        self.gui = gui
+        self.strategies = strategies
+        self.ships = ships
+        self.events: "queue.Queue[Event]" = queue.Queue(QUEUE_SIZE)
+        self.simulation = Simulation(self.events, strategies, gui.board_size, ships, speed, rng)
+        self.boards = [Board(gui.board_size), Board(gui.board_size)]
+        self.game = 0
+        self.wins = [0, 0]
+        # Render statistics: frames drawn and moves that never got a frame of their own
+        self.frames = 0
+        self.dropped = 0
+
+        self.speed_scale = tk.Scale(root, from_=1, to=MAX_SPEED, orient=tk.HORIZONTAL,
+                                    label="Moves per second", command=self._set_speed)
+        self.speed_scale.set(MAX_SPEED if speed is None else speed)
+        self.speed_scale.grid(row=2, column=0, columnspan=2, sticky="we", padx=gui.margin)
+        self.root.geometry("")  # Grow the window to fit the slider
+
+    def start(self) -> None:
+        self.simulation.start()
+        self.root.after(FRAME_MS, self._poll)
+
+    def stop(self) -> None:
+        self.simulation.stop()
+
+    def _set_speed(self, value: str) -> None:
+        speed = float(value)
+        # The top of the slider runs the simulation as fast as it can go
+        self.simulation.speed = None if speed >= MAX_SPEED else speed
+
+    def _poll(self) -> None:
+        """Apply every queued event and draw the result once"""
+        moves = 0
+        redraw = False
+        while True:
+            try:
+                event = self.events.get_nowait()
+            except queue.Empty:
+                break
+            kind = event[0]
+            if kind == "shot":
+                _, side, x, y = event
+                self.boards[1 - side].receive_shot(x, y)
+                moves += 1
+                redraw = True
+            elif kind == "game":
+                _, self.game, fleets = event
+                for board, fleet in zip(self.boards, fleets):
+                    board.reset()
+                    for name, length, coordinates in fleet:
+                        board.place_ship(Ship(name, length, coordinates))
+                redraw = True
+                self.gui.show_message(f"Game {self.game}: {self.strategies[0]} vs {self.strategies[1]}")
+            else:
+                self.wins[event[1]] += 1
+                self.gui.show_message(f"Game {self.game}: {self.strategies[event[1]]} wins "
+                                      f"({self.wins[0]}-{self.wins[1]})")
+        if redraw:
+            self.frames += 1
+            self.dropped += max(0, moves - 1)
+            self.gui.draw_board(self.gui.player_canvas, self.boards[0])
+            self.gui.draw_board(self.gui.computer_canvas, self.boards[1])
+        self.root.after(FRAME_MS, self._poll)
@@ -0,0 +1,67 @@
+from random import Random
+import numpy as np
+from src.game.batch import BatchBoards, density_policy, placement_indices, simulate_batch
+from src.game.board import Board
+from src.game.density import DensityAIPlayer
+from src.game.fleet import place_random_fleet
+from src.game.ship import Ship
+
+SIZE = 6
+SHIPS = {"Cruiser": 3, "Destroyer": 2, "Submarine": 2}
+
+def _boards(count: int, seed: int, shots: int):
+    """Boards with a random fleet and `shots` random shots, and the same games as a batch"""
+    rng = Random(seed)
+    boards = []
+    for _ in range(count):
+        board = Board(SIZE)
+        place_random_fleet(board, SHIPS, rng)
+        for cell in rng.sample(range(SIZE * SIZE), shots):
+            board.receive_shot(cell % SIZE, cell // SIZE)
+        boards.append(board)
+    return boards, BatchBoards.from_boards(boards, SHIPS, SIZE)
+
+def test_random_fleets_are_straight_and_disjoint():
+    batch = BatchBoards.random(200, np.random.default_rng(0), SHIPS, SIZE)
+    for owner in batch.owner:
+        for index, length in enumerate(SHIPS.values()):
+            cells = np.flatnonzero(owner == index)
+            assert any((cells == placement).all() for placement in placement_indices(SIZE, length))
+        assert (owner >= 0).sum() == sum(SHIPS.values())
+
+def test_shots_resolve_like_board():
+    boards, batch = _boards(20, 1, 0)
+    rng = Random(2)
+    rows = np.arange(len(boards))
+    for _ in range(SIZE * SIZE):
+        cells = np.array([rng.randrange(SIZE * SIZE) for _ in boards])
+        hit, sunk = batch.receive_shots(cells % SIZE, cells // SIZE, rows)
+        for row, (board, cell) in enumerate(zip(boards, cells)):
+            result = board.receive_shot(int(cell) % SIZE, int(cell) // SIZE)
+            assert hit[row] == result.hit
+            assert sunk[row] == (result.ship if result.sunk else -1)
+    assert (batch.all_ships_sunk() == [board.all_ships_sunk() for board in boards]).all()
+
+def test_density_policy_picks_a_best_cell_of_the_density_ai():
+    for shots in (0, 6, 14):
+        boards, batch = _boards(30, shots, shots)
+        xs, ys = density_policy(batch, np.random.default_rng(shots), np.arange(len(boards)))
+        for board, x, y in zip(boards, xs, ys):
+            ai = DensityAIPlayer(Random(), SIZE, SHIPS, opening_book=False)
+            replay = Board(SIZE)
+            for ship in board.ships:
+                replay.place_ship(Ship(ship.name, ship.length, ship.coordinates))
+            for shot_x, shot_y in board.shots:
+                result = replay.receive_shot(shot_x, shot_y)
+                ai.process_shot_result(shot_x, shot_y, result.hit, replay.sunk_ship(result))
+            scores = ai._target_scores() if ai.open_hits else None
+            if not scores:
+                scores = {cell: value for cell, value in enumerate(ai.density) if not ai.shot[cell]}
+            assert scores.get(int(y) * SIZE + int(x)) == max(scores.values())
+
+def test_simulation_finishes_every_game_reproducibly():
+    result = simulate_batch(50, seed=3, policy_b=density_policy, ships=SHIPS, size=SIZE)
+    assert result.games == result.wins_a + result.wins_b == 50
+    assert sum(SHIPS.values()) <= result.min_shots_to_win <= result.max_shots_to_win <= SIZE * SIZE
+    again = simulate_batch(50, seed=3, policy_b=density_policy, ships=SHIPS, size=SIZE)
+    assert (again.wins_a, again.total_shots_to_win) == (result.wins_a, result.total_shots_to_win)
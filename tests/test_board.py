@@ -0,0 +1,74 @@
+from src.game.board import INVALID_SHOT, MISSED_SHOT, SHARED_RESULTS, Board
+from src.game.enums import Outcome
+from src.game.ship import Ship
+
+def _board() -> Board:
+    board = Board(5)
+    board.place_ship(Ship("Cruiser", 3, [(0, 0), (1, 0), (2, 0)]))
+    board.place_ship(Ship("Destroyer", 2, [(4, 3), (4, 4)]))
+    return board
+
+def test_miss():
+    board = _board()
+    result = board.receive_shot(3, 3)
+    assert result == MISSED_SHOT
+    assert result.outcome == Outcome.MISS and result.ship == -1
+    assert not result and not result.hit and not result.sunk
+
+def test_hit_then_sunk():
+    board = _board()
+    first = board.receive_shot(4, 3)
+    assert first.outcome == Outcome.HIT and first.ship == 1
+    assert first and first.hit and not first.sunk
+    assert board.sunk_ship(first) is None
+
+    second = board.receive_shot(4, 4)
+    assert second.outcome == Outcome.SUNK and second.ship == 1
+    assert second.hit and second.sunk
+    assert board.sunk_ship(second) is board.ships[1]
+    assert board.sunk_count == 1
+    assert not board.all_ships_sunk()
+
+def test_repeated_and_off_board_shots_are_invalid():
+    board = _board()
+    board.receive_shot(0, 0)
+    for x, y in ((0, 0), (-1, 0), (5, 0), (0, 5)):
+        result = board.receive_shot(x, y)
+        assert result == INVALID_SHOT
+        assert result.outcome == Outcome.INVALID and not result
+    assert board.shots == [(0, 0)]
+    assert board.ships[0].hits == {(0, 0)}
+
+def test_last_ship_sunk():
+    board = _board()
+    outcomes = [board.receive_shot(x, y).outcome for x, y in ((0, 0), (1, 0), (2, 0), (4, 3), (4, 4))]
+    assert outcomes == [Outcome.HIT, Outcome.HIT, Outcome.SUNK, Outcome.HIT, Outcome.SUNK]
+    assert board.all_ships_sunk()
+
+def test_results_beyond_shared_range():
+    size = SHARED_RESULTS + 2
+    board = Board(size)
+    for index in range(SHARED_RESULTS + 1):
+        board.place_ship(Ship(f"Ship{index}", 1, [(index, 0)]))
+    result = board.receive_shot(SHARED_RESULTS, 0)
+    assert result.outcome == Outcome.SUNK and result.ship == SHARED_RESULTS
+    assert board.sunk_ship(result) is board.ships[SHARED_RESULTS]
+
+def test_delta_log_records_placements_and_shots():
+    board = _board()
+    placed = board.delta_count
+    assert placed == 5
+    board.receive_shot(3, 3)
+    board.receive_shot(4, 3)
+    board.receive_shot(4, 3)
+    assert board.deltas(placed) == [(18, 2), (19, 3)]
+    assert board.shots == [(3, 3), (4, 3)]
+
+def test_reset_clears_ships_and_shots():
+    board = _board()
+    board.receive_shot(0, 0)
+    generation = board.generation
+    board.reset()
+    assert board.ships == [] and board.shots == [] and board.sunk_count == 0
+    assert board.generation == generation + 1
+    assert board.receive_shot(0, 0) == MISSED_SHOT
@@ -0,0 +1,79 @@
+import io
+from random import Random
+import pytest
+from src.constants import BOARD_SIZE, SHIPS
+from src.game.board import Board
+from src.game.game_state import GameState
+from src.ui.console_ui import ConsoleUI
+
+class _Output(io.StringIO):
+    """Output stream counting write calls"""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+def _script(lines) -> io.StringIO:
+    return io.StringIO("".join(f"{line}\n" for line in lines))
+
+def _placements():
+    """One ship per row, all horizontal from the left edge"""
+    for row, _ in enumerate(SHIPS):
+        yield f"{row},0"
+        yield "h"
+
+def test_scripted_input_skips_blank_lines_and_prompts():
+    output = _Output()
+    ui = ConsoleUI(input=_script(["", "3,4", "  ", "9,9"]), output=output)
+    assert ui.get_shot_input() == (4, 3)
+    assert ui.get_shot_input() == (9, 9)
+    assert output.getvalue() == ""
+    with pytest.raises(EOFError):
+        ui.get_shot_input()
+
+def test_invalid_moves_are_reported_and_read_again():
+    output = _Output()
+    ui = ConsoleUI(input=_script(["x", "12,0", "1,2"]), output=output)
+    assert ui.get_shot_input() == (2, 1)
+    assert "Invalid input" in output.getvalue()
+    assert f"between 0 and {BOARD_SIZE - 1}" in output.getvalue()
+
+def test_frames_are_written_in_one_call():
+    output = _Output()
+    ConsoleUI(input=_script([]), output=output).display_boards(Board(), Board())
+    assert output.writes == 1
+    assert output.getvalue().count("\n") == BOARD_SIZE + 3
+
+def test_ansi_frames_rewrite_only_changed_cells():
+    output = _Output()
+    ui = ConsoleUI(input=_script([]), output=output, ansi=True)
+    player, computer = Board(), Board()
+    ui.display_boards(player, computer)
+    assert output.getvalue().startswith("\x1b[H\x1b[2J")
+    computer.receive_shot(3, 2)
+    output.seek(0)
+    output.truncate()
+    ui.display_boards(player, computer)
+    column = len(ui.render_boards(player, computer)[4]) - BOARD_SIZE + 3 + 1  # Cell (3, 2), 1-based
+    assert output.getvalue() == f"\x1b[5;{column}HO"
+
+def test_scripted_game_runs_to_the_end():
+    shots = [f"{y},{x}" for y in range(BOARD_SIZE) for x in range(BOARD_SIZE)]
+    output = _Output()
+    game = GameState(ui="console", rng=Random(3), script=_script(list(_placements()) + shots))
+    game.ui.output = output
+    game.run()
+    assert game.winner in ("Player", "Computer")
+    assert f"Game Over! {game.winner} wins!" in output.getvalue()
+
+def test_scripted_game_stops_when_input_ends():
+    output = _Output()
+    game = GameState(ui="console", rng=Random(3), script=_script(list(_placements()) + ["0,0"]))
+    game.ui.output = output
+    game.run()
+    assert game.winner is None
+    assert output.getvalue().rstrip().endswith("Input ended before the game did.")
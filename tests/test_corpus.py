@@ -0,0 +1,76 @@
+import pickle
+from random import Random
+import pytest
+from src.constants import SHIPS
+from src.game.board import Board, footprint
+from src.game.corpus import LayoutCorpus, write_corpus
+from src.game.fleet import FleetSampler
+from src.game.ship import Ship
+
+@pytest.fixture
+def corpus(tmp_path):
+    path = tmp_path / "layouts.bslc"
+    write_corpus(path, 500, seed=3)
+    with LayoutCorpus(path) as corpus:
+        yield corpus
+
+def test_layouts_round_trip(corpus):
+    rng = Random(3)
+    sampler = FleetSampler(10, SHIPS)
+    assert len(corpus) == 500
+    assert corpus.matches(10, SHIPS)
+    for index in range(len(corpus)):
+        assert corpus.fleet(index) == sampler.sample(rng)
+    with pytest.raises(IndexError):
+        corpus.fleet(500)
+
+def test_place_matches_placing_ship_by_ship(corpus):
+    for seed in range(100):
+        loaded = Board()
+        index = corpus.place(loaded, Random(seed), SHIPS)
+        placed = Board()
+        for (name, length), coordinates in zip(SHIPS.items(), corpus.fleet(index)):
+            assert placed.place_ship(Ship(name, length, coordinates))
+        assert loaded.ships == placed.ships
+        assert loaded.rows() == placed.rows()
+        assert loaded.deltas() == placed.deltas()
+        assert loaded.ship_mask == placed.ship_mask
+        assert [loaded.ship_at(x, y) for x, y in placed.ships[0].coordinates] == [loaded.ships[0]] * 5
+
+def test_place_rejects_used_boards_and_other_fleets(corpus):
+    board = Board()
+    corpus.place(board, Random(0), SHIPS)
+    with pytest.raises(ValueError):
+        corpus.place(board, Random(0), SHIPS)
+    with pytest.raises(ValueError):
+        corpus.place(Board(8), Random(0), SHIPS)
+
+def test_pickles_as_its_path(corpus):
+    clone = pickle.loads(pickle.dumps(corpus))
+    assert clone.path == str(corpus.path)
+    assert clone.fleet(42) == corpus.fleet(42)
+    clone.close()
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "layouts.bslc"
+    path.write_bytes(b"BSGR" + bytes(64))
+    with pytest.raises(ValueError):
+        LayoutCorpus(path)
+    write_corpus(path, 10)
+    path.write_bytes(path.read_bytes()[:-1])
+    with pytest.raises(ValueError):
+        LayoutCorpus(path)
+
+def test_load_fleet_checks_footprints():
+    ships = [Ship("Cruiser", 3, [(0, 9), (0, 10), (0, 11)])]
+    with pytest.raises(ValueError, match="another board size"):
+        Board().load_fleet(ships, [footprint(12, 9 * 12, True, 3)])
+    with pytest.raises(ValueError, match="another board size"):
+        Board().load_fleet(ships, [footprint(10, 90, True, 3)])
+    with pytest.raises(ValueError, match="length"):
+        Board().load_fleet(ships, [footprint(10, 0, False, 2)])
+    with pytest.raises(ValueError, match="overlap"):
+        Board().load_fleet(ships * 2, [footprint(10, 0, False, 3), footprint(10, 0, True, 3)])
+    board = Board()
+    board.load_fleet([Ship("Cruiser", 3, [(9, 7), (9, 8), (9, 9)])], [footprint(10, 79, True, 3)])
+    assert board.ship_at(9, 9) is board.ships[0]
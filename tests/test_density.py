@@ -0,0 +1,63 @@
+from random import Random
+from src.game.board import Board, placement_table
+from src.game.density import DensityAIPlayer
+from src.game.fleet import place_random_fleet
+
+SIZE = 7
+SHIPS = {"Battleship": 4, "Cruiser": 3, "Destroyer": 2, "Submarine": 2}
+
+def _recomputed(board: Board) -> list:
+    """Heatmap rebuilt from scratch: placements of ships afloat avoiding misses and sunk ships"""
+    blocked = {(x, y) for x, y in board.shots if board.ship_at(x, y) is None}
+    remaining = list(SHIPS.values())
+    for ship in board.ships:
+        if ship.is_sunk:
+            blocked.update(ship.coordinates)
+            remaining.remove(ship.length)
+    density = [0] * (SIZE * SIZE)
+    for length in set(remaining):
+        for _, coordinates in placement_table(SIZE, length):
+            if not blocked.intersection(coordinates):
+                for x, y in coordinates:
+                    density[y * SIZE + x] += remaining.count(length)
+    return density
+
+def _play(ai: DensityAIPlayer, board: Board, check=None) -> list:
+    shots = []
+    while not board.all_ships_sunk():
+        x, y = ai.get_shot(board)
+        assert not board.has_shot(x, y)
+        shots.append((x, y))
+        result = board.receive_shot(x, y)
+        ai.process_shot_result(x, y, result.hit, board.sunk_ship(result))
+        if check:
+            check(ai, board)
+    return shots
+
+def _fleet_board(seed: int) -> Board:
+    board = Board(SIZE)
+    place_random_fleet(board, SHIPS, Random(seed))
+    return board
+
+def test_incremental_heatmap_matches_a_full_recount():
+    def check(ai, board):
+        assert ai.density == _recomputed(board)
+
+    for seed in range(3):
+        _play(DensityAIPlayer(Random(seed), SIZE, SHIPS, opening_book=False), _fleet_board(seed), check)
+
+def test_first_shot_is_on_the_densest_cell():
+    ai = DensityAIPlayer(Random(0), SIZE, SHIPS, opening_book=False)
+    x, y = ai.get_shot(Board(SIZE))
+    assert ai.density[y * SIZE + x] == max(ai.density)
+
+def test_targets_next_to_an_open_hit():
+    ai = DensityAIPlayer(Random(0), SIZE, SHIPS, opening_book=False)
+    ai.process_shot_result(3, 3, True)
+    x, y = ai.get_shot(Board(SIZE))
+    assert abs(x - 3) + abs(y - 3) == 1
+
+def test_games_are_reproducible():
+    shots = [_play(DensityAIPlayer(Random(5), SIZE, SHIPS, opening_book=False), _fleet_board(1))
+             for _ in range(2)]
+    assert shots[0] == shots[1]
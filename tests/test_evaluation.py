@@ -0,0 +1,35 @@
+import pytest
+from src.constants import SHIPS
+from src.game.density import DensityAIPlayer
+from src.game.evaluation import (A_BETTER, B_BETTER, EQUIVALENT, INCONCLUSIVE, MIN_GAMES,
+                                 evaluate, shots_to_sink)
+from src.game.player import AIPlayer
+
+def _density(rng, size, ships):
+    return DensityAIPlayer(rng, size, ships, opening_book=False)
+
+def test_shots_to_sink_is_seeded():
+    shots = shots_to_sink(7, AIPlayer)
+    assert shots == shots_to_sink(7, AIPlayer)
+    assert sum(SHIPS.values()) <= shots <= 100
+
+def test_identical_strategies_are_equivalent_at_the_first_check():
+    result = evaluate(AIPlayer, AIPlayer, seed=1)
+    assert result.decision == EQUIVALENT and result.games == MIN_GAMES
+    assert result.mean_difference == result.ci_low == result.ci_high == 0
+
+def test_detects_the_better_strategy_either_way_round():
+    result = evaluate(AIPlayer, _density, seed=2, max_games=500)
+    assert result.decision == B_BETTER and result.mean_difference > 0
+    assert result.ci_low > 0
+    swapped = evaluate(_density, AIPlayer, seed=2, max_games=500)
+    assert swapped.decision == A_BETTER and swapped.games == result.games
+
+def test_stops_inconclusive_at_max_games():
+    result = evaluate(AIPlayer, _density, seed=3, max_games=MIN_GAMES - 1)
+    assert result.decision == INCONCLUSIVE and result.games == MIN_GAMES - 1
+    assert result.summary().startswith(f"{INCONCLUSIVE} after {MIN_GAMES - 1} paired games")
+
+def test_rejects_non_positive_delta():
+    with pytest.raises(ValueError):
+        evaluate(delta=0)
@@ -0,0 +1,58 @@
+from collections import Counter
+from math import sqrt
+from random import Random
+import pytest
+from src.game import fleet
+from src.game.fleet import FleetSampler
+from src.game.solver import EndgameSolver, Observation
+
+SHIPS = {"Cruiser": 3, "Destroyer": 2, "Submarine": 2}
+
+def test_sampler_is_uniform_over_layouts():
+    # Every layout of the fleet on a 4x4 board, drawn ~20 times each on average
+    layouts = EndgameSolver(Observation(4, 0, 0, 0, (3, 2, 2))).layout_count()
+    assert layouts == 3200
+    sampler = FleetSampler(4, SHIPS)
+    rng = Random(17)
+    samples = 20 * layouts
+    counts = Counter(tuple(map(tuple, sampler.sample(rng))) for _ in range(samples))
+    assert len(counts) == layouts
+
+    expected = samples / layouts
+    chi_square = sum((count - expected) ** 2 / expected for count in counts.values())
+    df = layouts - 1
+    # Five standard deviations above the mean of a chi-square with df degrees of freedom
+    assert chi_square < df + 5 * sqrt(2 * df)
+
+def test_samples_are_legal_fleets():
+    sampler = FleetSampler(6, SHIPS)
+    rng = Random(3)
+    for _ in range(200):
+        ships = sampler.sample(rng)
+        assert [len(coordinates) for coordinates in ships] == list(SHIPS.values())
+        cells = [cell for coordinates in ships for cell in coordinates]
+        assert len(set(cells)) == len(cells)
+        assert all(0 <= x < 6 and 0 <= y < 6 for x, y in cells)
+
+def test_bias_excludes_zero_weight_placements():
+    sampler = FleetSampler(5, SHIPS, bias=lambda coordinates: 0.0 if (0, 0) in coordinates else 1.0)
+    rng = Random(5)
+    for _ in range(500):
+        assert all((0, 0) not in coordinates for coordinates in sampler.sample(rng))
+
+def test_backtracking_fallback(monkeypatch):
+    monkeypatch.setattr(fleet, "FLEET_ATTEMPTS", 0)
+    ships = FleetSampler(3, {"A": 3, "B": 3, "C": 3}).sample(Random(1))
+    assert sorted(cell for coordinates in ships for cell in coordinates) == [
+        (x, y) for x in range(3) for y in range(3)]
+    with pytest.raises(ValueError):
+        FleetSampler(3, {"A": 3, "B": 3, "C": 3, "D": 1}).sample(Random(1))
+
+def test_untabled_boards_fall_back_to_placing_ship_by_ship():
+    ships = {f"S{i}": 5 for i in range(200)}
+    sampled = FleetSampler(60, ships).sample(Random(1))
+    cells = [cell for coordinates in sampled for cell in coordinates]
+    assert len(sampled) == 200 and len(set(cells)) == len(cells)
+    assert all(0 <= x < 60 and 0 <= y < 60 for x, y in cells)
+    with pytest.raises(ValueError):
+        FleetSampler(60, {f"S{i}": 60 for i in range(61)}).sample(Random(1))
@@ -0,0 +1,19 @@
+from random import Random
+from src.game.board import ShotResult
+from src.game.enums import GamePhase, Outcome
+from src.game.fleet import place_random_fleet
+from src.game.game_state import GameState
+
+def test_turns_report_shot_results():
+    game = GameState(ui="none", rng=Random(4))
+    place_random_fleet(game.player_board, game.ships, game.rng)
+    game._setup_computer_ships()
+    game.current_phase = GamePhase.PLAYING
+    result, message = game.player_turn(0, 0)
+    assert isinstance(result, ShotResult) and message in ("Hit!", "Miss!")
+    assert game.player_turn(0, 0)[0].outcome == Outcome.INVALID
+    while game.current_phase == GamePhase.PLAYING:
+        result, message = game.computer_turn()
+        assert isinstance(result, ShotResult) and result.outcome != Outcome.INVALID
+        assert message
+    assert game.winner == "Computer" and result.sunk and message == "Computer wins!"
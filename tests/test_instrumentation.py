@@ -0,0 +1,62 @@
+import json
+import threading
+from random import Random
+import pytest
+from src import instrumentation
+from src.game import game_state, strategies
+from src.game.board import Board
+from src.game.game_state import GameState
+
+@pytest.fixture(autouse=True)
+def clean():
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+def _play(seed: int = 1) -> None:
+    GameState(ui="none", rng=Random(seed)).run()
+
+def test_enable_wraps_and_disable_restores():
+    receive_shot, choose_shot = Board.receive_shot, strategies.choose_shot
+    instrumentation.enable()
+    assert instrumentation.enabled()
+    assert Board.receive_shot is not receive_shot
+    assert game_state.choose_shot is strategies.choose_shot is not choose_shot
+    instrumentation.disable()
+    assert not instrumentation.enabled()
+    assert Board.receive_shot is receive_shot
+    assert game_state.choose_shot is strategies.choose_shot is choose_shot
+
+def test_calls_are_counted():
+    instrumentation.enable()
+    _play()
+    report = instrumentation.report()
+    turns = report["game_state.player_turn"]["calls"]
+    assert turns > 0
+    assert report["board.receive_shot"]["calls"] >= turns
+    assert report["strategies.choose_shot"]["calls"] in (turns - 1, turns)
+    instrumentation.reset()
+    assert instrumentation.report()["board.receive_shot"]["calls"] == 0
+
+def test_blocks_are_only_counted_on_the_main_thread():
+    instrumentation.enable(allocations=True)
+    board = Board(5)
+    board.receive_shot(0, 0)
+    worker = threading.Thread(target=board.receive_shot, args=(1, 0))
+    worker.start()
+    worker.join()
+    metrics = instrumentation._METRICS["board.receive_shot"]
+    assert metrics.latency.count == 2 and metrics.measured == 1
+
+def test_metrics_files(tmp_path):
+    instrumentation.enable()
+    _play()
+    path = tmp_path / "metrics.json"
+    instrumentation.MetricsDumper(str(path)).stop()
+    assert json.loads(path.read_text()) == instrumentation.report()
+    text = instrumentation.to_prometheus()
+    calls = instrumentation.report()["board.receive_shot"]["calls"]
+    assert f'battleship_call_latency_seconds_count{{function="board.receive_shot"}} {calls}' in text
+    assert f'battleship_call_latency_seconds_bucket{{function="board.receive_shot",le="+Inf"}} {calls}' in text
+    with pytest.raises(ValueError):
+        instrumentation.MetricsDumper(str(path), format="xml")
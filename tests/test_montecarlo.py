@@ -0,0 +1,83 @@
+from multiprocessing.shared_memory import SharedMemory
+from random import Random
+import pytest
+from src.game.board import Board
+from src.game.fleet import place_random_fleet
+from src.game.montecarlo import HIT, MISS, ROUNDS, SUNK, MonteCarloAIPlayer, sample_counts
+from src.game.ship import Ship
+from src.game.solver import EndgameSolver
+
+SIZE = 5
+SHIPS = {"Cruiser": 3, "Destroyer": 2, "Submarine": 2}
+
+def _played_board(seed: int, shots: int) -> Board:
+    board = Board(SIZE)
+    rng = Random(seed)
+    place_random_fleet(board, SHIPS, rng)
+    cells = [(x, y) for y in range(SIZE) for x in range(SIZE)]
+    rng.shuffle(cells)
+    for x, y in cells[:shots]:
+        board.receive_shot(x, y)
+    return board
+
+def _observation(board: Board) -> bytes:
+    """The board as the Monte Carlo AI sees it, one state byte per cell"""
+    cells = bytearray(SIZE * SIZE)
+    for x, y in board.shots:
+        ship = board.ship_at(x, y)
+        cells[y * SIZE + x] = MISS if ship is None else SUNK if ship.is_sunk else HIT
+    return bytes(cells)
+
+@pytest.mark.parametrize("seed,shots", [(0, 0), (2, 8), (3, 12)])
+def test_sample_counts_converge_to_posteriors(seed, shots):
+    board = _played_board(seed, shots)
+    lengths = tuple(ship.length for ship in board.ships if not ship.is_sunk)
+    total, counts = sample_counts(_observation(board), SIZE, lengths, 20000, seed)
+    shot = {y * SIZE + x for x, y in board.shots}
+    exact = EndgameSolver.from_board(board, SHIPS).cell_probabilities()
+    for cell in range(SIZE * SIZE):
+        if cell not in shot:
+            assert counts[cell] / total == pytest.approx(exact[cell], abs=0.03)
+
+def _clear(ai: MonteCarloAIPlayer, board: Board) -> list:
+    shots = []
+    while not board.all_ships_sunk():
+        x, y = ai.get_shot(board)
+        assert not board.has_shot(x, y)
+        shots.append((x, y))
+        result = board.receive_shot(x, y)
+        ai.process_shot_result(x, y, result.hit, board.sunk_ship(result))
+    return shots
+
+def test_clears_a_board_reproducibly():
+    boards = [_played_board(4, 0) for _ in range(2)]
+    with MonteCarloAIPlayer(Random(9), SIZE, SHIPS, samples=256, workers=1) as first, \
+            MonteCarloAIPlayer(Random(9), SIZE, SHIPS, samples=256, workers=1) as second:
+        assert _clear(first, boards[0]) == _clear(second, boards[1])
+
+def test_pool_workers_pick_the_same_moves():
+    board = _played_board(5, 6)
+    with MonteCarloAIPlayer(Random(3), SIZE, SHIPS, samples=256, workers=1) as local, \
+            MonteCarloAIPlayer(Random(3), SIZE, SHIPS, samples=256, workers=2) as pooled:
+        for ai in (local, pooled):
+            replay = Board(SIZE)
+            for ship in board.ships:
+                replay.place_ship(Ship(ship.name, ship.length, ship.coordinates))
+            for x, y in board.shots:
+                result = replay.receive_shot(x, y)
+                ai.process_shot_result(x, y, result.hit, replay.sunk_ship(result))
+        assert list(local.iter_shots(board)) == list(pooled.iter_shots(board))
+
+def test_iter_shots_yields_one_answer_per_round():
+    with MonteCarloAIPlayer(Random(1), SIZE, SHIPS, samples=64, workers=1) as ai:
+        moves = list(ai.iter_shots(Board(SIZE)))
+    assert len(moves) == ROUNDS
+    assert all(0 <= x < SIZE and 0 <= y < SIZE for x, y in moves)
+
+def test_close_frees_the_observation_block():
+    ai = MonteCarloAIPlayer(Random(1), SIZE, SHIPS, workers=1)
+    name = ai._memory.name
+    ai.close()
+    ai.close()
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name)
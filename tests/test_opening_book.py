@@ -0,0 +1,82 @@
+from random import Random
+import pytest
+from src.game.board import Board
+from src.game.density import DensityAIPlayer
+from src.game.fleet import place_random_fleet
+from src.game.opening_book import OpeningBook, build_book, write_book
+
+SIZE = 6
+SHIPS = {"Cruiser": 3, "Destroyer": 2, "Submarine": 2}
+DEPTH = 5
+
+@pytest.fixture(scope="module")
+def book(tmp_path_factory):
+    path = tmp_path_factory.mktemp("book") / "book.bsob"
+    write_book(path, build_book(SIZE, SHIPS, DEPTH), SIZE, SHIPS)
+    return OpeningBook(path)
+
+class _Ties:
+    """Random stand-in recording the cells the AI chose between"""
+
+    def __init__(self):
+        self.choices = None
+
+    def choice(self, sequence):
+        self.choices = list(sequence)
+        return sequence[-1]
+
+def _prefixes(book):
+    """(shots, results, cells played) for every prefix the book has a move for"""
+    frontier = [(0, ())]
+    for shots in range(book.depth):
+        next_frontier = []
+        for results, cells in frontier:
+            cell = book.lookup(shots, results)
+            if cell is not None:
+                yield shots, results, cells
+                for hit in (0, 1):
+                    next_frontier.append((results | hit << shots, cells + (cell,)))
+        frontier = next_frontier
+
+def test_round_trip(book):
+    assert book.matches(SIZE, SHIPS) and not book.matches(SIZE + 1, SHIPS)
+    assert book.lookup(DEPTH, 0) is None
+    entries = build_book(SIZE, SHIPS, DEPTH)
+    assert [book.lookup(k, bits) for k in range(DEPTH) for bits in range(1 << k)] == \
+           [None if cell == 0xFF else cell for cell in entries[:(1 << DEPTH) - 1]]
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "not_a_book"
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        OpeningBook(path)
+
+def test_book_moves_are_among_the_live_ai_choices(book):
+    for shots, results, cells in _prefixes(book):
+        ties = _Ties()
+        ai = DensityAIPlayer(ties, SIZE, SHIPS, opening_book=False)
+        for shot, cell in enumerate(cells):
+            ai.process_shot_result(cell % SIZE, cell // SIZE, bool(results >> shot & 1))
+        x, y = ai.get_shot(None)
+        choices = ties.choices or [y * SIZE + x]
+        assert book.lookup(shots, results) == min(choices)
+
+def test_ai_follows_the_book_until_a_ship_sinks(book):
+    board = Board(SIZE)
+    place_random_fleet(board, SHIPS, Random(3))
+    ai = DensityAIPlayer(Random(0), SIZE, SHIPS, opening_book=False)
+    ai._book = book
+    shots = results = 0
+    while ai._book is not None:
+        x, y = ai.get_shot(board)
+        expected = book.lookup(shots, results)
+        assert expected is None or y * SIZE + x == expected
+        result = board.receive_shot(x, y)
+        sunk = board.sunk_ship(result)
+        ai.process_shot_result(x, y, result.hit, sunk)
+        if ai._book is not None:
+            results |= result.hit << shots
+            shots += 1
+        else:
+            assert sunk is not None or expected is None
+    assert shots <= DEPTH
@@ -0,0 +1,27 @@
+from collections import Counter
+from random import Random
+from src.game.board import Board
+from src.game.fleet import place_random_fleet
+from src.game.player import AIPlayer
+
+def test_hunting_shots_are_uniform_over_open_cells():
+    ai = AIPlayer(Random(1), 4)
+    ai.mark_shot(0, 0)
+    counts = Counter(ai.get_shot(Board(4)) for _ in range(15000))
+    assert (0, 0) not in counts and len(counts) == 15
+    assert all(850 <= count <= 1150 for count in counts.values())
+
+def test_clears_a_large_board_without_repeating_shots():
+    size = 40
+    board = Board(size)
+    rng = Random(2)
+    place_random_fleet(board, {f"Ship{i}": 2 + i % 4 for i in range(30)}, rng)
+    ai = AIPlayer(rng, size)
+    shots = set()
+    while not board.all_ships_sunk():
+        x, y = ai.get_shot(board)
+        assert (x, y) not in shots
+        shots.add((x, y))
+        result = board.receive_shot(x, y)
+        ai.process_shot_result(x, y, result.hit, board.sunk_ship(result))
+    assert ai.shot_order() == board.shots
@@ -0,0 +1,49 @@
+from random import Random
+import pytest
+from src.game.enums import GamePhase
+from src.game.game_state import GameState
+from src.game.pool import MatchPool
+
+def _played(game: GameState) -> GameState:
+    game.run()
+    assert game.current_phase == GamePhase.GAME_OVER
+    return game
+
+def test_reused_games_are_reset_in_place():
+    pool = MatchPool()
+    game = _played(pool.acquire(Random(1)))
+    boards, ai = (game.player_board, game.computer_board), game.ai_player
+    pool.release(game)
+    rng = Random(2)
+    again = pool.acquire(rng, move_budget=0.5)
+    assert again is game and (pool.created, pool.reused) == (1, 1)
+    assert (again.player_board, again.computer_board) == boards and again.ai_player is ai
+    assert again.current_phase == GamePhase.SETUP and again.winner is None
+    assert again.rng is rng and ai.rng is rng and again.move_budget == 0.5
+    assert not again.player_board.ships and not again.computer_board.shots
+    assert not ai.shot_order()
+
+def test_reused_games_play_like_new_ones():
+    pool = MatchPool()
+    pool.release(_played(pool.acquire(Random(1))))
+    reused = _played(pool.acquire(Random(7)))
+    fresh = _played(GameState(ui="none", rng=Random(7)))
+    assert reused.winner == fresh.winner
+    assert reused.player_board.shots == fresh.player_board.shots
+    assert reused.computer_board.shots == fresh.computer_board.shots
+
+def test_strategy_change_rebuilds_the_ai():
+    pool = MatchPool()
+    game = pool.acquire(Random(1))
+    ai = game.ai_player
+    pool.release(game)
+    game = pool.acquire(Random(1), strategy="density")
+    assert game.strategy == "density" and game.ai_player is not ai
+
+def test_release_checks_games_and_caps_idle():
+    pool = MatchPool(max_idle=1)
+    with pytest.raises(ValueError):
+        pool.release(GameState(ui="none", board_size=8))
+    pool.release(GameState(ui="none"))
+    pool.release(GameState(ui="none"))
+    assert len(pool) == 1
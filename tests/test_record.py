@@ -0,0 +1,62 @@
+import os
+from random import Random
+from src.game.fleet import FleetSampler
+from src.game.record import INDEX_FOOTER, GameRecord, GameRecordReader, GameRecordWriter
+from src.game.simulation import play_boards
+from src.constants import SHIPS
+
+def _record(seed: int, size: int = 10, ships=SHIPS) -> GameRecord:
+    rng = Random(seed)
+    sampler = FleetSampler(size, ships)
+    cells = [(x, y) for y in range(size) for x in range(size)]
+    shots_a, shots_b = rng.sample(cells, 40), rng.sample(cells, 39)
+    return GameRecord(seed, rng.choice(["A", "B", None]), sampler.sample(rng), sampler.sample(rng),
+                      shots_a, shots_b)
+
+def test_records_round_trip(tmp_path):
+    path = tmp_path / "games.bsgr"
+    records = [_record(seed) for seed in range(50)]
+    with GameRecordWriter(path) as writer:
+        for record in records:
+            writer.write(record)
+    with GameRecordReader(path) as reader:
+        assert len(reader) == len(records)
+        assert list(reader) == records
+        assert reader[-1] == records[-1]
+
+def test_wide_cells_round_trip(tmp_path):
+    # 40 x 40 boards need two bytes per cell
+    ships = {"Carrier": 5, "Destroyer": 2}
+    path = tmp_path / "games.bsgr"
+    records = [_record(seed, 40, ships) for seed in range(5)]
+    with GameRecordWriter(path, 40, ships) as writer:
+        for record in records:
+            writer.write(record)
+    with GameRecordReader(path) as reader:
+        assert reader.size == 40
+        assert list(reader) == records
+
+def test_unindexed_file_is_rescanned(tmp_path):
+    path = tmp_path / "games.bsgr"
+    records = [_record(seed) for seed in range(10)]
+    with GameRecordWriter(path) as writer:
+        for record in records:
+            writer.write(record)
+    # Drop the index and half of the last record, as if the writer died mid-write
+    index_bytes = 8 * len(records) + INDEX_FOOTER.size
+    with open(path, "r+b") as file:
+        file.truncate(os.path.getsize(path) - index_bytes - 10)
+    with GameRecordReader(path) as reader:
+        assert list(reader) == records[:-1]
+
+def test_boards_replay_the_game(tmp_path):
+    path = tmp_path / "games.bsgr"
+    result, board_a, board_b = play_boards(7)
+    with GameRecordWriter(path) as writer:
+        writer.write_game(result, board_a, board_b)
+    with GameRecordReader(path) as reader:
+        replayed_a, replayed_b = reader.boards_at(0)
+        assert replayed_a.rows() == board_a.rows() and replayed_b.rows() == board_b.rows()
+        assert replayed_a.shots == board_a.shots and replayed_b.shots == board_b.shots
+        early_a, early_b = reader.boards_at(0, turn=3)
+        assert early_b.shots == board_b.shots[:2] and early_a.shots == board_a.shots[:1]
@@ -0,0 +1,137 @@
+import asyncio
+import json
+import pytest
+from src.server.server import GameServer, ProtocolError
+
+async def _session(lines, **kwargs):
+    """Send raw request lines to a fresh server and collect a reply per line"""
+    server = GameServer(port=0, **kwargs)
+    await server.start()
+    try:
+        reader, writer = await asyncio.open_connection(server.host, server.port)
+        replies = []
+        for line in lines:
+            writer.write(line if isinstance(line, bytes) else json.dumps(line).encode() + b"\n")
+            await writer.drain()
+            reply = await reader.readline()
+            replies.append(json.loads(reply) if reply else None)
+        writer.close()
+        await writer.wait_closed()
+        return replies
+    finally:
+        await server.close()
+
+def _errors(*lines, **kwargs):
+    replies = asyncio.run(_session(lines, **kwargs))
+    assert all(reply["ok"] is False for reply in replies[1:] if reply is not None)
+    return [reply and reply.get("error") for reply in replies]
+
+def test_malformed_requests():
+    errors = _errors({"op": "stats"}, b"not json\n", b"[1, 2]\n", {"op": "fly"}, {"nothing": 1})
+    assert errors[2] == "Request must be a JSON object"
+    assert errors[3] == "Unknown op 'fly'"
+    assert errors[4] == "Unknown op None"
+    assert errors[1]
+
+def test_unknown_matches_and_options():
+    errors = _errors({"op": "stats"}, {"op": "shot", "match": 1, "x": 0, "y": 0}, {"op": "step", "match": 7},
+                     {"op": "new", "mode": "robot"}, {"op": "new", "strategy": "cheater"})
+    assert errors[1] == "Unknown match 1"
+    assert errors[2] == "Unknown match 7"
+    assert errors[3] == "Unknown mode 'robot'"
+    assert "cheater" in errors[4]
+
+def test_bad_shots_and_turns():
+    replies = asyncio.run(_session([
+        {"op": "new", "seed": 1},
+        {"op": "shot", "match": 1, "x": 10, "y": 0},
+        {"op": "shot", "match": 1, "x": 0, "y": 0},
+        {"op": "shot", "match": 1, "x": 0, "y": 0},
+        {"op": "shot", "match": 1, "x": "a", "y": 0},
+        {"op": "shot", "match": 1},
+        {"op": "step", "match": 1},
+        {"op": "new", "mode": "ai", "seed": 2},
+        {"op": "shot", "match": 2, "x": 0, "y": 0},
+    ]))
+    assert replies[0]["ok"] and replies[2]["ok"] and replies[7]["ok"]
+    assert replies[1]["error"] == "Shot out of bounds"
+    assert replies[3]["error"] == "You already shot there!"
+    assert not replies[4]["ok"] and not replies[5]["ok"]
+    assert replies[6]["error"] == "Human matches advance with 'shot'"
+    assert replies[8]["error"] == "AI-vs-AI matches advance with 'step'"
+
+def test_invalid_fleets():
+    replies = asyncio.run(_session([
+        {"op": "new", "fleet": [[[0, 0], [1, 0]]]},
+        {"op": "new", "fleet": [[[0, y], [1, y], [2, y], [3, y], [4, y]][:length]
+                                for y, length in enumerate((5, 4, 3, 3, 3))]},
+        {"op": "new", "fleet": [[[x, 0] for x in range(length)] for length in (5, 4, 3, 3, 2)]},
+        {"op": "new", "fleet": [[[x, y] for x in range(6, 6 + length)] for y, length in enumerate((5, 4, 3, 3, 2))]},
+        {"op": "stats"},
+    ]))
+    assert replies[0]["error"] == "Fleet must have 5 ships"
+    assert replies[1]["error"] == "Destroyer must be a list of 2 [x, y] cells"
+    assert replies[2]["error"] == "Invalid placement for Battleship"
+    assert replies[3]["error"] == "Invalid placement for Carrier"
+    assert replies[4]["matches"] == 0
+
+def test_malformed_fleets():
+    straight = [[[x, y] for x in range(length)] for y, length in enumerate((5, 4, 3, 3, 2))]
+    bent = straight[:4] + [[[0, 4], [1, 5]]]
+    scattered = straight[:4] + [[[0, 4], [2, 4]]]
+    vertical = straight[:4] + [[[9, 0], [9, 1]]]
+    errors = _errors({"op": "stats"}, {"op": "new", "fleet": bent}, {"op": "new", "fleet": scattered},
+                     {"op": "new", "fleet": straight[:4] + [7]}, {"op": "new", "fleet": straight[:4] + [[7, 8]]},
+                     {"op": "new", "fleet": straight[:4] + [[[0, 4], [1.0, 4]]]}, {"op": "new", "fleet": 5},
+                     {"op": "new", "fleet": {"Carrier": 1}})
+    assert errors[1] == errors[2] == "Destroyer must be a straight line of adjacent cells"
+    assert errors[3] == errors[4] == errors[5] == "Destroyer must be a list of 2 [x, y] cells"
+    assert errors[6] == errors[7] == "Fleet must have 5 ships"
+    replies = asyncio.run(_session([{"op": "new", "fleet": vertical}]))
+    assert replies[0]["ok"] and replies[0]["fleet"][4] == [[9, 0], [9, 1]]
+
+def test_finished_and_closed_matches():
+    moves = [{"op": "step", "match": 1} for _ in range(200)]
+    replies = asyncio.run(_session([{"op": "new", "mode": "ai", "seed": 3}, *moves,
+                                    {"op": "close", "match": 1}, {"op": "step", "match": 1}]))
+    over = [reply for reply in replies[1:-2] if not reply["ok"]]
+    assert over and all(reply["error"] == "Game is over" for reply in over)
+    assert replies[-2] == {"ok": True}
+    assert replies[-1]["error"] == "Unknown match 1"
+
+def test_overlong_line_is_answered():
+    line = b'{"op": "stats", "pad": "' + b"x" * (1 << 17) + b'"}\n'
+    replies = asyncio.run(_session([line, b'{"op": "stats"}\n']))
+    assert replies[0] == {"ok": False, "error": "Request line too long"}
+    assert replies[1] is None  # The server closes the connection afterwards
+
+def _parked_server(park_dir) -> GameServer:
+    server = GameServer(port=0, park_dir=str(park_dir), idle_timeout=0)
+    owned = set()
+    for mode in ("human", "ai"):
+        server._new_match({"op": "new", "mode": mode, "seed": 1}, owned)
+    return server
+
+def test_parked_matches_resume(tmp_path):
+    server = _parked_server(tmp_path)
+    asyncio.run(server.handle_request({"op": "shot", "match": 1, "x": 0, "y": 0}, {1}))
+    before = server.matches[1].game.snapshot()
+    assert server.park_idle() == 2
+    assert not server.matches and server.parked == {1, 2}
+    assert asyncio.run(server.handle_request({"op": "step", "match": 2}, {2}))["ok"]
+    assert server._unpark(1).game.snapshot() == before
+    assert not server.parked and not list(tmp_path.iterdir())
+
+def test_failed_park_keeps_the_match(tmp_path):
+    server = _parked_server(tmp_path / "missing")
+    game = server.matches[1].game
+    assert server.park_idle() == 0
+    with pytest.raises(OSError):
+        server.park(1)
+    assert server.matches[1].game is game and not server.parked
+
+def test_unknown_parked_match_is_a_protocol_error(tmp_path):
+    server = _parked_server(tmp_path)
+    del server.matches[1]  # Neither in memory nor on disk
+    with pytest.raises(ProtocolError, match="Unknown match 1"):
+        asyncio.run(server.handle_request({"op": "shot", "match": 1, "x": 0, "y": 0}, {1}))
@@ -0,0 +1,80 @@
+from random import Random
+import pytest
+from src.game.enums import GamePhase
+from src.game.fleet import place_random_fleet
+from src.game.game_state import GameState
+from src.game.player import AIPlayer
+from src.game.snapshot import dump_ai, load_ai
+
+def _game(strategy: str = "random_target", moves: int = 30, **kwargs) -> GameState:
+    game = GameState(ui="none", rng=Random(1), strategy=strategy, **kwargs)
+    place_random_fleet(game.player_board, game.ships, game.rng)
+    game._setup_computer_ships()
+    game.current_phase = GamePhase.PLAYING
+    cells = game.computer_board.get_valid_moves()
+    game.rng.shuffle(cells)
+    for x, y in cells[:moves]:
+        game.player_turn(x, y)
+        if game.current_phase == GamePhase.PLAYING:
+            game.computer_turn()
+    return game
+
+def _assert_same(restored: GameState, game: GameState) -> None:
+    assert restored.current_phase == game.current_phase and restored.winner == game.winner
+    assert restored.strategy == game.strategy and restored.move_budget == game.move_budget
+    assert restored.ships == game.ships
+    for board, original in ((restored.player_board, game.player_board),
+                            (restored.computer_board, game.computer_board)):
+        assert board.ships == original.ships
+        assert board.shots == original.shots
+        assert board.rows() == original.rows()
+        assert board.sunk_count == original.sunk_count
+
+def test_game_round_trip():
+    game = _game()
+    data = game.snapshot()
+    restored = GameState(ui="none", rng=Random(2))
+    restored.restore(data)
+    _assert_same(restored, game)
+    assert dump_ai(restored.ai_player, 10) == dump_ai(game.ai_player, 10)
+    assert restored.snapshot() == data
+
+@pytest.mark.parametrize("moves", [0, 200])
+def test_setup_and_finished_games_round_trip(moves):
+    game = _game(moves=moves)
+    restored = GameState(ui="none", rng=Random(2))
+    restored.restore(game.snapshot())
+    _assert_same(restored, game)
+    if moves:
+        assert restored.current_phase == GamePhase.GAME_OVER and restored.winner is not None
+
+def test_other_strategies_are_replayed():
+    game = _game("density", move_budget=0.5)
+    restored = GameState(ui="none", rng=Random(2))
+    restored.restore(game.snapshot())
+    _assert_same(restored, game)
+    assert type(restored.ai_player) is type(game.ai_player)
+    # The replayed AI has seen every shot, so it never fires at the same cell twice
+    for _ in range(20):
+        if restored.current_phase != GamePhase.PLAYING:
+            break
+        x, y = restored.choose_computer_shot()
+        assert not restored.player_board.has_shot(x, y)
+        restored.apply_computer_shot(x, y)
+
+def test_ai_round_trip():
+    ai = _game().ai_player
+    clone = AIPlayer(Random(3))
+    load_ai(dump_ai(ai, 10), clone, 10)
+    assert clone.shot_order() == ai.shot_order()
+    assert (clone.hits, clone.hunt_mode, clone.last_hit, clone.first_hit) == (
+        ai.hits, ai.hunt_mode, ai.last_hit, ai.first_hit)
+
+def test_rejects_other_data():
+    game = GameState(ui="none")
+    with pytest.raises(ValueError):
+        game.restore(b"BSGR" + bytes(32))
+    data = bytearray(_game().snapshot())
+    data[4] = 99
+    with pytest.raises(ValueError):
+        game.restore(bytes(data))
@@ -0,0 +1,70 @@
+from itertools import product
+from random import Random
+import pytest
+from src.game.board import Board
+from src.game.fleet import place_random_fleet
+from src.game.solver import EndgameSolver
+
+SIZE = 5
+SHIPS = {"Cruiser": 3, "Destroyer": 2, "Submarine": 2}
+
+def _placements(length: int):
+    """Every placement of a ship on the board as a set of cells, built independently of the solver"""
+    for y, x in product(range(SIZE), repeat=2):
+        if x + length <= SIZE:
+            yield frozenset(range(y * SIZE + x, y * SIZE + x + length))
+        if y + length <= SIZE:
+            yield frozenset(range(y * SIZE + x, (y + length) * SIZE + x, SIZE))
+
+def _brute_force(board: Board):
+    """Consistent layouts and per-cell occupancy counts of the ships not sunk yet"""
+    shots = {y * SIZE + x for x, y in board.shots}
+    sunk = [ship for ship in board.ships if ship.is_sunk]
+    sunk_cells = {y * SIZE + x for ship in sunk for x, y in ship.coordinates}
+    hits = {cell for cell in shots if board.cell(cell % SIZE, cell // SIZE) == "X"} - sunk_cells
+    misses = shots - hits - sunk_cells
+    lengths = list(SHIPS.values())
+    for ship in sunk:
+        lengths.remove(ship.length)
+
+    layouts, counts = 0, [0] * (SIZE * SIZE)
+    for fleet in product(*(list(_placements(length)) for length in lengths)):
+        cells = set().union(*fleet)
+        if (len(cells) != sum(lengths) or cells & (misses | sunk_cells) or not hits <= cells
+                or any(ship <= shots for ship in fleet)):
+            continue
+        layouts += 1
+        for cell in cells:
+            counts[cell] += 1
+    return layouts, counts
+
+def _played_board(seed: int, shots: int) -> Board:
+    board = Board(SIZE)
+    rng = Random(seed)
+    place_random_fleet(board, SHIPS, rng)
+    cells = [(x, y) for y in range(SIZE) for x in range(SIZE)]
+    rng.shuffle(cells)
+    for x, y in cells[:shots]:
+        board.receive_shot(x, y)
+    return board
+
+@pytest.mark.parametrize("seed,shots", [(0, 0), (1, 4), (2, 8), (3, 12), (4, 16)])
+def test_solver_matches_brute_force(seed, shots):
+    board = _played_board(seed, shots)
+    layouts, counts = _brute_force(board)
+    solver = EndgameSolver.from_board(board, SHIPS)
+    assert solver.layout_count() == layouts
+    assert solver.cell_probabilities() == pytest.approx([count / layouts for count in counts])
+    assert sum(solver.layouts().values()) == layouts
+
+def test_solved_board_needs_no_more_shots():
+    board = _played_board(5, SIZE * SIZE)
+    solver = EndgameSolver.from_board(board, SHIPS)
+    assert solver.layout_count() == 1
+    assert solver.expected_shots_remaining() == 0
+
+def test_expected_shots_is_bounded_by_open_cells():
+    board = _played_board(6, 14)
+    solver = EndgameSolver.from_board(board, SHIPS)
+    hidden = sum(len(ship.coordinates) - len(ship.hits) for ship in board.ships)
+    assert hidden <= solver.expected_shots_remaining() <= SIZE * SIZE - 14
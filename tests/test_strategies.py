@@ -0,0 +1,70 @@
+from random import Random
+from time import sleep
+import pytest
+from src.game import strategies
+from src.game.board import Board
+from src.game.player import AIPlayer
+from src.game.strategies import (LatencyHistogram, choose_shot, create_strategy, get_strategy,
+                                 latency_histogram, register_strategy)
+
+@pytest.fixture(autouse=True)
+def registry(monkeypatch):
+    """Keep strategies and latencies registered by a test out of the module's tables"""
+    monkeypatch.setattr(strategies, "_STRATEGIES", dict(strategies._STRATEGIES))
+    monkeypatch.setattr(strategies, "_LATENCY", {})
+
+class _Anytime:
+    """Yields (0, 0), (1, 0), ... with a pause before each move after the first"""
+
+    def __init__(self, rng, size, ships):
+        self.closed = False
+
+    def get_shot(self, board):
+        return 0, 0
+
+    def process_shot_result(self, x, y, hit, sunk=None):
+        pass
+
+    def iter_shots(self, board):
+        try:
+            for x in range(board.size):
+                if x:
+                    sleep(0.02)
+                yield x, 0
+        finally:
+            self.closed = True
+
+def test_lookup_and_registration():
+    assert get_strategy("random_target").factory is AIPlayer
+    assert isinstance(create_strategy("random_target", Random(1)), AIPlayer)
+    with pytest.raises(ValueError, match="Unknown strategy"):
+        get_strategy("missing")
+    with pytest.raises(ValueError, match="already registered"):
+        register_strategy("random_target", AIPlayer)
+    with pytest.raises(ValueError, match="anytime"):
+        register_strategy("budgeted", AIPlayer, budget=0.1)
+
+def test_budget_cuts_anytime_strategies_off():
+    register_strategy("anytime", _Anytime, budget=0.03, anytime=True)
+    ai = create_strategy("anytime")
+    move = choose_shot("anytime", ai, Board(10))
+    assert move in ((1, 0), (2, 0)) and ai.closed
+    assert choose_shot("anytime", ai, Board(10), budget=10) == (9, 0)
+    assert latency_histogram("anytime").count == 2
+
+def test_strategies_without_iter_shots_finish_their_move():
+    ai = AIPlayer(Random(1), 10)
+    x, y = choose_shot("random_target", ai, Board(10), budget=0)
+    assert 0 <= x < 10 and 0 <= y < 10
+    assert latency_histogram("random_target").count == 1
+
+def test_latency_histogram():
+    histogram = LatencyHistogram()
+    for seconds in [1e-6] * 98 + [0.01, 2.0]:
+        histogram.record(seconds)
+    summary = histogram.summary()
+    assert summary["moves"] == 100 and summary["max_ms"] == 2000.0
+    assert summary["p50_ms"] == pytest.approx(1e-3)
+    assert 10 <= summary["p99_ms"] <= 20
+    histogram.reset()
+    assert histogram.summary()["moves"] == 0